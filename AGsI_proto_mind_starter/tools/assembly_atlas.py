@@ -3,19 +3,39 @@
 Input format: rows=timestamps, cols=neuron IDs (N columns), values=spike counts in window.
 Outputs: top-k assemblies per concept and drift/overlap CSVs.
 """
-import argparse, pathlib, csv, numpy as np
+import argparse, pathlib, numpy as np
 
 def load_csv(p):
-    with open(p) as f:
-        return np.array([[float(x) for x in row] for row in csv.reader(f)])
+    # C parser; float32 halves the footprint of large N x T logs
+    return np.loadtxt(p, delimiter=",", dtype=np.float32, ndmin=2)
 
 def topk_indices(vec, k):
-    return np.argsort(-vec)[:k]
+    if k >= len(vec):
+        return np.argsort(-vec)
+    # O(N) partition, then sort only the k survivors
+    part = np.argpartition(vec, -k)[-k:]
+    return part[np.argsort(-vec[part])]
 
-def jaccard(a, b):
-    inter = len(set(a) & set(b))
-    union = len(set(a) | set(b))
-    return inter / max(union, 1)
+def _membership(assemblies, n):
+    """Stack neuron-ID arrays into an M x n boolean membership matrix."""
+    M = np.zeros((len(assemblies), n), dtype=bool)
+    for i, a in enumerate(assemblies):
+        M[i, np.asarray(a, dtype=np.intp)] = True
+    return M
+
+def jaccard(a, b, n=None):
+    if n is None:
+        n = int(max(np.max(a, initial=-1), np.max(b, initial=-1))) + 1
+    A, B = _membership([a, b], n)
+    return np.logical_and(A, B).sum() / max(np.logical_or(A, B).sum(), 1)
+
+def pairwise_jaccard(assemblies, n):
+    """M x M Jaccard matrix for M assemblies over n neurons in one GEMM."""
+    M = _membership(assemblies, n).astype(np.float32)
+    inter = M @ M.T
+    sizes = M.sum(axis=1)
+    union = sizes[:, None] + sizes[None, :] - inter
+    return inter / np.maximum(union, 1.0)
 
 if __name__ == "__main__":
     ap = argparse.ArgumentParser()
@@ -2,13 +2,27 @@
 """Lightweight metrics logger template.
 You can pipe Glia's per-step summaries into this and compute curves offline.
 """
-import sys, json
+import sys
 
-for line in sys.stdin:
+try:
+    import orjson as _json  # parses bytes directly, much faster on busy pipes
+except ImportError:
+    import json as _json
+loads = _json.loads
+
+FLUSH_EVERY = 256  # lines buffered before each stdout write
+
+out = []
+for line in sys.stdin.buffer:
     try:
-        evt = json.loads(line)
+        evt = loads(line)
     except Exception:
         continue
     # Expected fields: t, layer, event, value(s)
     # Extend as needed, e.g., accumulate ignition histograms, drift meters, etc.
-    print(evt)
+    out.append(f"{evt}\n")
+    if len(out) >= FLUSH_EVERY:
+        sys.stdout.write("".join(out)); sys.stdout.flush()
+        out.clear()
+if out:
+    sys.stdout.write("".join(out)); sys.stdout.flush()
@@ -16,6 +16,10 @@ The inhibitory pool provides winner-take-all dynamics for robust classification.
 import glia
 import numpy as np
 import argparse
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 
 
 def create_3class_network():
@@ -75,68 +79,139 @@ def create_3class_network():
     return net
 
 
-def create_3class_dataset(n_episodes=60, noise_level=0.1):
+def create_3class_dataset(n_episodes=60, noise_level=0.1, seed=None):
     """
     Create dataset for 3-class classification
     
     Args:
         n_episodes: Number of training episodes
         noise_level: Probability of noise in non-target inputs (0.0 to 1.0)
+        seed: Optional RNG seed
     """
-    episodes = []
+    # Draw all randomness up front; the loop below only indexes into it
+    rng = np.random.default_rng(seed)
+    class_ids = np.arange(n_episodes) % 3
+    noise_mask = rng.random((n_episodes, 3)) < noise_level
+    values = np.where(noise_mask, rng.uniform(20.0, 60.0, (n_episodes, 3)), 0.0)
+    # Target input (strong)
+    values[np.arange(n_episodes), class_ids] = 100.0
     
-    for i in range(n_episodes):
-        ep = glia.EpisodeData()
-        seq = glia.InputSequence()
-        
-        # Determine class
-        class_id = i % 3
-        
-        # Create one-hot input with noise
-        inputs = {}
-        for j in range(3):
-            if j == class_id:
-                # Target input (strong)
-                inputs[f'S{j}'] = 100.0
-            else:
-                # Non-target with potential noise
-                if np.random.rand() < noise_level:
-                    inputs[f'S{j}'] = np.random.uniform(20.0, 60.0)
-                else:
-                    inputs[f'S{j}'] = 0.0
-        
-        seq.add_timestep(inputs)
-        ep.seq = seq
-        ep.target_id = f'N{class_id + 1}'  # N1, N2, or N3
-        
-        episodes.append(ep)
+    targets = [f'N{class_id + 1}' for class_id in class_ids.tolist()]  # N1, N2, or N3
+    return glia.Dataset.from_arrays(values.astype(np.float32), targets, ['S0', 'S1', 'S2'])
+
+
+def _fields(obj):
+    """Public data attributes of a bound config struct, as a plain dict"""
+    return {k: getattr(obj, k) for k in dir(obj)
+            if not k.startswith('_') and not callable(getattr(obj, k))}
+
+
+def _config_to_dict(config):
+    """Every TrainingConfig field (nested grad/detector included) in picklable form"""
+    fields = _fields(config)
+    fields['grad'] = _fields(config.grad)
+    fields['detector'] = _fields(config.detector)
+    return fields
+
+
+def _config_from_dict(fields):
+    config = glia.TrainingConfig()
+    for key, value in fields.items():
+        if key in ('grad', 'detector'):
+            nested = getattr(config, key)
+            for k, v in value.items():
+                setattr(nested, k, v)
+        else:
+            setattr(config, key, value)
+    return config
+
+
+def _seq_to_events(seq):
+    """All (tick, inputs) pairs of a sequence plus its loop flag"""
+    seq.reset()
+    events = []
+    for t in range(seq.get_max_tick() + 1):
+        inputs = seq.get_current_inputs()
+        if inputs:
+            events.append((t, inputs))
+        seq.advance()
+    seq.reset()
+    return events, seq.is_looping()
+
+
+def _seq_from_events(events, loop):
+    seq = glia.InputSequence()
+    for t, inputs in events:
+        for nid, value in inputs.items():
+            seq.add_event(t, nid, value)
+    seq.set_loop(loop)
+    return seq
+
+
+def _eval_shard(job):
+    """Worker: load the network once and evaluate one shard of sequences"""
+    net_path, seqs, config_fields = job
+    net = glia.Network.from_file(net_path, verbose=False)
+    config = _config_from_dict(config_fields)
+    seqs = [_seq_from_events(events, loop) for events, loop in seqs]
+    metrics_list = glia.Trainer(net, config).evaluate_batch(seqs, config)
+    return [(m.winner_id, m.margin) for m in metrics_list]
+
+
+def _evaluate_sharded(net, dataset, config, workers):
+    """
+    Evaluate dataset[k::workers] in separate processes and merge in order.
     
-    return glia.Dataset(episodes)
+    Each shard starts from the saved network, so membrane state carried from
+    one episode into the next differs from a serial run.
+    """
+    seqs = [_seq_to_events(ep.seq) for ep in dataset]
+    config_fields = _config_to_dict(config)
+    
+    outcomes = [None] * len(seqs)
+    with tempfile.TemporaryDirectory() as tmp:
+        net_path = os.path.join(tmp, 'eval.net')
+        net.save(net_path, verbose=False)
+        jobs = [(net_path, seqs[k::workers], config_fields) for k in range(workers)]
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            for k, shard in enumerate(ex.map(_eval_shard, jobs)):
+                outcomes[k::workers] = shard
+    return outcomes
 
 
-def evaluate_network(net, dataset, config, verbose=False):
-    """Evaluate network on dataset"""
-    trainer = glia.Trainer(net, config)
-    correct = 0
-    results = []
+def evaluate_network(net, dataset, config, verbose=False, workers=1, trainer=None):
+    """Evaluate network on dataset (reusing trainer, if given, for the in-process path)"""
+    if workers > 1 and len(dataset) > 1:
+        outcomes = _evaluate_sharded(net, dataset, config, min(workers, len(dataset)))
+    else:
+        if trainer is None:
+            trainer = glia.Trainer(net, config)
+        # One batched call for the whole dataset instead of one call per episode
+        metrics_list = trainer.evaluate_batch([ep.seq for ep in dataset], config)
+        outcomes = [(m.winner_id, m.margin) for m in metrics_list]
+    targets = [ep.target_id for ep in dataset]
+    winners = [winner for winner, _ in outcomes]
+    is_correct = np.array(winners) == np.array(targets)
     
-    for ep in dataset:
-        metrics = trainer.evaluate(ep.seq, config)
-        is_correct = (metrics.winner_id == ep.target_id)
-        correct += int(is_correct)
-        
+    results = []
+    lines = []  # verbose output, written in one go after the loop
+    for target, (winner, margin), ok in zip(targets, outcomes, is_correct.tolist()):
         results.append({
-            'target': ep.target_id,
-            'predicted': metrics.winner_id,
-            'correct': is_correct,
-            'margin': metrics.margin
+            'target': target,
+            'predicted': winner,
+            'correct': ok,
+            'margin': margin
         })
         
         if verbose:
-            status = "✓" if is_correct else "✗"
-            print(f"  {status} Target: {ep.target_id}, Predicted: {metrics.winner_id}, Margin: {metrics.margin:.3f}")
+            status = "✓" if ok else "✗"
+            lines.append(f"  {status} Target: {target}, Predicted: {winner}, Margin: {margin:.3f}\n")
     
-    accuracy = correct / len(dataset)
+    if lines:
+        sys.stdout.write("".join(lines))
+        sys.stdout.flush()
+    
+    accuracy = int(is_correct.sum()) / len(dataset)
     return accuracy, results
 
 
@@ -150,6 +225,11 @@ def main():
     parser.add_argument('--save', type=str, default='nets/3class_trained.net', help='Save path')
     parser.add_argument('--load', type=str, default=None, help='Load pretrained network')
     parser.add_argument('--verbose', action='store_true', help='Verbose output')
+    parser.add_argument('--seed', type=int, default=None, help='Dataset RNG seed')
+    parser.add_argument('--eval-workers', type=int, default=1,
+                        help='Processes for sharded evaluation (>1 starts each shard from a freshly '
+                             'loaded net, so accuracies differ from a serial run)')
+    parser.add_argument('--skip-initial-eval', action='store_true', help='Skip the pre-training evaluation pass')
     args = parser.parse_args()
     
     print("=" * 60)
@@ -162,15 +242,18 @@ def main():
         net = glia.Network.from_file(args.load)
     else:
         print("\nCreating 3-class network...")
-        net = glia.Network()
-        net.load('nets/3class_network.net')
+        net = glia.Network.from_file('nets/3class_network.net')
     
     print(f"Network: {net.num_neurons} neurons, {net.num_connections} connections")
+    if args.eval_workers > 1:
+        print(f"Warning: --eval-workers {args.eval_workers} restarts membrane state per shard; "
+              f"accuracies are not comparable to --eval-workers 1", file=sys.stderr)
     
     # Create datasets
     print(f"\nGenerating datasets (noise level: {args.noise:.1%})...")
-    train_data = create_3class_dataset(args.train_episodes, noise_level=args.noise)
-    test_data = create_3class_dataset(args.test_episodes, noise_level=args.noise)
+    test_seed = None if args.seed is None else args.seed + 1
+    train_data = create_3class_dataset(args.train_episodes, noise_level=args.noise, seed=args.seed)
+    test_data = create_3class_dataset(args.test_episodes, noise_level=args.noise, seed=test_seed)
     print(f"Training: {len(train_data)} episodes")
     print(f"Testing: {len(test_data)} episodes")
     
@@ -183,33 +266,43 @@ def main():
         verbose=False
     )
     
-    # Evaluate before training
-    print("\n" + "-" * 60)
-    print("Before Training")
-    print("-" * 60)
-    train_acc_before, _ = evaluate_network(net, train_data, config, verbose=False)
-    test_acc_before, _ = evaluate_network(net, test_data, config, verbose=False)
-    print(f"Training accuracy: {train_acc_before:.1%}")
-    print(f"Test accuracy: {test_acc_before:.1%}")
+    # One trainer serves every in-process evaluation and the training run
+    trainer = glia.Trainer(net, config)
+    
+    # Evaluate before training (informational only)
+    test_acc_before = None
+    if not args.skip_initial_eval:
+        print("\n" + "-" * 60)
+        print("Before Training")
+        print("-" * 60)
+        train_acc_before, _ = evaluate_network(net, train_data, config, verbose=False,
+                                               workers=args.eval_workers, trainer=trainer)
+        test_acc_before, _ = evaluate_network(net, test_data, config, verbose=False,
+                                              workers=args.eval_workers, trainer=trainer)
+        print(f"Training accuracy: {train_acc_before:.1%}")
+        print(f"Test accuracy: {test_acc_before:.1%}")
     
     # Train
     print("\n" + "-" * 60)
     print(f"Training for {args.epochs} epochs")
     print("-" * 60)
-    trainer = glia.Trainer(net, config)
-    trainer.train_epoch(train_data, epochs=args.epochs, config=config)
+    history = trainer.train(train_data, epochs=args.epochs, config=config, verbose=args.verbose)
     
-    print(f"\nFinal training accuracy: {trainer.epoch_accuracy[-1]:.1%}")
+    # The last epoch's accuracy stands in for a second pass over the train set
+    train_acc_after = history['accuracy'][-1]
+    print(f"\nFinal training accuracy: {train_acc_after:.1%}")
     
     # Evaluate after training
     print("\n" + "-" * 60)
     print("After Training")
     print("-" * 60)
-    train_acc_after, _ = evaluate_network(net, train_data, config, verbose=False)
-    test_acc_after, results = evaluate_network(net, test_data, config, verbose=args.verbose)
+    test_acc_after, results = evaluate_network(net, test_data, config, verbose=args.verbose,
+                                               workers=args.eval_workers, trainer=trainer)
     print(f"Training accuracy: {train_acc_after:.1%}")
     print(f"Test accuracy: {test_acc_after:.1%}")
-    print(f"Improvement: {(test_acc_after - test_acc_before)*100:.1f} percentage points")
+    if test_acc_before is not None:
+        note = f" (sharded over {args.eval_workers} workers)" if args.eval_workers > 1 else ""
+        print(f"Improvement: {(test_acc_after - test_acc_before)*100:.1f} percentage points{note}")
     
     # Save trained network
     net.save(args.save)
@@ -219,17 +312,18 @@ def main():
     print("\n" + "-" * 60)
     print("Confusion Matrix (Test Set)")
     print("-" * 60)
-    confusion = {}
-    for r in results:
-        key = (r['target'], r['predicted'])
-        confusion[key] = confusion.get(key, 0) + 1
-    
     targets = ['N1', 'N2', 'N3']
+    class_index = {t: i for i, t in enumerate(targets)}
+    # Predictions outside the three classes map to -1 and are left out, as before
+    yt = np.array([class_index.get(r['target'], -1) for r in results], dtype=np.int64)
+    yp = np.array([class_index.get(r['predicted'], -1) for r in results], dtype=np.int64)
+    valid = (yt >= 0) & (yp >= 0)
+    confusion = np.bincount(yt[valid] * 3 + yp[valid], minlength=9).reshape(3, 3)
+    
     print(f"{'':>10} | {'Predicted':^30}")
     print(f"{'Target':>10} | " + " ".join([f"{t:>8}" for t in targets]))
     print("-" * 50)
-    for target in targets:
-        counts = [confusion.get((target, pred), 0) for pred in targets]
+    for target, counts in zip(targets, confusion.tolist()):
         print(f"{target:>10} | " + " ".join([f"{c:>8}" for c in counts]))
     
     print("\n" + "=" * 60)
@@ -1,7 +1,11 @@
 #!/usr/bin/env python3
 import argparse, os, math, csv, random, sys
+import itertools
+import multiprocessing as mp
 from pathlib import Path
 
+import numpy as np
+
 # Optional imports guarded so the script still runs for synthetic / sklearn digits
 try:
     import torch
@@ -16,19 +20,21 @@ try:
 except Exception:
     _HAS_SKLEARN = False
 
+try:
+    import numba
+    _HAS_NUMBA = True
+except Exception:
+    _HAS_NUMBA = False
+
 
 # ------------------------------
 # Encoding helpers
 # ------------------------------
 def image_to_vectors(img_2d):
-    """img_2d: 2D list/array-like in [0,1]. Returns flat list row-major."""
-    h = len(img_2d)
-    w = len(img_2d[0])
-    vec = []
-    for r in range(h):
-        for c in range(w):
-            vec.append(float(img_2d[r][c]))
-    return vec, h, w
+    """img_2d: 2D array-like in [0,1]. Returns (flat row-major ndarray, h, w)."""
+    arr = np.asarray(img_2d)
+    h, w = arr.shape
+    return arr.ravel(), h, w
 
 def normalize01(x, eps=1e-9):
     mn, mx = float(min(x)), float(max(x))
@@ -36,61 +42,114 @@ def normalize01(x, eps=1e-9):
         return [0.0 for _ in x]
     return [(v - mn)/(mx - mn) for v in x]
 
-def poisson_encode(feature_vals, T, max_rate, amp, rng, min_intensity=0.0):
+# Encoders return events as parallel arrays (ts, idxs, amts), tick-ordered.
+def _events(ts, idxs, amts):
+    ts = np.asarray(ts, dtype=np.int32)
+    return ts, np.asarray(idxs, dtype=np.int32), np.broadcast_to(np.asarray(amts, dtype=np.float64), ts.shape)
+
+def _counts_to_events(counts, amp):
+    """Expand a (T, F) spike-count grid into one event per spike."""
+    ts, idxs = np.nonzero(counts)
+    reps = counts[ts, idxs]
+    return _events(np.repeat(ts, reps), np.repeat(idxs, reps), amp)
+
+
+# ------------------------------
+# Numba kernels (optional, --jit)
+# ------------------------------
+if _HAS_NUMBA:
+    # Serial on purpose: numba keeps one RNG stream per thread, so a prange
+    # over features would not be reproducible for a given --rng-seed.
+    # use_poisson is decided once for the whole array (see poisson_encode).
+    @numba.njit(cache=True)
+    def _poisson_counts_nb(lam, T, seed, use_poisson):
+        np.random.seed(seed)
+        counts = np.zeros((T, lam.size), dtype=np.int64)
+        for t in range(T):
+            for i in range(lam.size):
+                li = lam[i]
+                if li <= 0.0:
+                    continue
+                if use_poisson:
+                    counts[t, i] = np.random.poisson(li)
+                elif np.random.random() < li:
+                    counts[t, i] = 1
+        return counts
+
+    @numba.njit(cache=True, parallel=True)
+    def _rate_encode_nb(vals, T, amp, min_intensity):
+        keep = np.nonzero((vals >= min_intensity) & (vals * amp != 0.0))[0]
+        F = keep.size
+        ts = np.empty(T * F, dtype=np.int32)
+        idxs = np.empty(T * F, dtype=np.int32)
+        amts = np.empty(T * F, dtype=np.float64)
+        for t in numba.prange(T):
+            for j in range(F):
+                k = t * F + j
+                ts[k] = t
+                idxs[k] = keep[j]
+                amts[k] = vals[keep[j]] * amp
+        return ts, idxs, amts
+
+    @numba.njit(cache=True)
+    def _latency_encode_nb(vals, tick_min, tick_range, min_intensity):
+        keep = np.nonzero(vals >= min_intensity)[0]
+        ts = np.empty(keep.size, dtype=np.int32)
+        for j in range(keep.size):
+            ts[j] = tick_min + int(np.round((1.0 - vals[keep[j]]) * (tick_range - 1)))
+        return ts, keep.astype(np.int32)
+
+
+def poisson_encode(feature_vals, T, max_rate, amp, rng, min_intensity=0.0, jit=False):
     """
-    feature_vals in [0,1]; returns list of (tick, idx, amount) events.
+    feature_vals in [0,1]; returns (ts, idxs, amts) arrays, one entry per spike.
     Each feature's Poisson rate = feature * max_rate (spikes/tick).
     """
-    events = []
-    for idx, val in enumerate(feature_vals):
-        if val < min_intensity:
-            continue
-        lam = val * max_rate  # expected spikes per tick
-        # For each tick, sample a Bernoulli with p ~ lam (if lam <= 1). If lam>1, allow multiple spikes.
-        for t in range(T):
-            # For generality, draw from Poisson(lam)
-            k = rng.poisson(lam) if hasattr(rng, "poisson") else sum(1 for _ in range(int(lam)) if rng.random() < (lam - int(lam)))
-            if lam < 1.0:
-                # Approximate Poisson by Bernoulli for speed
-                if rng.random() < lam:
-                    k = 1
-                else:
-                    k = 0
-            for _ in range(k):
-                events.append((t, idx, amp))
-    return events
-
-def rate_encode(feature_vals, T, amp, min_intensity=0.0):
+    vals = np.asarray(feature_vals, dtype=np.float64)
+    lam = vals * max_rate  # expected spikes per tick
+    lam[vals < min_intensity] = 0.0
+    # Poisson for every feature once any rate reaches 1 spike/tick, Bernoulli otherwise
+    use_poisson = bool(lam.size and lam.max() >= 1.0)
+    if jit and _HAS_NUMBA:
+        # Derive the kernel seed from rng so runs stay reproducible per --rng-seed
+        return _counts_to_events(_poisson_counts_nb(lam, T, int(rng.integers(2**31)), use_poisson), amp)
+    if use_poisson:
+        # Rare: some feature can spike more than once per tick
+        return _counts_to_events(rng.poisson(lam, size=(T, lam.size)), amp)
+    # All rates < 1 (the usual case): Bernoulli approximation, one comparison for the whole grid
+    ts, idxs = np.nonzero(rng.random((T, lam.size)) < lam)
+    return _events(ts, idxs, amp)
+
+def rate_encode(feature_vals, T, amp, min_intensity=0.0, jit=False):
     """
     Dense: every tick inject val*amp for each feature >= min_intensity.
     """
-    events = []
-    for idx, val in enumerate(feature_vals):
-        if val < min_intensity:
-            continue
-        amount = float(val) * amp
-        if amount == 0.0:
-            continue
-        for t in range(T):
-            events.append((t, idx, amount))
-    return events
+    vals = np.asarray(feature_vals, dtype=np.float64)
+    if jit and _HAS_NUMBA:
+        return _events(*_rate_encode_nb(vals, T, float(amp), float(min_intensity)))
+    amounts = vals * amp
+    keep = np.nonzero((vals >= min_intensity) & (amounts != 0.0))[0]
+    # Tick-major so events come out in write order
+    return _events(np.repeat(np.arange(T), keep.size), np.tile(keep, T), np.tile(amounts[keep], T))
 
-def latency_encode(feature_vals, T, amp, tick_min=0, tick_max=None, min_intensity=0.0):
+def latency_encode(feature_vals, T, amp, tick_min=0, tick_max=None, min_intensity=0.0, jit=False):
     """
     One event per feature: brighter -> earlier tick.
     Maps val in [0,1] to t = tick_min + (1-val)*(tick_range-1)
     """
-    events = []
     if tick_max is None:
         tick_max = T - 1
     tick_range = max(1, tick_max - tick_min + 1)
-    for idx, val in enumerate(feature_vals):
-        if val < min_intensity:
-            continue
-        # invert so 1.0 fires earliest
-        t = tick_min + int(round((1.0 - float(val)) * (tick_range - 1)))
-        events.append((t, idx, amp))
-    return events
+    vals = np.asarray(feature_vals, dtype=np.float64)
+    if jit and _HAS_NUMBA:
+        ts, idxs = _latency_encode_nb(vals, tick_min, tick_range, float(min_intensity))
+    else:
+        idxs = np.nonzero(vals >= min_intensity)[0]
+        # invert so 1.0 fires earliest (np.round rounds half to even, like round())
+        ts = tick_min + np.round((1.0 - vals[idxs]) * (tick_range - 1)).astype(np.int32)
+    # One event per feature: order by tick (stable, so idx breaks ties)
+    order = np.argsort(ts, kind="stable")
+    return _events(ts[order], idxs[order], amp)
 
 
 # ------------------------------
@@ -103,11 +162,10 @@ def load_mnist(root, split, fashion=False):
     ds_cls = datasets.FashionMNIST if fashion else datasets.MNIST
     train = (split == "train")
     ds = ds_cls(root=root, train=train, download=True, transform=tfm)
-    # Yield (2D grayscale array in [0,1], label)
+    # Yield (2D float32 grayscale ndarray in [0,1], label)
     for img, label in ds:
         # img: [1,28,28]
-        arr = img.squeeze(0).numpy().tolist()
-        yield arr, int(label)
+        yield img.squeeze(0).numpy(), int(label)
 
 def load_sklearn_digits():
     if not _HAS_SKLEARN:
@@ -117,8 +175,7 @@ def load_sklearn_digits():
     labels = data.target.tolist()
     # scale to [0,1]
     for i, img in enumerate(images):
-        arr = (img / 16.0).tolist()
-        yield arr, int(labels[i])
+        yield img / 16.0, int(labels[i])
 
 def gen_spiral(n_per_class=500, n_classes=3, noise=0.2, seed=0):
     """
@@ -149,19 +206,105 @@ def gen_parity(n_bits=12, n_samples=5000, seed=0):
 # ------------------------------
 # .seq writer
 # ------------------------------
-def write_seq(path, duration, events):
+def write_seq(path, duration, ts, idxs, amts, chunk=4096):
     """
-    events: list of (tick:int, feature_idx:int, amount:float)
+    ts, idxs, amts: parallel arrays of (tick, feature_idx, amount), already in
+    tick order (the encoders emit them that way).
     """
-    lines = []
-    lines.append(f"DURATION {duration}")
-    lines.append("LOOP false")
-    lines.append("")
-    # Sort by tick for readability (not required)
-    events_sorted = sorted(events, key=lambda e: (e[0], e[1]))
-    for t, idx, amt in events_sorted:
-        lines.append(f"{t} S{idx} {amt:.6f}")
-    Path(path).write_text("\n".join(lines), encoding="utf-8")
+    amts = np.asarray(amts)
+    # Common case: one constant amplitude for the whole file -> format it once
+    const_amt = f"{float(amts[0]):.6f}" if len(amts) and (amts == amts[0]).all() else None
+    # Otherwise amounts still repeat heavily, so format each distinct value once
+    amt_str = {}
+    def fmt(a):
+        s = amt_str.get(a)
+        if s is None:
+            s = amt_str[a] = f"{a:.6f}"
+        return s
+
+    with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        f.write(f"DURATION {duration}\nLOOP false\n")
+        for start in range(0, len(ts), chunk):
+            t_blk = ts[start:start + chunk].tolist()
+            i_blk = idxs[start:start + chunk].tolist()
+            if const_amt is not None:
+                f.write("".join([f"\n{t} S{idx} {const_amt}" for t, idx in zip(t_blk, i_blk)]))
+            else:
+                a_blk = amts[start:start + chunk].tolist()
+                f.write("".join([f"\n{t} S{idx} {fmt(a)}" for t, idx, a in zip(t_blk, i_blk, a_blk)]))
+
+
+def stream_encode_write(path, duration, feature_vals, max_rate, amp, rng, min_intensity=0.0):
+    """
+    Fused poisson_encode + write_seq: draws spikes one tick at a time and writes
+    them straight out, so the full event list is never materialized.
+    """
+    vals = np.asarray(feature_vals, dtype=np.float64)
+    lam = vals * max_rate
+    lam[vals < min_intensity] = 0.0
+    # Same rule as poisson_encode: Bernoulli unless some rate reaches 1 spike/tick
+    bernoulli = not (lam.size and lam.max() >= 1.0)
+    amt_str = f"{float(amp):.6f}"
+
+    with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        f.write(f"DURATION {duration}\nLOOP false\n")
+        for t in range(duration):
+            if bernoulli:
+                idxs = np.nonzero(rng.random(lam.size) < lam)[0]
+            else:
+                counts = rng.poisson(lam)
+                idxs = np.nonzero(counts)[0]
+                idxs = np.repeat(idxs, counts[idxs])
+            if idxs.size:
+                f.write("".join([f"\n{t} S{idx} {amt_str}" for idx in idxs.tolist()]))
+
+
+# ------------------------------
+# Per-sample worker
+# ------------------------------
+def _init_worker():
+    """Pool initializer: keep numba's parallel kernels to one thread per worker process."""
+    if _HAS_NUMBA:
+        numba.set_num_threads(1)
+
+def _process_sample(job):
+    """Encode one sample and write its .seq file. Returns (filename, label)."""
+    count, sample, label, args = job
+    # Per-sample stream: output does not depend on worker count or scheduling
+    rng = np.random.default_rng([args.rng_seed, count])
+
+    # Normalize & flatten features
+    if np.ndim(sample) == 2:
+        # 2D (image ndarray)
+        vec, h, w_ = image_to_vectors(sample)
+        # already [0,1] for MNIST/Fashion/Sklearn; keep as-is
+        feature_vals = vec
+    else:
+        # 1D (spiral 2D, parity bits, etc.)
+        # Keep within [0,1]; if not, normalize:
+        feature_vals = np.clip(np.asarray(sample, dtype=np.float64), 0.0, 1.0)
+
+    fname = f"{args.dataset}_{args.encoding}_{args.split if args.dataset in ['mnist','fashion'] else 'data'}_{count:06d}.seq"
+    out_path = Path(args.outdir) / fname
+
+    # Encode
+    if args.encoding == "poisson" and not (args.jit and _HAS_NUMBA):
+        stream_encode_write(out_path, args.duration, feature_vals, args.max_rate, args.amp, rng,
+                            min_intensity=args.min_intensity)
+        return fname, label
+    if args.encoding == "poisson":
+        events = poisson_encode(feature_vals, args.duration, args.max_rate, args.amp, rng, min_intensity=args.min_intensity, jit=args.jit)
+    elif args.encoding == "rate":
+        events = rate_encode(feature_vals, args.duration, args.amp, min_intensity=args.min_intensity, jit=args.jit)
+    else:
+        events = latency_encode(feature_vals, args.duration, args.amp,
+                                tick_min=args.tick_min,
+                                tick_max=(args.tick_max if args.tick_max is not None else args.duration-1),
+                                min_intensity=args.min_intensity, jit=args.jit)
+
+    # Write .seq
+    write_seq(out_path, args.duration, *events)
+    return fname, label
 
 
 # ------------------------------
@@ -181,6 +324,8 @@ def main():
     p.add_argument("--tick-min", type=int, default=0, help="Latency encoding start tick.")
     p.add_argument("--tick-max", type=int, default=None, help="Latency encoding end tick (inclusive).")
     p.add_argument("--rng-seed", type=int, default=0)
+    p.add_argument("--jit", action="store_true", help="Use Numba-compiled encoders (requires numba).")
+    p.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes for encoding/writing (1 = serial).")
     p.add_argument("--root", type=str, default="~/.cache/glia_datasets", help="Where to store/download datasets.")
     # Spiral options
     p.add_argument("--spiral-classes", type=int, default=3)
@@ -194,15 +339,8 @@ def main():
     outdir = Path(args.outdir)
     outdir.mkdir(parents=True, exist_ok=True)
 
-    # RNG: use numpy if present for Poisson; fallback to random.Random
-    try:
-        import numpy as _np
-        rng = _np.random.default_rng(args.rng_seed)
-    except Exception:
-        class _Fallback:
-            def __init__(self, s): self.r = random.Random(s)
-            def random(self): return self.r.random()
-        rng = _Fallback(args.rng_seed)
+    if args.jit and not _HAS_NUMBA:
+        print("numba not available; falling back to the NumPy encoders.", file=sys.stderr)
 
     # Load/generate data
     if args.dataset == "mnist":
@@ -216,46 +354,25 @@ def main():
     else:  # parity
         it = gen_parity(n_bits=args.parity_bits, n_samples=args.parity_samples, seed=args.rng_seed)
 
+    jobs = ((count, sample, label, args)
+            for count, (sample, label) in enumerate(itertools.islice(it, args.max_samples)))
+
     label_path = outdir / "labels.csv"
     with open(label_path, "w", newline="", encoding="utf-8") as f:
         w = csv.writer(f)
         w.writerow(["filename","label"])
 
         count = 0
-        for sample, label in it:
-            if count >= args.max_samples:
-                break
-
-            # Normalize & flatten features
-            if isinstance(sample, list) and isinstance(sample[0], list):
-                # 2D (image)
-                vec, h, w_ = image_to_vectors(sample)
-                # already [0,1] for MNIST/Fashion/Sklearn; keep as-is
-                feature_vals = vec
-            else:
-                # 1D (spiral 2D, parity bits, etc.)
-                feature_vals = sample
-                # Keep within [0,1]; if not, normalize:
-                feature_vals = [min(1.0, max(0.0, v)) for v in feature_vals]
-
-            # Encode
-            if args.encoding == "poisson":
-                events = poisson_encode(feature_vals, args.duration, args.max_rate, args.amp, rng, min_intensity=args.min_intensity)
-            elif args.encoding == "rate":
-                events = rate_encode(feature_vals, args.duration, args.amp, min_intensity=args.min_intensity)
-            else:
-                events = latency_encode(feature_vals, args.duration, args.amp,
-                                        tick_min=args.tick_min,
-                                        tick_max=(args.tick_max if args.tick_max is not None else args.duration-1),
-                                        min_intensity=args.min_intensity)
-
-            # Write .seq
-            fname = f"{args.dataset}_{args.encoding}_{args.split if args.dataset in ['mnist','fashion'] else 'data'}_{count:06d}.seq"
-            write_seq(outdir / fname, duration=args.duration, events=events)
-
-            # Label row
-            w.writerow([fname, label])
-            count += 1
+        # Label rows are written here, in sample order, from the workers' results
+        if args.workers > 1:
+            with mp.Pool(args.workers, initializer=_init_worker) as pool:
+                for fname, label in pool.imap(_process_sample, jobs, chunksize=32):
+                    w.writerow([fname, label])
+                    count += 1
+        else:
+            for fname, label in map(_process_sample, jobs):
+                w.writerow([fname, label])
+                count += 1
 
     print(f"Done. Wrote {count} .seq files to {outdir} and labels to {label_path}.")
 
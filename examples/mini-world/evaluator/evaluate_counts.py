@@ -1,29 +1,32 @@
-import argparse, csv
+import argparse
+import numpy as np
 
 def read_rows(path):
-    rows=[]; 
-    with open(path, newline="", encoding="utf-8") as f:
-        for i,r in enumerate(csv.reader(f)):
-            if i==0: continue
-            rows.append((int(r[0]), int(r[1]), int(r[2])))
-    return rows
+    # (N,3) int array of clip,tick,y; header row skipped
+    return np.loadtxt(path, delimiter=",", skiprows=1, usecols=(0,1,2), dtype=np.int64, ndmin=2)
+
+def _last_per_key(rows, lo, span):
+    # Pack (clip,tick) into one int64 key; on duplicate keys the last row wins
+    keys = rows[:,0]*span + (rows[:,1]-lo)
+    uk, first = np.unique(keys[::-1], return_index=True)
+    return uk, rows[::-1,2][first]
 
 def confusion_and_metrics(labels, preds, max_class=4):
-    y_true = {(c,t):y for c,t,y in labels}; y_pred = {(c,t):y for c,t,y in preds}
-    keys = sorted(set(y_true.keys()) & set(y_pred.keys()))
-    if not keys: raise ValueError("No overlapping (clip,tick) between labels and preds")
-    K = max_class+1; cm=[[0]*K for _ in range(K)]; correct=0
-    for k in keys:
-        yt, yp = y_true[k], y_pred[k]
-        if 0<=yt<=max_class and 0<=yp<=max_class: cm[yt][yp]+=1
-        if yt==yp: correct+=1
-    acc = correct/len(keys)
-    prec=[]; rec=[]
-    for c in range(K):
-        tp=cm[c][c]; fp=sum(cm[r][c] for r in range(K))-tp; fn=sum(cm[c][r] for r in range(K))-tp
-        p=tp/(tp+fp) if (tp+fp)>0 else 0.0; r=tp/(tp+fn) if (tp+fn)>0 else 0.0
-        prec.append(p); rec.append(r)
-    return cm, acc, prec, rec, len(keys)
+    labels = np.asarray(labels, dtype=np.int64).reshape(-1,3); preds = np.asarray(preds, dtype=np.int64).reshape(-1,3)
+    if not len(labels) or not len(preds): raise ValueError("No overlapping (clip,tick) between labels and preds")
+    ticks = np.concatenate([labels[:,1], preds[:,1]]); lo = ticks.min(); span = ticks.max()-lo+1
+    kt, yt = _last_per_key(labels, lo, span); kp, yp = _last_per_key(preds, lo, span)
+    _, it, ip = np.intersect1d(kt, kp, assume_unique=True, return_indices=True)
+    if not len(it): raise ValueError("No overlapping (clip,tick) between labels and preds")
+    yt, yp = yt[it], yp[ip]
+    K = max_class+1
+    ok = (yt>=0)&(yt<=max_class)&(yp>=0)&(yp<=max_class)
+    cm = np.bincount(yt[ok]*K + yp[ok], minlength=K*K).reshape(K,K)
+    acc = float(np.mean(yt==yp))
+    tp = np.diag(cm); fp = cm.sum(0)-tp; fn = cm.sum(1)-tp
+    prec = np.divide(tp, tp+fp, out=np.zeros(K), where=(tp+fp)>0)
+    rec = np.divide(tp, tp+fn, out=np.zeros(K), where=(tp+fn)>0)
+    return cm, acc, prec, rec, len(yt)
 
 def main():
     ap=argparse.ArgumentParser()
@@ -1,22 +1,48 @@
-import argparse, json, pathlib
+import argparse, io, json, math, pathlib, time
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation, PillowWriter
+from matplotlib.animation import FuncAnimation, PillowWriter, FFMpegWriter
 from matplotlib.patches import Rectangle
 from matplotlib.lines import Line2D
+from event_world import load_clip_arrays
+
+class RawFFMpegWriter(FFMpegWriter):
+    """
+    FFMpegWriter that pipes the rendered canvas to ffmpeg as rgb24 rawvideo,
+    skipping the per-frame savefig() and sending 3 bytes/pixel instead of 4.
+    """
+    supported_formats = ["rgb24"]
+
+    def grab_frame(self, **savefig_kwargs):
+        if self.dpi != self.fig.dpi:
+            # Canvas pixels would not match the declared frame size: render
+            # through savefig at the writer dpi and drop the alpha channel.
+            buf = io.BytesIO()
+            self.fig.savefig(buf, format="rgba", dpi=self.dpi, **savefig_kwargs)
+            rgba = np.frombuffer(buf.getbuffer(), dtype=np.uint8).reshape(-1, 4)
+        else:
+            self.fig.set_size_inches(self._w, self._h)
+            self.fig.canvas.draw()
+            rgba = np.asarray(self.fig.canvas.buffer_rgba())
+        self._proc.stdin.write(np.ascontiguousarray(rgba[..., :3]).tobytes())
 
 def load_clip(run_dir: pathlib.Path, clip: int):
-    npz = np.load(run_dir / "npz" / f"clip_{clip:05d}.npz")
-    frames = npz["frames"]; on = npz["on"]; off = npz["off"]
+    frames, on, off = load_clip_arrays(run_dir, clip)
     cfg = json.load(open(run_dir / "config.json", "r"))
     return frames, on, off, cfg
 
 def group_events_by_frame(events, T):
-    buckets = [[] for _ in range(T)]
-    if events.size == 0: return buckets
-    for t, y, x in events.tolist():
-        if 0 <= t < T: buckets[int(t)].append((int(y), int(x)))
-    return buckets
+    """
+    Sort (t,y,x) events by frame. Returns (xy, starts): xy is a contiguous
+    float32 [N,2] array of (x,y) offsets and frame t owns xy[starts[t]:starts[t+1]].
+    """
+    events = events.reshape(-1, 3)
+    events = events[(events[:,0] >= 0) & (events[:,0] < T)]
+    events = events[np.argsort(events[:,0], kind="stable")]
+    starts = np.zeros(T + 1, dtype=np.int64)
+    np.cumsum(np.bincount(events[:,0], minlength=T), out=starts[1:])
+    xy = np.ascontiguousarray(events[:, [2, 1]], dtype=np.float32)
+    return xy, starts
 
 def main():
     ap = argparse.ArgumentParser()
@@ -29,8 +55,11 @@ def main():
     ap.add_argument("--figsize", type=float, nargs=2, default=(6.0,6.8))
     ap.add_argument("--marker-size", type=float, default=4.0)
     ap.add_argument("--theme", type=str, default="dark", choices=["light","dark"])
-    ap.add_argument("--blit", action="store_true")
+    ap.add_argument("--blit", action=argparse.BooleanOptionalAction, default=None,
+                    help="Redraw only changing artists (default: on for live view, off for --save)")
     args = ap.parse_args()
+    if args.blit is None:
+        args.blit = args.save is None
 
     run_dir = pathlib.Path(args.indir)
     frames, on, off, cfg = load_clip(run_dir, args.clip)
@@ -39,8 +68,8 @@ def main():
     bin_ms = float(cfg.get("bin_ms", 10))
     interval_ms = (1000.0 / fps) / max(args.speed, 1e-6)
 
-    on_by_t = group_events_by_frame(on, T)
-    off_by_t = group_events_by_frame(off, T)
+    on_xy, on_starts = group_events_by_frame(on, T)
+    off_xy, off_starts = group_events_by_frame(off, T)
 
     # Layout: image + progress bar
     fig = plt.figure(figsize=tuple(args.figsize), dpi=args.dpi)
@@ -56,11 +85,13 @@ def main():
         bar_bg, bar_fg, text_color, border_col = "#e6e6e6", "#2b7cff", "#111111", "#888888"
 
     # Image + optional events
-    im = ax_img.imshow(frames[0], vmin=0, vmax=1, animated=args.blit)
+    vmax = 255 if frames.dtype == np.uint8 else 1  # uint8 runs store brightness*255
+    im = ax_img.imshow(frames[0], vmin=0, vmax=vmax, animated=args.blit)
     ax_img.set_axis_off()
 
     scat_on = scat_off = None
     if args.show_events:
+        # A scalar size applies to every point, whatever the per-frame count
         scat_on = ax_img.scatter([], [], s=args.marker_size, animated=args.blit, label="ON")
         scat_off = ax_img.scatter([], [], s=args.marker_size, animated=args.blit, label="OFF")
         leg = ax_img.legend(loc="upper right", facecolor="white", framealpha=0.7)
@@ -123,56 +154,70 @@ def main():
         ax_bar.add_patch(left_border)
         ax_bar.add_patch(right_border)
 
-    # If blitting, include whichever borders exist
-    if args.blit:
-        animated_borders = [top_border, bot_border]
-        if left_border is not None:  animated_borders += [left_border]
-        if right_border is not None: animated_borders += [right_border]
-        for p in animated_borders: p.set_animated(True)
+    # Borders never change: leave them static so they are baked into the blit
+    # background once instead of being redrawn every frame
+
+    fps_bin = fps * bin_ms
+    if fps_bin.is_integer():
+        # Exact ceil(T*1000 / (fps*bin_ms)) without float roundoff
+        tick_total = (T * 1000 + int(fps_bin) - 1) // int(fps_bin)
+    else:
+        tick_total = math.ceil((T / fps) * 1000.0 / bin_ms)
+    # HUD text depends only on t: format every frame's string once up front
+    time_ms = (np.arange(T) / fps) * 1000.0
+    ticks = (time_ms // bin_ms).astype(int)
+    hud_strings = [
+        f"frame: {t:5d} / {T-1}    time: {time_ms[t]:7.2f} ms    tick: {ticks[t]:5d} / {tick_total}"
+        for t in range(T)
+    ]
 
-    empty_offsets = np.empty((0, 2))
+    frame_cost = {"t0": 0.0, "ema": 0.0}
 
     def update(t):
+        frame_cost["t0"] = time.perf_counter()
         im.set_array(frames[t])
 
         if args.show_events:
-            if on_by_t[t]:
-                ys, xs = zip(*on_by_t[t]); scat_on.set_offsets(np.c_[xs, ys])
-                scat_on.set_sizes([args.marker_size] * len(xs))
-            else:
-                scat_on.set_offsets(empty_offsets)
-            if off_by_t[t]:
-                ys, xs = zip(*off_by_t[t]); scat_off.set_offsets(np.c_[xs, ys])
-                scat_off.set_sizes([args.marker_size] * len(xs))
-            else:
-                scat_off.set_offsets(empty_offsets)
-
-        time_ms = (t / fps) * 1000.0
-        tick = int(time_ms // bin_ms)
-        tick_total = int(np.ceil((T / fps) * 1000.0 / bin_ms))
-        hud.set_text(f"frame: {t:5d} / {T-1}    time: {time_ms:7.2f} ms    tick: {tick:5d} / {tick_total}")
+            # Slices of the presorted arrays: no per-frame Python allocation
+            scat_on.set_offsets(on_xy[on_starts[t]:on_starts[t+1]])
+            scat_off.set_offsets(off_xy[off_starts[t]:off_starts[t+1]])
+
+        hud.set_text(hud_strings[t])
 
         prog = min(1.0, max(0.0, t / max(1, T-1)))
         fg_rect.set_width(prog)
 
         if args.blit:
-            arts = [im, fg_rect, hud, top_border, bot_border]
-            if left_border is not None:  arts.append(left_border)
-            if right_border is not None: arts.append(right_border)
+            # Only artists whose pixels change
+            arts = [im, fg_rect, hud]
             if args.show_events: arts += [scat_on, scat_off]
             return arts
         return ()
 
     anim = FuncAnimation(fig, update, frames=T, interval=interval_ms, blit=args.blit)
 
+    def adapt_interval():
+        # Runs after the animation's own timer callback. With blit the frame is
+        # drawn synchronously, so this measures update + draw; the non-blit path
+        # already defers to canvas.draw_idle. Stretch the interval to the EMA of
+        # that cost so slow figures drop frames instead of queueing redraws.
+        dt = time.perf_counter() - frame_cost["t0"]
+        frame_cost["ema"] = 0.9 * frame_cost["ema"] + 0.1 * dt
+        target = int(max(interval_ms, frame_cost["ema"] * 1000.0 * 1.1))
+        if target != anim.event_source.interval:
+            anim.event_source.interval = target
+
+    if not args.save:
+        anim.event_source.add_callback(adapt_interval)
+
     if args.save:
         out = pathlib.Path(args.save)
         if out.suffix.lower() == ".gif":
             anim.save(str(out), writer=PillowWriter(fps=max(1, int(fps*args.speed))))
         else:
             try:
-                from matplotlib.animation import FFMpegWriter
-                anim.save(str(out), writer=FFMpegWriter(fps=max(1, int(fps*args.speed))))
+                anim.save(str(out), writer=RawFFMpegWriter(fps=max(1, int(fps*args.speed))),
+                          dpi=args.dpi)
             except Exception as e:
                 alt = out.with_suffix(".gif")
                 print(f"FFmpeg unavailable ({e}); falling back to GIF: {alt}")
@@ -1,8 +1,34 @@
 import os, math, random, argparse, json, pathlib
 from dataclasses import dataclass
 from typing import List, Tuple, Dict
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
-from seq_writer import write_seq, SeqHeader
+from seq_writer import write_seq_arrays, SeqHeader
+
+try:
+    import blosc2
+    _HAS_BLOSC2 = True
+except Exception:
+    _HAS_BLOSC2 = False
+
+try:
+    import numba
+    _HAS_NUMBA = True
+except Exception:
+    _HAS_NUMBA = False
+
+# Threads each process may use inside the numba kernels and blosc2; pool
+# workers drop this to 1 so --workers processes don't oversubscribe the cores.
+_INNER_THREADS = os.cpu_count() or 1
+
+def _init_worker():
+    """ProcessPoolExecutor initializer: one thread per worker process."""
+    global _INNER_THREADS
+    _INNER_THREADS = 1
+    if _HAS_NUMBA:
+        numba.set_num_threads(1)
+    if _HAS_BLOSC2:
+        blosc2.set_nthreads(1)
 
 # ---------------------------
 # Helpers
@@ -28,11 +54,78 @@ class ObjectCfg:
     x: float; y: float  # center
     vx: float; vy: float
 
+@dataclass
+class ObjectsSoA:
+    """All objects of a clip as parallel arrays (one entry per object)."""
+    is_circle: np.ndarray   # bool; False = square
+    size_px: np.ndarray     # radius (circle) or half-side (square)
+    brightness: np.ndarray
+    x: np.ndarray; y: np.ndarray
+    vx: np.ndarray; vy: np.ndarray
+
+    @classmethod
+    def from_objects(cls, objs: List[ObjectCfg]) -> "ObjectsSoA":
+        col = lambda name: np.array([getattr(o, name) for o in objs], dtype=np.float64)
+        return cls(np.array([o.shape == "circle" for o in objs], dtype=bool),
+                   col("size_px"), col("brightness"),
+                   col("x"), col("y"), col("vx"), col("vy"))
+
+    def __len__(self):
+        return len(self.x)
+
+# Frames rendered per broadcast block; bounds the [chunk,N,H,W] temporaries
+RENDER_CHUNK = 64
+# Frame differences thresholded per block when extracting events
+EVENT_CHUNK = 256
+
+if _HAS_NUMBA:
+    # Objects are independent, so each one integrates its own T steps in parallel.
+    # No fastmath: positions must match the NumPy path bit for bit.
+    @numba.njit(cache=True, parallel=True, boundscheck=False)
+    def _integrate_trajectories_nb(x0, y0, vx0, vy0, size, T, dt, W, H):
+        n = x0.size
+        xs = np.empty((T, n)); ys = np.empty((T, n))
+        for i in numba.prange(n):
+            x, y, vx, vy, s = x0[i], y0[i], vx0[i], vy0[i], size[i]
+            for t in range(T):
+                xs[t, i] = x; ys[t, i] = y
+                x += vx * dt
+                y += vy * dt
+                if x - s < 0 and vx < 0: vx = -vx
+                if x + s > W-1 and vx > 0: vx = -vx
+                if y - s < 0 and vy < 0: vy = -vy
+                if y + s > H-1 and vy > 0: vy = -vy
+        return xs, ys
+
+def integrate_trajectories(x0, y0, vx, vy, size, T, dt, W, H):
+    """
+    Positions of every object at each of T frames, bouncing off the borders.
+    Returns (xs[T,N], ys[T,N]); frame t is rendered before the t-th step.
+    Uses a Numba kernel when numba is installed.
+    """
+    x, y = np.array(x0, dtype=np.float64), np.array(y0, dtype=np.float64)
+    vx, vy = np.array(vx, dtype=np.float64), np.array(vy, dtype=np.float64)
+    if _HAS_NUMBA:
+        return _integrate_trajectories_nb(x, y, vx, vy, np.asarray(size, dtype=np.float64),
+                                          int(T), float(dt), float(W), float(H))
+    xs = np.empty((T, x.size)); ys = np.empty((T, y.size))
+    for t in range(T):
+        xs[t] = x; ys[t] = y
+        x += vx * dt
+        y += vy * dt
+        # bounce on borders (low edge first, then high edge, as per-object checks did)
+        vx = np.where((x - size < 0) & (vx < 0), -vx, vx)
+        vx = np.where((x + size > W-1) & (vx > 0), -vx, vx)
+        vy = np.where((y - size < 0) & (vy < 0), -vy, vy)
+        vy = np.where((y + size > H-1) & (vy > 0), -vy, vy)
+    return xs, ys
+
 class EventWorld:
     def __init__(self, width:int, height:int, fps:float,
                  event_threshold:float=0.12,
                  polarity:str="both",
-                 bg_drift:float=0.0):
+                 bg_drift:float=0.0,
+                 frame_dtype:str="uint8"):
         self.W, self.H = width, height
         self.fps = fps
         self.dt = 1.0 / fps
@@ -41,37 +134,64 @@ class EventWorld:
         self.polarity = polarity
         self.bg_drift = bg_drift
         self.bg_level = 0.0
-
-    def _render(self, objs: List[ObjectCfg]) -> np.ndarray:
-        """Render grayscale frame in [0,1]."""
-        frame = np.full((self.H, self.W), float(clamp(self.bg_level, 0.0, 1.0)), dtype=np.float32)
-        yy, xx = np.mgrid[0:self.H, 0:self.W]
-        for o in objs:
-            if o.shape == "circle":
-                mask = (xx - o.x)**2 + (yy - o.y)**2 <= (o.size_px)**2
-            else:  # square
-                mask = (np.abs(xx - o.x) <= o.size_px) & (np.abs(yy - o.y) <= o.size_px)
-            # clamp() handles ndarray fine now
-            frame[mask] = clamp(frame[mask] + o.brightness, 0.0, 1.0)
-        return frame
-
-    def _step_objs(self, objs: List[ObjectCfg]):
-        for o in objs:
-            o.x += o.vx * self.dt
-            o.y += o.vy * self.dt
-            # bounce on borders
-            if o.x - o.size_px < 0 and o.vx < 0: o.vx *= -1
-            if o.x + o.size_px > self.W-1 and o.vx > 0: o.vx *= -1
-            if o.y - o.size_px < 0 and o.vy < 0: o.vy *= -1
-            if o.y + o.size_px > self.H-1 and o.vy > 0: o.vy *= -1
-        if self.bg_drift != 0.0:
-            self.bg_level = float(clamp(self.bg_level + self.bg_drift * self.dt, 0.0, 1.0))
+        # uint8 frames hold brightness*255; the diff runs in int16 against a
+        # threshold scaled the same way (a delta of d/255 fires when d >= thr*255)
+        assert frame_dtype in ("uint8","float32")
+        self.frame_dtype = np.dtype(frame_dtype)
+        self._scale = 255.0 if self.frame_dtype == np.uint8 else 1.0
+        # Pixel grid, broadcast against the object axis in _render
+        self._yy, self._xx = np.ogrid[0:self.H, 0:self.W]
+
+    def _render(self, xs: np.ndarray, ys: np.ndarray, objs: ObjectsSoA, bg: np.ndarray,
+                out: np.ndarray | None = None) -> np.ndarray:
+        """
+        Render a block of frames; xs, ys are [c,N] positions, bg is [c].
+        Writes into out ([c,H,W] slice of the clip buffer) when given, in the
+        world's frame dtype; otherwise returns float64 frames in [0,1].
+        """
+        c = xs.shape[0]
+        frames = np.zeros((c, self.H, self.W), dtype=np.float64)
+        mask = np.empty((c, self.H, self.W), dtype=bool)   # reused for every object
+        for i in range(len(objs)):
+            dx = self._xx - xs[:, i, None, None]   # [c,1,W]
+            dy = self._yy - ys[:, i, None, None]   # [c,H,1]
+            r = objs.size_px[i]
+            if objs.is_circle[i]:
+                np.less_equal(dx**2 + dy**2, r**2, out=mask)
+            else:
+                np.logical_and(np.abs(dx) <= r, np.abs(dy) <= r, out=mask)
+            # Brightness only adds, so clamping the sum equals clamping after each object
+            np.add(frames, objs.brightness[i], out=frames, where=mask)
+        frames += bg[:, None, None]
+        np.minimum(frames, 1.0, out=frames)
+        if out is None:
+            return frames
+        if self._scale != 1.0:
+            np.multiply(frames, self._scale, out=frames)
+            np.rint(frames, out=frames)
+        out[...] = frames
+        return out
+
+    def _bg_levels(self, T: int) -> np.ndarray:
+        """Background level of each of T frames; advances self.bg_level past them."""
+        bg = np.empty(T, dtype=np.float64)
+        for t in range(T):
+            bg[t] = float(clamp(self.bg_level, 0.0, 1.0))
+            if self.bg_drift != 0.0:
+                self.bg_level = float(clamp(self.bg_level + self.bg_drift * self.dt, 0.0, 1.0))
+        return bg
+
+    @staticmethod
+    def _events_in(mask: np.ndarray, t0: int) -> np.ndarray:
+        ev = np.argwhere(mask).astype(np.int32)
+        ev[:, 0] += t0
+        return ev
 
     def simulate(self, duration_s: float, make_objects_fn) -> Dict[str, np.ndarray]:
         """
         Returns:
           {
-            "frames": [T,H,W] float32,
+            "frames": [T,H,W] uint8 (brightness*255) or float32 in [0,1],
             "on":  [N_on, 3] int32   (t, y, x) with t in [1..T-1]
             "off": [N_off, 3] int32,
             "n_objects": int
@@ -79,32 +199,38 @@ class EventWorld:
         """
         steps = int(round(duration_s * self.fps))
         objs = make_objects_fn()
-        frames = []
-        for _ in range(steps):
-            frames.append(self._render(objs))
-            self._step_objs(objs)
-        frames = np.stack(frames, axis=0)  # [T,H,W]
-
-        prev = frames[0]
-        on_events = []
-        off_events = []
-        for t in range(1, steps):
-            cur = frames[t]
-            delta = cur - prev
+        if not isinstance(objs, ObjectsSoA):
+            objs = ObjectsSoA.from_objects(objs)
+        # Motion is ballistic, so integrate all positions first (cheap [N] arrays),
+        # then render time blocks into one preallocated buffer
+        xs, ys = integrate_trajectories(objs.x, objs.y, objs.vx, objs.vy, objs.size_px,
+                                        steps, self.dt, self.W, self.H)
+        bg = self._bg_levels(steps)
+        frames = np.empty((steps, self.H, self.W), dtype=self.frame_dtype)  # [T,H,W]
+        for t0 in range(0, steps, RENDER_CHUNK):
+            t1 = min(t0 + RENDER_CHUNK, steps)
+            self._render(xs[t0:t1], ys[t0:t1], objs, bg[t0:t1], out=frames[t0:t1])
+
+        # Events from frame differences, one time block at a time to bound the
+        # delta temporaries; argwhere yields (t,y,x) already in t, y, x order
+        thr = self.event_threshold * self._scale
+        on_parts = [np.zeros((0,3), dtype=np.int32)]
+        off_parts = [np.zeros((0,3), dtype=np.int32)]
+        for t0 in range(1, steps, EVENT_CHUNK):
+            t1 = min(t0 + EVENT_CHUNK, steps)
+            if self._scale != 1.0:
+                delta = frames[t0:t1].astype(np.int16) - frames[t0-1:t1-1]
+            else:
+                delta = frames[t0:t1] - frames[t0-1:t1-1]
             if self.polarity in ("both","on"):
-                on_mask = delta >= self.event_threshold
-                ys, xs = np.where(on_mask)
-                on_events.extend([(t, int(y), int(x)) for y, x in zip(ys, xs)])
+                on_parts.append(self._events_in(delta >= thr, t0))
             if self.polarity in ("both","off"):
-                off_mask = delta <= -self.event_threshold
-                ys, xs = np.where(off_mask)
-                off_events.extend([(t, int(y), int(x)) for y, x in zip(ys, xs)])
-            prev = cur
+                off_parts.append(self._events_in(delta <= -thr, t0))
 
         return {
-            "frames": frames.astype(np.float32),
-            "on": np.array(on_events, dtype=np.int32) if len(on_events) else np.zeros((0,3), dtype=np.int32),
-            "off": np.array(off_events, dtype=np.int32) if len(off_events) else np.zeros((0,3), dtype=np.int32),
+            "frames": frames,
+            "on": np.concatenate(on_parts),
+            "off": np.concatenate(off_parts),
             "n_objects": len(objs),
         }
 
@@ -112,22 +238,20 @@ class EventWorld:
 # Object sampling
 # ---------------------------
 
-def sample_objects(W,H,max_objects,size_min,size_max,speed_min,speed_max,bmin,bmax) -> List[ObjectCfg]:
-    n = random.randint(1, max_objects)
-    objs: List[ObjectCfg] = []
-    for _ in range(n):
-        shape = random.choice(["circle","square"])
-        sz = random.randint(size_min, size_max)
-        b = random.uniform(bmin, bmax)
-        # keep away from borders a bit
-        x = random.uniform(sz+1, W-1-sz-1)
-        y = random.uniform(sz+1, H-1-sz-1)
-        speed = random.uniform(speed_min, speed_max)
-        th = random.uniform(0, 2*math.pi)
-        vx = speed * math.cos(th)
-        vy = speed * math.sin(th)
-        objs.append(ObjectCfg(shape, sz, b, x, y, vx, vy))
-    return objs
+def sample_objects(W,H,max_objects,size_min,size_max,speed_min,speed_max,bmin,bmax,
+                   rng: np.random.Generator | None = None) -> ObjectsSoA:
+    # One vectorized draw per field
+    rng = rng if rng is not None else np.random.default_rng()
+    n = int(rng.integers(1, max_objects + 1))
+    is_circle = rng.integers(0, 2, n) == 0
+    sz = rng.integers(size_min, size_max + 1, n).astype(np.float64)
+    b = rng.uniform(bmin, bmax, n)
+    # keep away from borders a bit
+    x = rng.uniform(sz+1, W-1-sz-1)
+    y = rng.uniform(sz+1, H-1-sz-1)
+    speed = rng.uniform(speed_min, speed_max, n)
+    th = rng.uniform(0, 2*math.pi, n)
+    return ObjectsSoA(is_circle, sz, b, x, y, speed * np.cos(th), speed * np.sin(th))
 
 # ---------------------------
 # Mapping to sensory neurons / .seq rows
@@ -138,42 +262,123 @@ def sensory_id(x, y, pol, W, id_prefix="S"):
     idx = (y * W + x) * 2 + pol
     return f"{id_prefix}{idx}"
 
+def events_to_seq_arrays(on_events: np.ndarray, off_events: np.ndarray,
+                         bin_ms: int, fps: float, W: int,
+                         max_events_per_bin: int | None = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convert (t,y,x) with t in frame index into parallel (ticks, sensory indices) arrays,
+    sorted by (tick, sensory index).
+    1 tick = bin_ms milliseconds. time_ms = (t/fps)*1000 → tick = floor(time_ms/bin_ms).
+    """
+    ev = np.concatenate([on_events.reshape(-1,3), off_events.reshape(-1,3)]).astype(np.int64)
+    pol = np.repeat(np.array([0, 1], dtype=np.int64), [len(on_events), len(off_events)])
+    ticks = ((ev[:,0] / fps) * 1000.0 // bin_ms).astype(np.int64)
+    sids = (ev[:,1] * W + ev[:,2]) * 2 + pol   # same index as sensory_id()
+
+    order = np.lexsort((sids, ticks))
+    ticks, sids = ticks[order], sids[order]
+    if max_events_per_bin is not None and len(ticks):
+        # Rank of each row within its run of equal (tick, sid); keep the first N
+        new_run = np.ones(len(ticks), dtype=bool)
+        new_run[1:] = (ticks[1:] != ticks[:-1]) | (sids[1:] != sids[:-1])
+        starts = np.flatnonzero(new_run)
+        rank = np.arange(len(ticks)) - np.repeat(starts, np.diff(np.append(starts, len(ticks))))
+        keep = rank < max_events_per_bin
+        ticks, sids = ticks[keep], sids[keep]
+    return ticks, sids
+
 def events_to_seq_rows(on_events: np.ndarray, off_events: np.ndarray,
                        bin_ms: int, fps: float, W: int,
                        id_prefix: str, injection_scale: float,
                        max_events_per_bin: int | None = None) -> List[Tuple[int,str,float]]:
     """
-    Convert (t,y,x) with t in frame index into Glia .seq (<tick> <sid> <injection>).
-    1 tick = bin_ms milliseconds. time_ms = (t/fps)*1000 → tick = floor(time_ms/bin_ms).
+    Convert (t,y,x) with t in frame index into Glia .seq (<tick> <sid> <injection>) rows.
+    Tuple form of events_to_seq_arrays.
     """
-    rows: List[Tuple[int,str,float]] = []
-
-    def add(batch: np.ndarray, pol: int):
-        for (t,y,x) in batch.tolist():
-            time_ms = (t / fps) * 1000.0
-            tick = int(time_ms // bin_ms)
-            rows.append((tick, sensory_id(x, y, pol, W, id_prefix), float(injection_scale)))
-
-    if on_events.size:  add(on_events, 0)
-    if off_events.size: add(off_events, 1)
-
-    rows.sort(key=lambda r: (r[0], r[1]))
-    if max_events_per_bin is not None:
-        capped = []
-        counter: Dict[Tuple[int,str], int] = {}
-        for r in rows:
-            key = (r[0], r[1])
-            c = counter.get(key, 0)
-            if c < max_events_per_bin:
-                capped.append(r)
-                counter[key] = c + 1
-        rows = capped
-    return rows
+    ticks, sids = events_to_seq_arrays(on_events, off_events, bin_ms, fps, W, max_events_per_bin)
+    inj = float(injection_scale)
+    if not len(sids):
+        return []
+    # One formatted id per sensory index, shared by every event on that pixel/polarity
+    lut = np.array([f"{id_prefix}{i}" for i in range(int(sids.max()) + 1)], dtype=object)
+    return list(zip(ticks.tolist(), lut[sids].tolist(), [inj] * len(sids)))
+
+# ---------------------------
+# Clip dumps (npz/)
+# ---------------------------
+
+def save_clip(base: pathlib.Path, frames: np.ndarray, on: np.ndarray, off: np.ndarray,
+              compression: str = "none"):
+    """
+    Write <base>.npz. "none" stores arrays uncompressed (fastest), "zlib" is the
+    old np.savez_compressed, "blosc2" keeps on/off in the npz and packs frames
+    into a multithreaded Zstd+bitshuffle <base>.frames.b2 sidecar.
+    """
+    if compression == "zlib":
+        np.savez_compressed(base.with_suffix(".npz"), frames=frames, on=on, off=off)
+    elif compression == "blosc2":
+        if not _HAS_BLOSC2:
+            raise RuntimeError("blosc2 not available. Install it or use --npz-compression none/zlib.")
+        packed = blosc2.pack_array2(frames, cparams={"codec": blosc2.Codec.ZSTD,
+                                                     "filters": [blosc2.Filter.BITSHUFFLE],
+                                                     "nthreads": _INNER_THREADS})
+        base.with_name(base.name + ".frames.b2").write_bytes(packed)
+        np.savez(base.with_suffix(".npz"), on=on, off=off)
+    else:
+        np.savez(base.with_suffix(".npz"), frames=frames, on=on, off=off)
+
+def load_clip_arrays(run_dir: pathlib.Path, clip: int):
+    """Load (frames, on, off) for a clip written by save_clip, whatever the compression."""
+    base = pathlib.Path(run_dir) / "npz" / f"clip_{clip:05d}"
+    with np.load(base.with_suffix(".npz")) as data:
+        on, off = data["on"], data["off"]
+        frames = data["frames"] if "frames" in data.files else None
+    if frames is None:
+        if not _HAS_BLOSC2:
+            raise RuntimeError("This run stores frames with blosc2; install blosc2 to load it.")
+        frames = blosc2.unpack_array2(base.with_name(base.name + ".frames.b2").read_bytes())
+    return frames, on, off
 
 # ---------------------------
 # CLI
 # ---------------------------
 
+def generate_clip(job: Tuple[int, argparse.Namespace]) -> Tuple[int, int]:
+    """
+    Simulate one clip and write its npz/meta/seq files.
+    Returns (duration_ticks, n_objects) for the labels CSV.
+    """
+    clip_id, args = job
+    out = pathlib.Path(args.out)
+    # Per-clip stream: output does not depend on worker count or scheduling
+    rng = np.random.default_rng([args.seed, clip_id])
+    world = EventWorld(args.width, args.height, args.fps,
+                       args.event_threshold, args.polarity, args.bg_drift, args.dtype)
+
+    def make_objs():
+        return sample_objects(args.width, args.height, args.max_objects,
+                              args.size_min, args.size_max,
+                              args.speed_min, args.speed_max,
+                              args.brightness_min, args.brightness_max, rng)
+
+    sim = world.simulate(args.duration_s, make_objs)
+
+    # Save raw for visualization/debug
+    save_clip(out / "npz" / f"clip_{clip_id:05d}", sim["frames"], sim["on"], sim["off"],
+              args.npz_compression)
+    with open(out / "npz" / f"clip_{clip_id:05d}.meta.json", "w", encoding="utf-8") as f:
+        json.dump({"n_objects": sim["n_objects"]}, f)
+
+    # Export .seq
+    ticks, sids = events_to_seq_arrays(sim["on"], sim["off"],
+                                       args.bin_ms, args.fps, args.width,
+                                       args.max_events_per_bin)
+    duration_ticks = int(math.ceil((args.duration_s*1000.0) / args.bin_ms))
+    write_seq_arrays(str(out / "seq" / f"clip_{clip_id:05d}.seq"),
+                     SeqHeader(duration_ticks=duration_ticks, loop=False),
+                     ticks, sids, args.injection_scale, id_prefix=args.id_prefix)
+    return duration_ticks, sim["n_objects"]
+
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--out", type=str, required=True)
@@ -201,10 +406,15 @@ def main():
     ap.add_argument("--brightness-min", type=float, default=0.6)
     ap.add_argument("--brightness-max", type=float, default=1.0)
     ap.add_argument("--bg-drift", type=float, default=0.0)
+    ap.add_argument("--dtype", type=str, default="uint8", choices=["uint8","float32"],
+                    help="Frame storage: uint8 (brightness*255) or the original float32")
 
     # mapping/export
     ap.add_argument("--id-prefix", type=str, default="S")
     ap.add_argument("--injection-scale", type=float, default=200.0)
+    ap.add_argument("--npz-compression", type=str, default="none", choices=["none","zlib","blosc2"])
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                    help="Worker processes generating clips (1 = serial)")
 
     args = ap.parse_args()
     seed_all(args.seed)
@@ -217,40 +427,22 @@ def main():
     with open(out / "config.json", "w", encoding="utf-8") as f:
         json.dump(vars(args), f, indent=2)
 
-    world = EventWorld(args.width, args.height, args.fps,
-                       args.event_threshold, args.polarity, args.bg_drift)
-
     # labels header
     labels_rows = [("clip_id","tick","true_count")]
 
-    for clip_id in range(args.clips):
-        def make_objs():
-            return sample_objects(args.width, args.height, args.max_objects,
-                                  args.size_min, args.size_max,
-                                  args.speed_min, args.speed_max,
-                                  args.brightness_min, args.brightness_max)
-
-        sim = world.simulate(args.duration_s, make_objs)
-
-        # Save raw for visualization/debug
-        np.savez_compressed(out / "npz" / f"clip_{clip_id:05d}.npz",
-                            frames=sim["frames"], on=sim["on"], off=sim["off"])
-        with open(out / "npz" / f"clip_{clip_id:05d}.meta.json", "w", encoding="utf-8") as f:
-            json.dump({"n_objects": sim["n_objects"]}, f)
-
-        # Export .seq
-        rows = events_to_seq_rows(sim["on"], sim["off"],
-                                  args.bin_ms, args.fps, args.width,
-                                  args.id_prefix, args.injection_scale,
-                                  args.max_events_per_bin)
-        duration_ticks = int(math.ceil((args.duration_s*1000.0) / args.bin_ms))
-        write_seq(str(out / "seq" / f"clip_{clip_id:05d}.seq"),
-                  SeqHeader(duration_ticks=duration_ticks, loop=False),
-                  rows)
-
-        # Labels (count per tick, using the exact n_objects from this sim)
+    # Clips are independent; map() keeps results in clip order
+    jobs = [(clip_id, args) for clip_id in range(args.clips)]
+    if args.workers > 1 and args.clips > 1:
+        with ProcessPoolExecutor(max_workers=min(args.workers, args.clips),
+                                 initializer=_init_worker) as ex:
+            results = list(ex.map(generate_clip, jobs))
+    else:
+        results = [generate_clip(job) for job in jobs]
+
+    # Labels (count per tick, using the exact n_objects from each sim)
+    for clip_id, (duration_ticks, n_objects) in enumerate(results):
         for tick in range(duration_ticks):
-            labels_rows.append((str(clip_id), str(tick), str(sim["n_objects"])))
+            labels_rows.append((str(clip_id), str(tick), str(n_objects)))
 
     # Write labels CSV
     import csv
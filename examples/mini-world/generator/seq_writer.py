@@ -1,19 +1,54 @@
 from dataclasses import dataclass
-from typing import Iterable, Tuple
+from typing import Iterable, Tuple, Sequence, Union
+import numpy as np
 
 @dataclass(frozen=True)
 class SeqHeader:
     duration_ticks: int
     loop: bool = False
 
+def _header_text(header: SeqHeader) -> str:
+    return f"DURATION {header.duration_ticks}\nLOOP {str(header.loop).lower()}\n\n"
+
 def write_seq(path: str, header: SeqHeader, rows: Iterable[Tuple[int, str, float]]):
     # Write a .seq file:
     # DURATION <ticks>
     # LOOP <true|false>
     # <tick> <sensory id> <injection>
+    # Slow path for tuple rows; write_seq_arrays is the fast one.
+    body = "".join([f"{tick} {sid} {inj:.6f}\n" for tick, sid, inj in rows])
     with open(path, "w", encoding="utf-8") as f:
-        f.write(f"DURATION {header.duration_ticks}\n")
-        f.write(f"LOOP {str(header.loop).lower()}\n\n")
-        for tick, sid, inj in rows:
-            f.write(f"{tick} {sid} {inj:.6f}\n")
+        f.write(_header_text(header))
+        f.write(body)
 
+def write_seq_arrays(path: str, header: SeqHeader, ticks: np.ndarray,
+                     sids: Sequence, injs: Union[float, np.ndarray], id_prefix: str = ""):
+    """
+    Write a .seq file from parallel columns in one buffered write.
+    sids may be id strings or integer indices (rendered as id_prefix + index);
+    injs may be a scalar, which is then formatted only once.
+    """
+    ticks = np.asarray(ticks).tolist()
+    scalar = np.ndim(injs) == 0
+    if isinstance(sids, np.ndarray) and sids.dtype.kind in "iu" and len(sids):
+        # Integer indices live in [0, 2*H*W): format each id once through a
+        # lookup table instead of once per event
+        inj = f" {float(injs):.6f}\n" if scalar else ""
+        lut = np.array([f" {id_prefix}{i}{inj}" for i in range(int(sids.max()) + 1)], dtype=object)
+        tails = lut[sids].tolist()
+        if scalar:
+            body = "".join([f"{t}{tail}" for t, tail in zip(ticks, tails)])
+        else:
+            body = "".join([f"{t}{tail} {v:.6f}\n"
+                            for t, tail, v in zip(ticks, tails, np.asarray(injs).tolist())])
+    else:
+        sids = sids.tolist() if isinstance(sids, np.ndarray) else list(sids)
+        if scalar:
+            inj = f"{float(injs):.6f}"
+            body = "".join([f"{t} {id_prefix}{s} {inj}\n" for t, s in zip(ticks, sids)])
+        else:
+            body = "".join([f"{t} {id_prefix}{s} {v:.6f}\n"
+                            for t, s, v in zip(ticks, sids, np.asarray(injs).tolist())])
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(_header_text(header))
+        f.write(body)
@@ -1,5 +1,6 @@
 import argparse, pathlib, numpy as np
 import matplotlib.pyplot as plt
+from event_world import load_clip_arrays
 
 def main():
     ap = argparse.ArgumentParser()
@@ -7,14 +8,14 @@ def main():
     ap.add_argument("--clip", type=int, default=0)
     args = ap.parse_args()
     indir = pathlib.Path(args.indir)
-    data = np.load(indir/"npz"/f"clip_{args.clip:05d}.npz")
-    frames, on, off = data["frames"], data["on"], data["off"]
+    frames, on, off = load_clip_arrays(indir, args.clip)
     T,H,W = frames.shape; mid = T//2
+    vmax = 255 if frames.dtype == np.uint8 else 1  # uint8 runs store brightness*255
 
     plt.figure()
     plt.title(f"Frames t=0 and t={mid}")
-    plt.subplot(1,2,1); plt.imshow(frames[0], vmin=0, vmax=1); plt.axis("off")
-    plt.subplot(1,2,2); plt.imshow(frames[mid], vmin=0, vmax=1); plt.axis("off")
+    plt.subplot(1,2,1); plt.imshow(frames[0], vmin=0, vmax=vmax); plt.axis("off")
+    plt.subplot(1,2,2); plt.imshow(frames[mid], vmin=0, vmax=vmax); plt.axis("off")
     plt.tight_layout(); plt.show()
 
     def raster(events, title):
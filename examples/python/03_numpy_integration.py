@@ -114,18 +114,15 @@ to_indices = rng.randint(0, n_neurons, size=n_connections)
 
 # Create weight values (80% excitatory, 20% inhibitory)
 random_weights = rng.uniform(-0.5, 2.0, size=n_connections)
-random_weights[random_weights < 0.2] = -random_weights[random_weights < 0.2]  # Make some inhibitory
-
-# Convert indices to neuron IDs
-from_neuron_ids = [neuron_ids[i] for i in from_indices]
-to_neuron_ids = [neuron_ids[i] for i in to_indices]
+np.negative(random_weights, out=random_weights, where=random_weights < 0.2)  # Make some inhibitory
 
 print(f"   Created {n_connections} random connections")
 print(f"   Weight range: [{random_weights.min():.3f}, {random_weights.max():.3f}]")
 print()
 
 # Apply to network
-net.set_weights(from_neuron_ids, to_neuron_ids, random_weights)
+# Indices are resolved to neuron IDs in C++ (no per-edge Python lists)
+net.set_weights_by_index(from_indices, to_indices, random_weights)
 print(f"   Applied weights to network")
 print(f"   Network now has {net.num_connections} connections")
 print()
@@ -165,20 +162,18 @@ print()
 # ========== Batch Operations ==========
 print("[Step 8] Batch operations on state...")
 
-# Simulate and collect states over time
-states_over_time = []
+# Simulate and collect states over time into one preallocated
+# (timesteps, neurons) array; get_values() writes each row in place
 n_steps = 10
+state_matrix = np.empty((n_steps, net.num_neurons), dtype=np.float32)
 
 for step in range(n_steps):
     if step % 3 == 0:
         net.inject_array(np.array([100.0, 50.0, 75.0]))
     
     net.step()
-    _, values, _, _ = net.get_state()
-    states_over_time.append(values.copy())
+    net.get_values(out=state_matrix[step])
 
-# Stack into 2D array: (timesteps, neurons)
-state_matrix = np.vstack(states_over_time)
 print(f"   Collected states shape: {state_matrix.shape}")
 print(f"   (timesteps × neurons)")
 print()
@@ -54,10 +54,7 @@ from_indices = rng.randint(0, n_neurons, size=n_connections)
 to_indices = rng.randint(0, n_neurons, size=n_connections)
 weights = rng.uniform(-1.0, 2.0, size=n_connections)
 
-from_ids = [neuron_ids[i] for i in from_indices]
-to_ids = [neuron_ids[i] for i in to_indices]
-
-net.set_weights(from_ids, to_ids, weights)
+net.set_weights_by_index(from_indices, to_indices, weights)
 
 print(f"   Created network: {net}")
 print(f"   Connections: {net.num_connections}")
@@ -166,29 +163,24 @@ try:
     import matplotlib.pyplot as plt
     
     # Get weight statistics over time (simulate training)
-    weight_history = []
+    # One row per epoch: (mean, std, max, min)
+    stats = np.empty((20, 4))
+    n_rows = 0
     for epoch in range(20):
         from_ids, to_ids, weights = net.get_weights()
         if len(weights) > 0:
-            weight_history.append({
-                'mean': weights.mean(),
-                'std': weights.std(),
-                'max': weights.max(),
-                'min': weights.min()
-            })
+            stats[n_rows] = (weights.mean(), weights.std(), weights.max(), weights.min())
+            n_rows += 1
+    stats = stats[:n_rows]
     
     # Plot
     fig, ax = plt.subplots(figsize=(10, 6))
     
-    epochs = list(range(len(weight_history)))
-    means = [h['mean'] for h in weight_history]
-    stds = [h['std'] for h in weight_history]
+    epochs = np.arange(n_rows)
+    means, stds = stats[:, 0], stats[:, 1]
     
     ax.plot(epochs, means, 'b-', linewidth=2, label='Mean')
-    ax.fill_between(epochs,
-                     [m - s for m, s in zip(means, stds)],
-                     [m + s for m, s in zip(means, stds)],
-                     alpha=0.3, color='b')
+    ax.fill_between(epochs, means - stds, means + stds, alpha=0.3, color='b')
     
     ax.set_xlabel('Epoch')
     ax.set_ylabel('Weight Value')
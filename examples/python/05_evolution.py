@@ -36,9 +36,7 @@ from_indices = rng.randint(0, len(neuron_ids), size=n_init_connections)
 to_indices = rng.randint(0, len(neuron_ids), size=n_init_connections)
 init_weights = rng.uniform(-0.5, 1.5, size=n_init_connections)
 
-from_ids = [neuron_ids[i] for i in from_indices]
-to_ids = [neuron_ids[i] for i in to_indices]
-net.set_weights(from_ids, to_ids, init_weights)
+net.set_weights_by_index(from_indices, to_indices, init_weights)
 
 # Save baseline
 net.save(baseline_file)
@@ -53,6 +51,11 @@ print("[Step 2] Creating dataset...")
 # Class 0: S0 high, S1 low → Target N0
 # Class 1: S0 low, S1 high → Target N1
 
+class0_inputs = {"S0": 120.0, "S1": 40.0}
+class1_inputs = {"S0": 40.0, "S1": 120.0}
+class_inputs = (class0_inputs, class1_inputs)  # indexed by class (i & 1)
+class_targets = ("N0", "N1")
+
 train_episodes = []
 val_episodes = []
 
@@ -60,32 +63,24 @@ for i in range(40):  # Training data
     ep = glia.EpisodeData()
     seq = glia.InputSequence()
     
-    is_class0 = (i % 2 == 0)
+    c = i & 1  # even -> class 0, odd -> class 1
     
-    for t in range(15):
-        seq.add_timestep({
-            "S0": 120.0 if is_class0 else 40.0,
-            "S1": 40.0 if is_class0 else 120.0,
-        })
+    seq.add_constant_timesteps(15, class_inputs[c])
     
     ep.seq = seq
-    ep.target_id = "N0" if is_class0 else "N1"
+    ep.target_id = class_targets[c]
     train_episodes.append(ep)
 
 for i in range(10):  # Validation data
     ep = glia.EpisodeData()
     seq = glia.InputSequence()
     
-    is_class0 = (i % 2 == 0)
+    c = i & 1  # even -> class 0, odd -> class 1
     
-    for t in range(15):
-        seq.add_timestep({
-            "S0": 120.0 if is_class0 else 40.0,
-            "S1": 40.0 if is_class0 else 120.0,
-        })
+    seq.add_constant_timesteps(15, class_inputs[c])
     
     ep.seq = seq
-    ep.target_id = "N0" if is_class0 else "N1"
+    ep.target_id = class_targets[c]
     val_episodes.append(ep)
 
 print(f"   Training episodes: {len(train_episodes)}")
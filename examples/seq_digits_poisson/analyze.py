@@ -1,80 +1,274 @@
 import argparse
 import csv
+import functools
+import multiprocessing
 import os
-from collections import defaultdict
+import re
+import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
+import matplotlib
+matplotlib.use('Agg')  # files only; no GUI backend needed
 import matplotlib.pyplot as plt
 import numpy as np
 
+try:
+    import numba
+    _HAS_NUMBA = True
+except Exception:
+    _HAS_NUMBA = False
 
-def read_predictions_csv(path):
-    rows = []
+
+def read_predictions_csv(path, columns=('true', 'pred', 'filename')):
+    # Columnar read: one string array per column instead of a dict per row
     with open(path, 'r', newline='') as f:
-        r = csv.DictReader(f)
-        for row in r:
-            rows.append(row)
-    return rows
+        r = csv.reader(f)
+        header = next(r, [])
+        data = [row for row in r if row]
+    preds = {}
+    for name in columns:
+        i = header.index(name) if name in header else len(header)
+        preds[name] = np.array([row[i] if i < len(row) else '' for row in data], dtype=str)
+    return preds
+
+
+# Optional O/o prefix, then what int() accepts (sign, surrounding whitespace)
+_ID_RE = re.compile(r'[Oo]?\s*([+-]?\d+)\s*')
 
 
 def id_to_label(s):
-    if s and s[0] in ('O','o'):
+    m = _ID_RE.fullmatch(s) if isinstance(s, str) else None
+    return int(m.group(1)) if m else -1
+
+
+def id_to_labels(ids):
+    # Array form of id_to_label: each distinct id is parsed once
+    uniq, inv = np.unique(np.asarray(ids, dtype=str), return_inverse=True)
+    return np.array([id_to_label(s) for s in uniq.tolist()], dtype=np.int64)[inv.ravel()]
+
+
+def build_confusion(preds, num_classes=10):
+    t = id_to_labels(preds['true'])
+    p = id_to_labels(preds['pred'])
+    ok = (t >= 0) & (t < num_classes) & (p >= 0) & (p < num_classes)
+    cm = np.bincount(t[ok] * num_classes + p[ok], minlength=num_classes * num_classes)
+    return cm.reshape(num_classes, num_classes).astype(np.int64)
+
+
+# "<tick> S<i> <value>" or "EVENT <tick> S<i> <value>" -> b"<i> <value>";
+# DURATION/LOOP headers, comments and non-S ids never match
+_SEQ_EVENT_RE = re.compile(rb'^[ \t]*(?:EVENT[ \t]+\S+|\d+)[ \t]+S((?:0|[1-9]\d*)[ \t]+\S+)', re.M)
+
+
+# ------------------------------
+# Numba seq scanner (optional, --jit)
+# ------------------------------
+if _HAS_NUMBA:
+    # Exact powers of ten: m * 10**k and m / 10**k are correctly rounded for
+    # m < 2**53 and k <= 22, so results match float() bit for bit
+    _POW10 = np.array([10.0 ** k for k in range(23)])
+
+    @numba.njit(cache=True)
+    def _is_blank(c):
+        return c == 32 or c == 9
+
+    @numba.njit(cache=True)
+    def _is_space(c):
+        return c == 32 or c == 9 or c == 10 or c == 13 or c == 11 or c == 12
+
+    @numba.njit(cache=True)
+    def _is_digit(c):
+        return 48 <= c <= 57
+
+    @numba.njit(cache=True)
+    def _parse_value(buf, p, e):
+        # [+-]?(d+(.d*)?|.d+)([eE][+-]?d+)? -> (ok, value); anything else is not ok
+        neg = False
+        if p < e and (buf[p] == 43 or buf[p] == 45):
+            neg = buf[p] == 45
+            p += 1
+        m = 0
+        sig = 0
+        frac = 0
+        n_digits = 0
+        while p < e and _is_digit(buf[p]):
+            if m > 0 or buf[p] != 48:
+                sig += 1
+            m = m * 10 + (buf[p] - 48) if sig <= 15 else m
+            n_digits += 1
+            p += 1
+        if p < e and buf[p] == 46:
+            p += 1
+            while p < e and _is_digit(buf[p]):
+                if m > 0 or buf[p] != 48:
+                    sig += 1
+                m = m * 10 + (buf[p] - 48) if sig <= 15 else m
+                frac += 1
+                n_digits += 1
+                p += 1
+        if n_digits == 0 or sig > 15:
+            return False, 0.0
+        exp = 0
+        if p < e and (buf[p] == 101 or buf[p] == 69):
+            p += 1
+            eneg = False
+            if p < e and (buf[p] == 43 or buf[p] == 45):
+                eneg = buf[p] == 45
+                p += 1
+            if p == e:
+                return False, 0.0
+            while p < e and _is_digit(buf[p]):
+                if exp < 1000:
+                    exp = exp * 10 + (buf[p] - 48)
+                p += 1
+            if eneg:
+                exp = -exp
+        if p != e:
+            return False, 0.0
+        k = exp - frac
+        if m == 0:
+            v = 0.0
+        elif 0 <= k <= 22:
+            v = m * _POW10[k]
+        elif -22 <= k < 0:
+            v = m / _POW10[-k]
+        else:
+            return False, 0.0
+        return True, -v if neg else v
+
+    @numba.njit(cache=True)
+    def _seq_grid_nb(buf, n, out):
+        # Same matches as _SEQ_EVENT_RE, one line at a time; False means a value
+        # needs the general parser and the caller should fall back
+        L = buf.size
+        i = 0
+        while i < L:
+            e = i
+            while e < L and buf[e] != 10:
+                e += 1
+            p = i
+            i = e + 1
+            while p < e and _is_blank(buf[p]):
+                p += 1
+            if (p + 5 <= e and buf[p] == 69 and buf[p + 1] == 86 and buf[p + 2] == 69
+                    and buf[p + 3] == 78 and buf[p + 4] == 84):
+                p += 5
+                if p == e or not _is_blank(buf[p]):
+                    continue
+                while p < e and _is_blank(buf[p]):
+                    p += 1
+                if p == e or _is_space(buf[p]):
+                    continue
+                while p < e and not _is_space(buf[p]):
+                    p += 1
+            else:
+                if p == e or not _is_digit(buf[p]):
+                    continue
+                while p < e and _is_digit(buf[p]):
+                    p += 1
+            if p == e or not _is_blank(buf[p]):
+                continue
+            while p < e and _is_blank(buf[p]):
+                p += 1
+            if p == e or buf[p] != 83:
+                continue
+            p += 1
+            if p == e or not _is_digit(buf[p]):
+                continue
+            sid = 0
+            if buf[p] == 48:
+                p += 1
+            else:
+                while p < e and _is_digit(buf[p]):
+                    sid = sid * 10 + (buf[p] - 48) if sid < n else sid
+                    p += 1
+            if p == e or not _is_blank(buf[p]):
+                continue
+            while p < e and _is_blank(buf[p]):
+                p += 1
+            a = p
+            while p < e and not _is_space(buf[p]):
+                p += 1
+            if p == a:
+                continue
+            ok, v = _parse_value(buf, a, p)
+            if not ok:
+                return False
+            if sid < n:
+                out[sid] += v
+        return True
+
+
+def _sum_events_rowwise(events, n):
+    """Per-row fallback: sum values in file order, stopping at the first unparsable one"""
+    sums = np.zeros(n, dtype=np.float64)
+    for event in events:
+        sid, value = event.split()
         try:
-            return int(s[1:])
-        except Exception:
-            return -1
-    try:
-        return int(s)
-    except Exception:
-        return -1
+            v = float(value)
+        except ValueError:
+            break
+        sid = int(sid)
+        if sid < n:
+            sums[sid] += v
+    return sums
 
 
-def build_confusion(rows, num_classes=10):
-    cm = np.zeros((num_classes, num_classes), dtype=np.int64)
-    for row in rows:
-        t = id_to_label(row.get('true', ''))
-        p = id_to_label(row.get('pred', ''))
-        if 0 <= t < num_classes and 0 <= p < num_classes:
-            cm[t, p] += 1
-    return cm
+def load_seq_grid(seq_path, size=8, jit=False):
+    # Shared cached array: treat as read-only
+    return _load_seq_grid_cached(seq_path, size, jit and _HAS_NUMBA)
 
 
-def load_seq_grid(seq_path, size=8):
-    vals = defaultdict(float)
+@functools.lru_cache(maxsize=256)
+def _load_seq_grid_cached(seq_path, size, jit):
+    n = size * size
+    grid = np.zeros((n,), dtype=np.float32)
     try:
-        with open(seq_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                toks = line.split()
-                if toks[0] == 'EVENT':
-                    # EVENT tick id value
-                    if len(toks) >= 4:
-                        sid = toks[2]
-                        v = float(toks[3])
-                        vals[sid] += v
-                else:
-                    # tick id value
-                    if len(toks) >= 3 and toks[0].isdigit():
-                        sid = toks[1]
-                        v = float(toks[2])
-                        vals[sid] += v
+        with open(seq_path, 'rb') as f:
+            data = f.read()
+        sums = np.zeros(n, dtype=np.float64)
+        if jit and _seq_grid_nb(np.frombuffer(data, dtype=np.uint8), n, sums):
+            grid[:] = sums
+        else:
+            events = _SEQ_EVENT_RE.findall(data)
+            try:
+                # One C-level float parse of all (id, value) pairs
+                pairs = np.array(b' '.join(events).split(), dtype=np.float64).reshape(-1, 2)
+            except ValueError:
+                grid[:] = _sum_events_rowwise(events, n)
+            else:
+                keep = pairs[:, 0] < n  # mask before the cast so huge ids cannot wrap
+                grid[:] = np.bincount(pairs[keep, 0].astype(np.int64), weights=pairs[keep, 1], minlength=n)
     except Exception:
         pass
-    grid = np.zeros((size * size,), dtype=np.float32)
-    for i in range(size * size):
-        key = f'S{i}'
-        grid[i] = vals.get(key, 0.0)
     # normalize per-sample
     if grid.max() > 0:
         grid = grid / grid.max()
-    return grid.reshape(size, size)
+    grid = grid.reshape(size, size)
+    grid.flags.writeable = False
+    return grid
+
+
+_FIG = None
+
+
+def _fresh_figure(figsize):
+    # One Figure reused by every plot: clf() + resize instead of creating and
+    # closing a new figure (and its canvas/renderer) each time
+    global _FIG
+    if _FIG is None:
+        _FIG = plt.figure(figsize=figsize)
+    else:
+        _FIG.clf()
+        _FIG.set_size_inches(figsize)
+    return _FIG
 
 
 def plot_confusion(cm, out_path):
-    fig, ax = plt.subplots(figsize=(6, 5))
+    fig = _fresh_figure((6, 5))
+    ax = fig.add_subplot()
     im = ax.imshow(cm, cmap='Blues')
-    plt.colorbar(im, ax=ax, fraction=0.046, pad=0.04)
+    fig.colorbar(im, ax=ax, fraction=0.046, pad=0.04)
     ax.set_xlabel('Predicted')
     ax.set_ylabel('True')
     ax.set_xticks(range(cm.shape[1]))
@@ -82,68 +276,64 @@ def plot_confusion(cm, out_path):
     ax.set_title('Confusion Matrix')
     fig.tight_layout()
     fig.savefig(out_path, dpi=150)
-    plt.close(fig)
-
-
-def plot_examples_grid(rows, root_dir, out_path, correct=True, max_examples=40, grid_size=8):
-    sel = []
-    for row in rows:
-        t = row.get('true', '')
-        p = row.get('pred', '')
-        ok = (t == p)
-        if ok == correct:
-            sel.append(row)
-        if len(sel) >= max_examples:
-            break
-    if not sel:
+
+
+def plot_examples_grid(preds, root_dir, out_path, correct=True, max_examples=40, grid_size=8, jit=False):
+    sel = np.flatnonzero((preds['true'] == preds['pred']) == correct)[:max_examples]
+    if not sel.size:
         return
+    true_labels = id_to_labels(preds['true'][sel])
+    pred_labels = id_to_labels(preds['pred'][sel])
+    # Prefetch every grid before building the figure; file reads release the GIL
+    paths = [os.path.join(root_dir, 'test', fname) for fname in preds['filename'][sel].tolist()]
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        grids = list(ex.map(lambda p: load_seq_grid(p, size=grid_size, jit=jit), paths))
     cols = 10
     rows_n = int(np.ceil(len(sel) / cols))
-    fig, axes = plt.subplots(rows_n, cols, figsize=(cols * 1.4, rows_n * 1.4))
-    if rows_n == 1:
-        axes = np.array([axes])
-    for idx, row in enumerate(sel):
-        r = idx // cols
-        c = idx % cols
-        ax = axes[r, c]
-        fname = row.get('filename', '')
-        seqp = os.path.join(root_dir, 'test', fname)
-        grid = load_seq_grid(seqp, size=grid_size)
-        ax.imshow(grid, cmap='gray', vmin=0, vmax=1)
-        ax.set_axis_off()
-        t = id_to_label(row.get('true', ''))
-        p = id_to_label(row.get('pred', ''))
-        ax.set_title(f'{t}->{p}', fontsize=8)
-    # turn off remaining axes
-    for idx in range(len(sel), rows_n * cols):
-        r = idx // cols
-        c = idx % cols
-        axes[r, c].set_axis_off()
+    # Tile every grid into one mosaic image: a single Axes and imshow instead
+    # of one per example. NaN gutters render blank; each tile has a label band above.
+    label_h = 3
+    pitch_x = pitch_y = grid_size + label_h   # square cells, like the old 1.4in axes
+    mosaic = np.full((rows_n * pitch_y, cols * pitch_x - label_h), np.nan, dtype=np.float32)
+    fig = _fresh_figure((cols * 1.4, rows_n * 1.4))
+    ax = fig.add_subplot()
+    for idx, grid in enumerate(grids):
+        r, c = divmod(idx, cols)
+        y0, x0 = r * pitch_y + label_h, c * pitch_x
+        mosaic[y0:y0 + grid_size, x0:x0 + grid_size] = grid
+        ax.text(x0 + (grid_size - 1) / 2, y0 - 1, f'{true_labels[idx]}->{pred_labels[idx]}',
+                fontsize=8, ha='center', va='center')
+    ax.imshow(mosaic, cmap='gray', vmin=0, vmax=1)
+    ax.set_axis_off()
     title = 'Correct' if correct else 'Misclassified'
     fig.suptitle(f'{title} examples', fontsize=12)
     fig.tight_layout(rect=[0, 0.03, 1, 0.95])
     fig.savefig(out_path, dpi=150)
-    plt.close(fig)
 
 
 def read_metrics_csv(path):
-    xs, loss, acc = [], [], []
+    # One C-level parse into a structured array; missing columns keep the old
+    # defaults (epoch = 1..N, loss/accuracy = 0)
     try:
-        with open(path, 'r', newline='') as f:
-            r = csv.DictReader(f)
-            for row in r:
-                xs.append(int(row.get('epoch', len(xs) + 1)))
-                loss.append(float(row.get('loss', 0.0)))
-                acc.append(float(row.get('accuracy', 0.0)))
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')  # header-only files warn "Empty input"
+            data = np.genfromtxt(path, delimiter=',', names=True, dtype=np.float64,
+                                 encoding='utf-8', ndmin=1)
     except Exception:
-        pass
-    return np.array(xs), np.array(loss), np.array(acc)
+        return np.array([], dtype=np.int64), np.array([]), np.array([])
+    names = data.dtype.names or ()
+    n = data.shape[0]
+    xs = data['epoch'].astype(np.int64) if 'epoch' in names else np.arange(1, n + 1)
+    loss = data['loss'] if 'loss' in names else np.zeros(n)
+    acc = data['accuracy'] if 'accuracy' in names else np.zeros(n)
+    return xs, loss, acc
 
 
 def plot_metrics(xs, loss, acc, out_path):
     if xs.size == 0:
         return
-    fig, ax1 = plt.subplots(figsize=(7, 4))
+    fig = _fresh_figure((7, 4))
+    ax1 = fig.add_subplot()
     l1 = ax1.plot(xs, loss, 'r-', label='Loss')
     ax1.set_xlabel('Epoch')
     ax1.set_ylabel('Loss', color='r')
@@ -155,7 +345,6 @@ def plot_metrics(xs, loss, acc, out_path):
     ax1.legend(ln, labs, loc='best')
     fig.tight_layout()
     fig.savefig(out_path, dpi=150)
-    plt.close(fig)
 
 
 def main():
@@ -164,23 +353,44 @@ def main():
     ap.add_argument('--pred_csv', required=True)
     ap.add_argument('--metrics_csv', default='')
     ap.add_argument('--out_dir', default='.')
+    ap.add_argument('--jit', action='store_true', help='Parse .seq files with the Numba scanner (requires numba).')
+    ap.add_argument('--parallel', action='store_true',
+                    help='Render the two example grids in spawned worker processes (pays off with larger --root/max_examples).')
     args = ap.parse_args()
 
+    if args.jit and not _HAS_NUMBA:
+        print('numba not available; falling back to the regex parser.')
+
     os.makedirs(args.out_dir, exist_ok=True)
 
-    rows = read_predictions_csv(args.pred_csv)
-    cm = build_confusion(rows)
+    preds = read_predictions_csv(args.pred_csv)
+    cm = build_confusion(preds)
     total = cm.sum()
     acc = (np.trace(cm) / total) if total > 0 else 0.0
 
-    plot_confusion(cm, os.path.join(args.out_dir, 'confusion_matrix.png'))
-    plot_examples_grid(rows, args.root, os.path.join(args.out_dir, 'correct_grid.png'), correct=True)
-    plot_examples_grid(rows, args.root, os.path.join(args.out_dir, 'misclassified_grid.png'), correct=False)
+    grid_jobs = [(os.path.join(args.out_dir, 'correct_grid.png'), True),
+                 (os.path.join(args.out_dir, 'misclassified_grid.png'), False)]
+    pool = None
+    if not args.parallel:
+        for out_path, correct in grid_jobs:
+            plot_examples_grid(preds, args.root, out_path, correct=correct, jit=args.jit)
+    else:
+        # The two grids share no state: render them in spawned workers (fork is
+        # not safe with matplotlib on macOS) while this process does the rest
+        pool = ProcessPoolExecutor(max_workers=len(grid_jobs), mp_context=multiprocessing.get_context('spawn'))
+        futures = [pool.submit(plot_examples_grid, preds, args.root, out_path, correct, jit=args.jit)
+                   for out_path, correct in grid_jobs]
 
+    plot_confusion(cm, os.path.join(args.out_dir, 'confusion_matrix.png'))
     if args.metrics_csv:
         xs, loss, acc_hist = read_metrics_csv(args.metrics_csv)
         plot_metrics(xs, loss, acc_hist, os.path.join(args.out_dir, 'metrics_plot.png'))
 
+    if pool is not None:
+        with pool:
+            for fut in futures:
+                fut.result()
+
     print(f'Confusion matrix saved to: {os.path.join(args.out_dir, "confusion_matrix.png")}')
     print(f'Example grids saved to: {os.path.join(args.out_dir, "correct_grid.png")}, {os.path.join(args.out_dir, "misclassified_grid.png")}')
     if args.metrics_csv:
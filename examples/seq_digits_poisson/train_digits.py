@@ -15,8 +15,15 @@ import numpy as np
 import argparse
 import csv
 import json
+import sys
 from pathlib import Path
 
+try:
+    import orjson  # optional: faster JSON, serializes NumPy arrays directly
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
 
 def load_dataset(data_root, split='train'):
     """
@@ -34,7 +41,8 @@ def load_dataset(data_root, split='train'):
     if not labels_file.exists():
         raise FileNotFoundError(f"Labels file not found: {labels_file}")
     
-    episodes = []
+    paths = []
+    labels = []
     
     # Read labels
     with open(labels_file, 'r') as f:
@@ -47,65 +55,76 @@ def load_dataset(data_root, split='train'):
             if not seq_path.exists():
                 print(f"Warning: Sequence file not found: {seq_path}")
                 continue
-            
-            # Load sequence
+            paths.append(seq_path)
+            labels.append(label)
+    
+    # Load every sequence in one C++ call; if any file fails to parse, redo
+    # them one at a time so only the bad ones are skipped
+    try:
+        loaded = list(zip(glia.load_sequence_files(paths), labels))
+    except Exception:
+        loaded = []
+        for seq_path, label in zip(paths, labels):
             try:
                 seq = glia.InputSequence()
-                seq.load_from_file(str(seq_path))
+                ok = seq.load_from_file(str(seq_path))
             except Exception as e:
                 print(f"Warning: Failed to load {seq_path}: {e}")
                 continue
-            
-            # Create episode
-            ep = glia.EpisodeData()
-            ep.seq = seq
-            ep.target_id = f'O{label}'  # Output neurons O0-O9
-            episodes.append(ep)
+            if not ok:
+                print(f"Warning: Failed to load {seq_path}")
+                continue
+            loaded.append((seq, label))
+    
+    episodes = []
+    for seq, label in loaded:
+        # Create episode
+        ep = glia.EpisodeData()
+        ep.seq = seq
+        ep.target_id = f'O{label}'  # Output neurons O0-O9
+        episodes.append(ep)
     
     print(f"Loaded {len(episodes)} episodes from {split_dir}")
     return glia.Dataset(episodes)
 
 
-def evaluate_model(net, dataset, config, verbose=False):
-    """Evaluate network and return accuracy, loss, predictions"""
-    trainer = glia.Trainer(net, config)
-    correct = 0
-    predictions = []
-    
-    for ep in dataset:
-        metrics = trainer.evaluate(ep.seq, config)
-        predicted = metrics.winner_id
-        target = ep.target_id
-        is_correct = (predicted == target)
-        correct += int(is_correct)
-        
-        predictions.append({
-            'target': target,
-            'predicted': predicted,
-            'correct': is_correct,
-            'margin': metrics.margin
-        })
-        
-        if verbose:
-            status = "✓" if is_correct else "✗"
-            print(f"  {status} Target: {target}, Predicted: {predicted}, Margin: {metrics.margin:.3f}")
-    
-    accuracy = correct / len(dataset) if len(dataset) > 0 else 0.0
+def evaluate_model(trainer, dataset, config, verbose=False):
+    """Evaluate network and return accuracy, predictions (one array per column)"""
+    # One batched call for the whole dataset instead of one call per episode
+    metrics_list = trainer.evaluate_batch([ep.seq for ep in dataset], config)
+    predictions = {
+        'target': np.array([ep.target_id for ep in dataset], dtype=str),
+        'predicted': np.array([m.winner_id for m in metrics_list], dtype=str),
+        'margin': np.array([m.margin for m in metrics_list], dtype=np.float64),
+    }
+    predictions['correct'] = predictions['target'] == predictions['predicted']
+    
+    if verbose:
+        # Build every line first and write once instead of one print per episode
+        lines = []
+        for target, predicted, ok, margin in zip(predictions['target'].tolist(), predictions['predicted'].tolist(),
+                                                 predictions['correct'].tolist(), predictions['margin'].tolist()):
+            status = "✓" if ok else "✗"
+            lines.append(f"  {status} Target: {target}, Predicted: {predicted}, Margin: {margin:.3f}\n")
+        sys.stdout.write("".join(lines))
+        sys.stdout.flush()
+    
+    accuracy = int(predictions['correct'].sum()) / len(dataset) if len(dataset) > 0 else 0.0
     return accuracy, predictions
 
 
+def _id_digits(ids):
+    """Digit after the 'O' of each output ID ('O3' -> 3); empty IDs map to -1"""
+    uniq, inv = np.unique(ids, return_inverse=True)
+    return np.array([int(s[1]) if s else -1 for s in uniq.tolist()], dtype=np.int64)[inv.ravel()]
+
+
 def compute_confusion_matrix(predictions):
     """Compute 10x10 confusion matrix"""
-    matrix = np.zeros((10, 10), dtype=int)
-    
-    for pred in predictions:
-        target_digit = int(pred['target'][1])  # Extract digit from 'O0', 'O1', etc.
-        predicted_digit = int(pred['predicted'][1]) if pred['predicted'] else -1
-        
-        if 0 <= predicted_digit <= 9:
-            matrix[target_digit, predicted_digit] += 1
-    
-    return matrix
+    targets = _id_digits(predictions['target'])
+    preds = _id_digits(predictions['predicted'])
+    valid = (preds >= 0) & (preds <= 9)
+    return np.bincount(targets[valid] * 10 + preds[valid], minlength=100).reshape(10, 10)
 
 
 def print_confusion_matrix(matrix):
@@ -136,6 +155,8 @@ def main():
     parser.add_argument('--results', type=str, default=None, help='Results directory')
     parser.add_argument('--seed', type=int, default=42, help='Random seed')
     parser.add_argument('--verbose', action='store_true', help='Verbose evaluation')
+    parser.add_argument('--eval-train-before', action='store_true',
+                        help='Also report training accuracy before training (on a random subset of up to 1024 episodes)')
     args = parser.parse_args()
     
     # Resolve paths relative to script directory if not provided
@@ -205,20 +226,28 @@ def main():
     print(f"  • Batch size: {args.batch_size}")
     print(f"  • Optimizer: {args.optimizer.upper()}")
     
+    # One trainer serves every evaluation and the training run
+    trainer = glia.Trainer(net, config)
+    
     # Evaluate before training
     print("\n" + "-" * 70)
     print("Before Training")
     print("-" * 70)
-    train_acc_before, _ = evaluate_model(net, train_data, config)
-    test_acc_before, test_preds_before = evaluate_model(net, test_data, config)
-    print(f"Training accuracy: {train_acc_before:.2%}")
+    if args.eval_train_before:
+        # Informational only, so a sample is enough
+        rng = np.random.default_rng(args.seed)
+        n_train = len(train_data)
+        sample = rng.choice(n_train, size=min(1024, n_train), replace=False)
+        train_sample = glia.Dataset([train_data.episodes[i] for i in sample.tolist()])
+        train_acc_before, _ = evaluate_model(trainer, train_sample, config)
+        print(f"Training accuracy: {train_acc_before:.2%} ({len(train_sample)} sampled episodes)")
+    test_acc_before, test_preds_before = evaluate_model(trainer, test_data, config)
     print(f"Test accuracy: {test_acc_before:.2%}")
     
     # Train
     print("\n" + "-" * 70)
     print(f"Training for {args.epochs} epochs with LR scheduling")
     print("-" * 70)
-    trainer = glia.Trainer(net, config)
     
     # Train with LR scheduling and per-epoch progress
     lr_schedule = None if args.lr_schedule == 'none' else args.lr_schedule
@@ -234,8 +263,8 @@ def main():
     print("\n" + "-" * 70)
     print("After Training")
     print("-" * 70)
-    train_acc_after, train_preds = evaluate_model(net, train_data, config)
-    test_acc_after, test_preds = evaluate_model(net, test_data, config, verbose=args.verbose)
+    train_acc_after, train_preds = evaluate_model(trainer, train_data, config)
+    test_acc_after, test_preds = evaluate_model(trainer, test_data, config, verbose=args.verbose)
     
     print(f"Training accuracy: {train_acc_after:.2%}")
     print(f"Test accuracy: {test_acc_after:.2%}")
@@ -275,20 +304,26 @@ def main():
         'batch_size': args.batch_size,
         'learning_rate': args.lr,
         'improvement': float(test_acc_after - test_acc_before),
-        'confusion_matrix': conf_matrix.tolist()
+        'confusion_matrix': conf_matrix
     }
     
     metrics_file = results_dir / 'metrics.json'
-    with open(metrics_file, 'w') as f:
-        json.dump(metrics, f, indent=2)
+    if _HAS_ORJSON:
+        metrics_file.write_bytes(orjson.dumps(metrics, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        metrics['confusion_matrix'] = conf_matrix.tolist()
+        with open(metrics_file, 'w') as f:
+            json.dump(metrics, f, indent=2)
     print(f"✓ Metrics saved to: {metrics_file}")
     
     # Save predictions
     preds_file = results_dir / 'predictions_test.csv'
-    with open(preds_file, 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=['target', 'predicted', 'correct', 'margin'])
-        writer.writeheader()
-        writer.writerows(test_preds)
+    fields = ('target', 'predicted', 'correct', 'margin')
+    with open(preds_file, 'w', newline='', buffering=1 << 20) as f:
+        # Columns zipped into rows, written through a 1 MiB buffer
+        writer = csv.writer(f)
+        writer.writerow(fields)
+        writer.writerows(zip(*(test_preds[k].tolist() for k in fields)))
     print(f"✓ Predictions saved to: {preds_file}")
     
     print("\n" + "=" * 70)
@@ -16,33 +16,24 @@ XOR truth table:
 import glia
 import numpy as np
 import argparse
+import sys
 
 
 def create_xor_dataset(n_episodes=40):
     """Create dataset for XOR problem"""
-    episodes = []
+    # XOR patterns: (S0, S1) inputs and target
+    pattern_inputs = np.array([
+        [0.0, 0.0],      # 0 XOR 0 = 0 → N2
+        [100.0, 0.0],    # 1 XOR 0 = 1 → N3
+        [0.0, 100.0],    # 0 XOR 1 = 1 → N3
+        [100.0, 100.0],  # 1 XOR 1 = 0 → N2
+    ], dtype=np.float32)
+    pattern_targets = ['N2', 'N3', 'N3', 'N2']
     
-    # XOR patterns
-    patterns = [
-        ({'S0': 0.0, 'S1': 0.0}, 'N2'),    # 0 XOR 0 = 0 → N2
-        ({'S0': 100.0, 'S1': 0.0}, 'N3'),  # 1 XOR 0 = 1 → N3
-        ({'S0': 0.0, 'S1': 100.0}, 'N3'),  # 0 XOR 1 = 1 → N3
-        ({'S0': 100.0, 'S1': 100.0}, 'N2') # 1 XOR 1 = 0 → N2
-    ]
-    
-    for i in range(n_episodes):
-        ep = glia.EpisodeData()
-        seq = glia.InputSequence()
-        
-        # Select pattern
-        inputs, target = patterns[i % 4]
-        seq.add_timestep(inputs)
-        
-        ep.seq = seq
-        ep.target_id = target
-        episodes.append(ep)
-    
-    return glia.Dataset(episodes)
+    # Cycle through the four patterns; one C++ call builds every episode
+    idx = np.arange(n_episodes) % 4
+    targets = [pattern_targets[i] for i in idx.tolist()]
+    return glia.Dataset.from_arrays(pattern_inputs[idx], targets, ['S0', 'S1'])
 
 
 def main():
@@ -87,8 +78,11 @@ def main():
     print("-" * 60)
     trainer = glia.Trainer(net, config)
     
-    correct = sum(1 for ep in test_data 
-                  if trainer.evaluate(ep.seq, config).winner_id == ep.target_id)
+    # One batched call per pass. Results are not memoized per pattern: network
+    # state carries from one episode into the next, so repeats can differ.
+    test_seqs = [ep.seq for ep in test_data]
+    correct = sum(1 for ep, metrics in zip(test_data, trainer.evaluate_batch(test_seqs, config))
+                  if metrics.winner_id == ep.target_id)
     test_acc_before = correct / len(test_data)
     print(f"Test accuracy: {test_acc_before:.1%}")
     
@@ -106,8 +100,8 @@ def main():
     
     correct = 0
     results = []
-    for ep in test_data:
-        metrics = trainer.evaluate(ep.seq, config)
+    lines = []  # verbose output, written in one go after the loop
+    for ep, metrics in zip(test_data, trainer.evaluate_batch(test_seqs, config)):
         is_correct = (metrics.winner_id == ep.target_id)
         correct += int(is_correct)
         results.append({
@@ -118,7 +112,11 @@ def main():
         
         if args.verbose:
             status = "✓" if is_correct else "✗"
-            print(f"  {status} Target: {ep.target_id}, Predicted: {metrics.winner_id}")
+            lines.append(f"  {status} Target: {ep.target_id}, Predicted: {metrics.winner_id}\n")
+    
+    if lines:
+        sys.stdout.write("".join(lines))
+        sys.stdout.flush()
     
     test_acc_after = correct / len(test_data)
     print(f"Test accuracy: {test_acc_after:.1%}")
@@ -15,6 +15,9 @@ Example:
 
 __version__ = "0.1.0"
 
+import importlib
+from typing import TYPE_CHECKING
+
 # Import C++ core
 try:
     from . import _core
@@ -24,18 +27,36 @@ except ImportError as e:
         "Make sure the package is properly installed with: pip install -e ."
     ) from e
 
-# High-level Python wrappers (Pythonic API)
-from .network import Network
-from .trainer import Trainer
-from .evolution import Evolution, plot_evolution_result
-from .data import (
-    Dataset,
-    load_sequence_file,
-    create_sequence_from_array,
-    load_dataset_from_directory,
-    create_config,
-    create_evo_config,
-)
+# High-level Python wrappers (Pythonic API). They are imported on first
+# attribute access (PEP 562), so `import glia` only loads the C++ core.
+_LAZY = {
+    "Network": ".network",
+    "Trainer": ".trainer",
+    "Evolution": ".evolution",
+    "plot_evolution_result": ".evolution",
+    "Dataset": ".data",
+    "load_sequence_file": ".data",
+    "load_sequence_files": ".data",
+    "create_sequence_from_array": ".data",
+    "load_dataset_from_directory": ".data",
+    "create_config": ".data",
+    "create_evo_config": ".data",
+}
+
+if TYPE_CHECKING:
+    from .network import Network
+    from .trainer import Trainer
+    from .evolution import Evolution, plot_evolution_result
+    from .data import (
+        Dataset,
+        load_sequence_file,
+        load_sequence_files,
+        create_sequence_from_array,
+        load_dataset_from_directory,
+        create_config,
+        create_evo_config,
+    )
+    from . import viz
 
 # Re-export C++ types that don't have wrappers
 from ._core import (
@@ -55,13 +76,29 @@ from ._core import (
     RateGDTrainer,  # Gradient-based trainer for supervised learning
 )
 
-# Visualization (optional - only if dependencies installed)
-try:
-    from . import viz
-    _HAS_VIZ = True
-except ImportError:
-    _HAS_VIZ = False
-    viz = None
+def _load_viz():
+    # Visualization (optional - only if dependencies installed)
+    try:
+        return importlib.import_module(".viz", __name__)
+    except ImportError:
+        return None
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    elif name == "viz":
+        value = _load_viz()
+    elif name == "_HAS_VIZ":
+        value = _load_viz() is not None
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY) | {"viz"})
 
 __all__ = [
     "__version__",
@@ -72,6 +109,7 @@ __all__ = [
     "Dataset",
     # Utility functions
     "load_sequence_file",
+    "load_sequence_files",
     "create_sequence_from_array",
     "load_dataset_from_directory",
     "create_config",
@@ -100,9 +138,10 @@ def info():
     """Print GliaGL package information"""
     print(f"GliaGL version {__version__}")
     print(f"C++ core available: {_core is not None}")
-    print(f"Visualization available: {_HAS_VIZ}")
+    has_viz = _load_viz() is not None
+    print(f"Visualization available: {has_viz}")
     
-    if _HAS_VIZ:
+    if has_viz:
         print("  - matplotlib: ✓")
         print("  - networkx: ✓")
     else:
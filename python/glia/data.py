@@ -2,11 +2,25 @@
 Data utilities for loading and creating datasets
 """
 from typing import List, Dict, Tuple, Optional, Union
+import fnmatch
+import os
+import re
 import numpy as np
 from pathlib import Path
 from . import _core
 
 
+# First digit run in the part of a file stem before its first '_'
+# (e.g. "class0_001" -> "0"); stems without an '_' do not match
+_CLASS_DIGIT_RE = re.compile(r'[^_]*?(\d+)[^_]*_')
+
+
+def _stem(name: str) -> str:
+    # Same rule as PurePath.stem, on a plain file name
+    i = name.rfind('.')
+    return name[:i] if 0 < i < len(name) - 1 else name
+
+
 class Dataset:
     """
     Dataset container (PyTorch-like API)
@@ -48,14 +62,30 @@ class Dataset:
                 "must have same length"
             )
         
-        episodes = []
-        for seq, target in zip(sequences, targets):
-            ep = _core.EpisodeData()
-            ep.seq = seq
-            ep.target_id = target
-            episodes.append(ep)
+        return cls(_core.make_episodes(sequences, list(targets)))
+    
+    @classmethod
+    def from_arrays(
+        cls,
+        inputs: np.ndarray,
+        targets: List[str],
+        input_ids: Optional[List[str]] = None
+    ) -> 'Dataset':
+        """
+        Create single-timestep episodes from an input array in one C++ call
         
-        return cls(episodes)
+        Args:
+            inputs: (N, F) array; row i is injected at tick 0 of episode i
+            targets: N target output neuron IDs
+            input_ids: Sensory neuron IDs per column (default S0..S{F-1})
+            
+        Returns:
+            Dataset
+        """
+        inputs = np.asarray(inputs, dtype=np.float32)
+        if input_ids is None:
+            input_ids = [f"S{j}" for j in range(inputs.shape[1])]
+        return cls(_core.episodes_from_arrays(inputs, list(targets), list(input_ids)))
     
     @classmethod
     def from_files(
@@ -73,12 +103,7 @@ class Dataset:
         Returns:
             Dataset
         """
-        sequences = []
-        for filepath in seq_files:
-            seq = _core.InputSequence()
-            seq.load_from_file(filepath)
-            sequences.append(seq)
-        
+        sequences = load_sequence_files(seq_files)
         return cls.from_sequences(sequences, targets)
     
     def split(
@@ -98,9 +123,11 @@ class Dataset:
         Returns:
             Tuple of (train_dataset, val_dataset)
         """
-        episodes = self.episodes.copy()
+        # Slicing below already copies; only a shuffle needs its own copy
+        episodes = self.episodes
         
         if shuffle:
+            episodes = episodes.copy()
             rng = np.random.RandomState(seed)
             rng.shuffle(episodes)
         
@@ -152,6 +179,26 @@ def load_sequence_file(filepath: str) -> _core.InputSequence:
     return seq
 
 
+def load_sequence_files(
+    filepaths: List[str],
+    num_threads: int = 0
+) -> List[_core.InputSequence]:
+    """
+    Load many .seq files in one C++ call
+    
+    Args:
+        filepaths: Paths to .seq files
+        num_threads: Parser threads (0 = one per core)
+        
+    Returns:
+        List of InputSequence, in the order of filepaths
+        
+    Raises the first error (in path order) if any file cannot be opened or
+    parsed.
+    """
+    return _core.load_sequences_batch([str(p) for p in filepaths], num_threads)
+
+
 def create_sequence_from_array(
     inputs: np.ndarray,
     neuron_ids: List[str]
@@ -173,14 +220,7 @@ def create_sequence_from_array(
         )
     
     seq = _core.InputSequence()
-    
-    for t in range(inputs.shape[0]):
-        timestep_inputs = {
-            neuron_id: float(inputs[t, i])
-            for i, neuron_id in enumerate(neuron_ids)
-        }
-        seq.add_timestep(timestep_inputs)
-    
+    seq.add_timesteps_from_array(np.ascontiguousarray(inputs, dtype=np.float32), list(neuron_ids))
     return seq
 
 
@@ -208,52 +248,46 @@ def load_dataset_from_directory(
         ...     target_mapping=lambda f: "O0" if "class0" in f else "O1"
         ... )
     """
-    dir_path = Path(directory)
-    seq_files = sorted(dir_path.glob(pattern))
+    if os.sep in pattern or '/' in pattern or '**' in pattern:
+        # Patterns that reach into subdirectories need the full glob machinery
+        matches = sorted(Path(directory).glob(pattern))
+        paths = [str(p) for p in matches]
+        names = [p.name for p in matches]
+    else:
+        # Flat pattern: one scandir pass, plain strings, no Path objects per file
+        with os.scandir(directory) as it:
+            entries = sorted((e.name, e.path) for e in it if fnmatch.fnmatch(e.name, pattern))
+        names = [name for name, _ in entries]
+        paths = [path for _, path in entries]
     
-    if not seq_files:
+    if not paths:
         raise ValueError(f"No files matching '{pattern}' found in {directory}")
     
-    sequences = []
     targets = []
     
-    for filepath in seq_files:
-        # Load sequence
-        seq = _core.InputSequence()
-        seq.load_from_file(str(filepath))
-        sequences.append(seq)
-        
+    for name in names:
         # Determine target
         if target_mapping:
             if callable(target_mapping):
-                target = target_mapping(filepath.name)
+                target = target_mapping(name)
             else:
-                target = target_mapping.get(filepath.name)
+                target = target_mapping.get(name)
                 if target is None:
-                    raise ValueError(f"No target mapping for {filepath.name}")
+                    raise ValueError(f"No target mapping for {name}")
         else:
             # Try to infer from filename (e.g., "class0_001.seq" -> "O0")
-            name = filepath.stem
-            if '_' in name:
-                class_name = name.split('_')[0]
-                # Extract digit from class name
-                import re
-                match = re.search(r'\d+', class_name)
-                if match:
-                    target = f"O{match.group()}"
-                else:
-                    raise ValueError(
-                        f"Could not infer target from filename: {filepath.name}. "
-                        "Provide target_mapping."
-                    )
-            else:
+            match = _CLASS_DIGIT_RE.match(_stem(name))
+            if match is None:
                 raise ValueError(
-                    f"Could not infer target from filename: {filepath.name}. "
+                    f"Could not infer target from filename: {name}. "
                     "Provide target_mapping."
                 )
+            target = f"O{match.group(1)}"
         
         targets.append(target)
     
+    # Targets resolve first so a bad filename fails before any parsing
+    sequences = load_sequence_files(paths)
     return Dataset.from_sequences(sequences, targets)
 
 
@@ -122,17 +122,16 @@ class Evolution:
         best = result.best_genome
         
         # Set neuron parameters
-        ids = [n.id for n in best.neurons]
-        thresholds = np.array([n.thr for n in best.neurons], dtype=np.float32)
-        leaks = np.array([n.leak for n in best.neurons], dtype=np.float32)
+        ids, thresholds, leaks = best.neuron_arrays()
         net.set_state(ids, thresholds, leaks)
         
-        # Set weights
-        # Note: accessing edge attributes - 'from' is a Python keyword so use getattr
-        from_ids = [getattr(e, 'from') for e in best.edges]
-        to_ids = [e.to for e in best.edges]
-        weights = np.array([e.w for e in best.edges], dtype=np.float32)
-        net.set_weights(from_ids, to_ids, weights)
+        # Set weights; genome indices follow neuron_ids when the neuron sets
+        # match, so no ID strings need to cross the binding
+        if ids == net.neuron_ids:
+            net.set_weights_by_index(*best.edge_index_arrays())
+        else:
+            from_ids, to_ids, weights = best.edge_arrays()
+            net.set_weights(from_ids, to_ids, weights)
         
         return net
     
@@ -32,6 +32,9 @@ class Network:
             self._net = _core.Network()
         else:
             self._net = _core.Network(num_sensory, num_neurons)
+        # ID lists only change when a network is loaded; fetched lazily
+        self._sensory_ids_cache: Optional[Tuple[str, ...]] = None
+        self._neuron_ids_cache: Optional[Tuple[str, ...]] = None
     
     @classmethod
     def from_file(cls, filepath: str, verbose: bool = True) -> 'Network':
@@ -47,11 +50,12 @@ class Network:
         """
         net = cls()
         net._net.load(filepath, verbose)
+        net._invalidate_id_cache()
         return net
     
-    def save(self, filepath: str) -> None:
+    def save(self, filepath: str, verbose: bool = True) -> None:
         """Save network to file"""
-        self._net.save(filepath)
+        self._net.save(filepath, verbose)
     
     def step(self, n_steps: int = 1) -> None:
         """
@@ -60,8 +64,7 @@ class Network:
         Args:
             n_steps: Number of timesteps to simulate
         """
-        for _ in range(n_steps):
-            self._net.step()
+        self._net.step(n_steps)
     
     def inject(self, neuron_id: str, amount: float) -> None:
         """Inject current into a sensory neuron"""
@@ -77,8 +80,7 @@ class Network:
         Example:
             >>> net.inject_dict({"S0": 100.0, "S1": 50.0})
         """
-        for neuron_id, amount in inputs.items():
-            self._net.inject(neuron_id, amount)
+        self._net.inject_batch(list(inputs), list(inputs.values()))
     
     def inject_array(self, values: np.ndarray) -> None:
         """
@@ -87,13 +89,12 @@ class Network:
         Args:
             values: Array of current values (one per sensory neuron)
         """
-        sensory_ids = self.sensory_ids
-        if len(values) != len(sensory_ids):
+        n_sensory = len(self._cached_sensory_ids())
+        if len(values) != n_sensory:
             raise ValueError(
-                f"Array length {len(values)} doesn't match sensory neuron count {len(sensory_ids)}"
+                f"Array length {len(values)} doesn't match sensory neuron count {n_sensory}"
             )
-        for neuron_id, value in zip(sensory_ids, values):
-            self._net.inject(neuron_id, float(value))
+        self._net.inject_ordered(values)
     
     def reset(self) -> None:
         """Reset network to initial state (reload from last load/save)"""
@@ -113,6 +114,22 @@ class Network:
         """
         return self._net.get_state()
     
+    def get_values(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Get current neuron values (same order as `neuron_ids`)
+        
+        Cheaper than get_state() for per-step recording: no ID list is
+        built, and with `out` nothing is allocated.
+        
+        Args:
+            out: Optional contiguous float32 array of length num_neurons
+                 to write into (e.g. a row of a preallocated matrix)
+            
+        Returns:
+            The filled array (`out` itself when given)
+        """
+        return self._net.get_values(out)
+    
     def set_state(
         self, 
         neuron_ids: List[str], 
@@ -131,6 +148,16 @@ class Network:
         """
         return self._net.get_weights()
     
+    def get_weights_by_index(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get all synaptic weights as an index edge list (COO sparse format)
+        
+        Returns:
+            Tuple of (from_idx, to_idx, weights) NumPy arrays, with indices
+            in `neuron_ids` order
+        """
+        return self._net.get_weights_by_index()
+    
     def set_weights(
         self, 
         from_ids: List[str], 
@@ -140,6 +167,27 @@ class Network:
         """Set synaptic weights from edge list"""
         self._net.set_weights(from_ids, to_ids, weights)
     
+    def set_weights_by_index(
+        self,
+        from_idx: np.ndarray,
+        to_idx: np.ndarray,
+        weights: np.ndarray
+    ) -> None:
+        """
+        Set synaptic weights from an edge list of neuron indices
+        
+        Indices follow the order of `neuron_ids` (sensory first). The ID
+        lookup happens in C++, so no per-edge Python lists are built.
+        An index outside [0, num_neurons) raises ValueError before any
+        weight is written.
+        
+        Args:
+            from_idx: Source neuron indices
+            to_idx: Target neuron indices
+            weights: Weight per edge
+        """
+        self._net.set_weights_by_index(from_idx, to_idx, weights)
+    
     # ========== Properties ==========
     
     @property
@@ -173,15 +221,32 @@ class Network:
             'values': weights
         }
     
+    def _invalidate_id_cache(self) -> None:
+        """Drop cached ID lists (call after anything that changes the neuron set)"""
+        self._sensory_ids_cache = None
+        self._neuron_ids_cache = None
+    
+    def _cached_sensory_ids(self) -> Tuple[str, ...]:
+        """Sensory IDs, fetched from C++ once until the neuron set changes"""
+        if self._sensory_ids_cache is None:
+            self._sensory_ids_cache = tuple(self._net.get_sensory_ids())
+        return self._sensory_ids_cache
+    
+    def _cached_neuron_ids(self) -> Tuple[str, ...]:
+        """All neuron IDs, fetched from C++ once until the neuron set changes"""
+        if self._neuron_ids_cache is None:
+            self._neuron_ids_cache = tuple(self._net.get_all_neuron_ids())
+        return self._neuron_ids_cache
+    
     @property
     def sensory_ids(self) -> List[str]:
-        """Get sensory neuron IDs"""
-        return self._net.get_sensory_ids()
+        """Get sensory neuron IDs (a fresh list; safe to mutate)"""
+        return list(self._cached_sensory_ids())
     
     @property
     def neuron_ids(self) -> List[str]:
-        """Get all neuron IDs"""
-        return self._net.get_all_neuron_ids()
+        """Get all neuron IDs (a fresh list; safe to mutate)"""
+        return list(self._cached_neuron_ids())
     
     @property
     def num_neurons(self) -> int:
@@ -206,12 +271,17 @@ class Network:
         Returns:
             List of neuron IDs
         """
-        firing = []
-        for neuron_id in self.neuron_ids:
-            neuron = self.get_neuron(neuron_id)
-            if neuron and neuron.did_fire():
-                firing.append(neuron_id)
-        return firing
+        ids = self._cached_neuron_ids()
+        return [ids[i] for i in np.flatnonzero(self._net.get_firing_mask())]
+    
+    def get_firing_mask(self) -> np.ndarray:
+        """
+        Get which neurons fired in the last timestep as a bool array
+        
+        Returns:
+            Bool array in `neuron_ids` order
+        """
+        return self._net.get_firing_mask()
     
     def to_adjacency_matrix(self, dense: bool = False) -> np.ndarray:
         """
@@ -223,27 +293,20 @@ class Network:
         Returns:
             Adjacency matrix (dense or scipy.sparse if installed)
         """
-        from_ids, to_ids, weights = self.get_weights()
-        neuron_ids = self.neuron_ids
-        id_to_idx = {nid: i for i, nid in enumerate(neuron_ids)}
-        
-        n = len(neuron_ids)
+        # O(nnz): index arrays straight from C++, no ID strings or dict lookups
+        rows, cols, weights = self.get_weights_by_index()
+        n = self.num_neurons
         
         if dense:
             # Dense matrix
             adj = np.zeros((n, n), dtype=np.float32)
-            for from_id, to_id, weight in zip(from_ids, to_ids, weights):
-                i = id_to_idx[from_id]
-                j = id_to_idx[to_id]
-                adj[i, j] = weight
+            adj[rows, cols] = weights
             return adj
         else:
             # Return as COO format (compatible with scipy.sparse)
             try:
                 import scipy.sparse as sp
-                from_indices = [id_to_idx[fid] for fid in from_ids]
-                to_indices = [id_to_idx[tid] for tid in to_ids]
-                return sp.coo_matrix((weights, (from_indices, to_indices)), shape=(n, n))
+                return sp.coo_matrix((weights, (rows, cols)), shape=(n, n))
             except ImportError:
                 raise ImportError(
                     "scipy required for sparse matrices. Install with: pip install scipy\n"
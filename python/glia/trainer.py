@@ -71,6 +71,24 @@ class Trainer:
         cfg = config or self._config
         return self._trainer.evaluate(sequence, cfg)
     
+    def evaluate_batch(
+        self,
+        sequences: List[_core.InputSequence],
+        config: Optional[_core.TrainingConfig] = None
+    ) -> List[_core.EpisodeMetrics]:
+        """
+        Evaluate network on many episodes in a single call (GIL released)
+        
+        Args:
+            sequences: Input sequences to evaluate, in order
+            config: Training config (uses self._config if None)
+            
+        Returns:
+            List of episode metrics, one per sequence
+        """
+        cfg = config or self._config
+        return self._trainer.evaluate_batch(sequences, cfg)
+    
     def train_batch(
         self,
         batch: List[_core.EpisodeData],
@@ -103,8 +121,10 @@ class Trainer:
         """
         Train for multiple epochs with Python callback support and LR scheduling
         
-        This method manually implements the training loop to support
-        Python callbacks, unlike train_epoch_fast() which releases the GIL.
+        The whole epoch loop runs in one C++ call (train_epochs) with the
+        GIL released while each epoch trains; it is only re-acquired around
+        the per-epoch hooks that set the scheduled LR, report progress and
+        call on_epoch.
         
         Args:
             dataset: Training episodes
@@ -137,40 +157,32 @@ class Trainer:
             else:
                 return initial_lr
         
-        for epoch in range(epochs):
+        epoch_width = len(str(epochs))
+        
+        def on_epoch_begin(epoch: int) -> None:
             # Update learning rate
             cfg.lr = get_lr(epoch)
             
-            # Progress tracking for this epoch
-            num_batches = (len(dataset) + cfg.batch_size - 1) // cfg.batch_size
-            
             if verbose:
                 # Start-of-epoch message
-                epoch_width = len(str(epochs))
                 print(f"Epoch {epoch+1:>{epoch_width}}/{epochs} [LR={cfg.lr:.6f}]", end='')
+        
+        def on_epoch_end(epoch: int, accuracy: float, margin: float) -> None:
+            # Update history
+            self._history['accuracy'].append(accuracy)
+            self._history['margin'].append(margin)
             
-            # Train one epoch (GIL released in C++)
-            self._trainer.train_epoch(dataset, 1, cfg)
-            
-            # Get metrics
-            acc_hist = self._trainer.get_epoch_acc_history()
-            margin_hist = self._trainer.get_epoch_margin_history()
+            # End-of-epoch status
+            if verbose:
+                print(f"  →  Acc: {accuracy:>6.2%}, Margin: {margin:.3f}")
             
-            if acc_hist:
-                accuracy = acc_hist[-1]
-                margin = margin_hist[-1] if margin_hist else 0.0
-                
-                # Update history
-                self._history['accuracy'].append(accuracy)
-                self._history['margin'].append(margin)
-                
-                # End-of-epoch status
-                if verbose:
-                    print(f"  →  Acc: {accuracy:>6.2%}, Margin: {margin:.3f}")
-                
-                # Custom callback
-                if on_epoch:
-                    on_epoch(epoch, accuracy, margin)
+            # Custom callback
+            if on_epoch:
+                on_epoch(epoch, accuracy, margin)
+        
+        # One C++ call for all epochs: the dataset is converted once, the GIL
+        # is released while training and re-taken only for the callbacks
+        self._trainer.train_epochs(dataset, epochs, cfg, on_epoch_begin, on_epoch_end)
         
         # Restore original learning rate
         cfg.lr = initial_lr
@@ -228,17 +240,10 @@ class Trainer:
         """
         cfg = config or self._config
         
-        metrics_list = []
-        correct = 0
-        total_margin = 0.0
-        
-        for episode in dataset:
-            metrics = self._trainer.evaluate(episode.seq, cfg)
-            metrics_list.append(metrics)
-            
-            if metrics.winner_id == episode.target_id:
-                correct += 1
-            total_margin += metrics.margin
+        # One C++ call scores every episode; the reduction is a NumPy sum
+        metrics_list, hits, margins = self._trainer.evaluate_dataset(dataset, cfg)
+        correct = int(hits.sum())
+        total_margin = float(margins.sum(dtype=np.float64))
         
         accuracy = correct / len(dataset) if dataset else 0.0
         avg_margin = total_margin / len(dataset) if dataset else 0.0
@@ -263,7 +268,10 @@ class Trainer:
     @property
     def history(self) -> Dict[str, List[float]]:
         """Get training history"""
-        # Sync with C++ history
+        # Sync with C++ history, copying only when epochs were added since
+        # the last sync (train() appends as it goes, so it stays in step)
+        if self._trainer.get_epoch_count() == len(self._history['accuracy']):
+            return self._history
         acc_hist = self._trainer.get_epoch_acc_history()
         margin_hist = self._trainer.get_epoch_margin_history()
         
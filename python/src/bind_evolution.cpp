@@ -6,10 +6,31 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 #include <pybind11/functional.h>
+#include <pybind11/numpy.h>
+#include <unordered_map>
 #include "../../src/evo/evolution_engine.h"
 
 namespace py = pybind11;
 
+namespace {
+// Append edges to s's columns by id; ones naming an unknown neuron go to s.pending
+void resolveEdges(EvolutionEngine::NetSnapshot &s,
+                  const std::vector<EvolutionEngine::EdgeRec> &edges) {
+    std::unordered_map<std::string, int> index;
+    for (size_t i = 0; i < s.ids.size(); ++i) index.emplace(s.ids[i], static_cast<int>(i));
+    for (const auto &e : edges) {
+        auto f = index.find(e.from), t = index.find(e.to);
+        if (f == index.end() || t == index.end()) {
+            s.pending.push_back(e);
+            continue;
+        }
+        s.from.push_back(f->second);
+        s.to.push_back(t->second);
+        s.w.push_back(e.w);
+    }
+}
+}  // namespace
+
 void bind_evolution(py::module &m) {
     // EvoMetrics struct
     py::class_<EvoMetrics>(m, "EvoMetrics",
@@ -48,6 +69,8 @@ void bind_evolution(py::module &m) {
         .def_readwrite("seed", &EvolutionEngine::Config::seed)
         .def_readwrite("lamarckian", &EvolutionEngine::Config::lamarckian)
         .def_readwrite("lineage_json", &EvolutionEngine::Config::lineage_json)
+        .def_readwrite("workers", &EvolutionEngine::Config::workers,
+                      "Threads evaluating individuals in parallel (1 = serial, 0 = all cores)")
         .def("__repr__", [](const EvolutionEngine::Config &c) {
             return "<EvolutionConfig pop=" + std::to_string(c.population) +
                    " gens=" + std::to_string(c.generations) + ">";
@@ -66,10 +89,68 @@ void bind_evolution(py::module &m) {
         .def_readwrite("to", &EvolutionEngine::EdgeRec::to)
         .def_readwrite("w", &EvolutionEngine::EdgeRec::w);
     
-    py::class_<EvolutionEngine::NetSnapshot>(m, "NetworkSnapshot")
+    using Snapshot = EvolutionEngine::NetSnapshot;
+    py::class_<Snapshot>(m, "NetworkSnapshot")
         .def(py::init<>())
-        .def_readwrite("neurons", &EvolutionEngine::NetSnapshot::neurons)
-        .def_readwrite("edges", &EvolutionEngine::NetSnapshot::edges);
+        // Stored as columns; .neurons/.edges build (and accept) record lists.
+        // Either may be assigned first: edges whose endpoints are not known
+        // yet stay pending (listed by .edges, ignored by the engine) until a
+        // neurons assignment resolves them.
+        .def_property("neurons", [](const Snapshot &s) {
+            std::vector<EvolutionEngine::NeuronRec> recs(s.ids.size());
+            for (size_t i = 0; i < recs.size(); ++i) recs[i] = {s.ids[i], s.thr[i], s.leak[i]};
+            return recs;
+        }, [](Snapshot &s, const std::vector<EvolutionEngine::NeuronRec> &recs) {
+            // Re-resolve existing and pending edges by id against the new columns
+            std::vector<EvolutionEngine::EdgeRec> edges(s.w.size());
+            for (size_t e = 0; e < edges.size(); ++e) edges[e] = {s.ids[s.from[e]], s.ids[s.to[e]], s.w[e]};
+            edges.insert(edges.end(), s.pending.begin(), s.pending.end());
+            Snapshot out;
+            for (const auto &r : recs) {
+                out.ids.push_back(r.id);
+                out.thr.push_back(r.thr);
+                out.leak.push_back(r.leak);
+            }
+            resolveEdges(out, edges);
+            s = std::move(out);
+        })
+        .def_property("edges", [](const Snapshot &s) {
+            std::vector<EvolutionEngine::EdgeRec> recs(s.w.size());
+            for (size_t e = 0; e < recs.size(); ++e) recs[e] = {s.ids[s.from[e]], s.ids[s.to[e]], s.w[e]};
+            recs.insert(recs.end(), s.pending.begin(), s.pending.end());
+            return recs;
+        }, [](Snapshot &s, const std::vector<EvolutionEngine::EdgeRec> &recs) {
+            s.from.clear();
+            s.to.clear();
+            s.w.clear();
+            s.pending.clear();
+            resolveEdges(s, recs);
+        })
+        // Column access without a Python object per record
+        .def("neuron_arrays", [](const Snapshot &s) {
+            return py::make_tuple(s.ids,
+                                  py::array_t<float>(s.thr.size(), s.thr.data()),
+                                  py::array_t<float>(s.leak.size(), s.leak.data()));
+        },
+        "Return (ids, thresholds, leaks); thresholds/leaks are float32 arrays")
+        .def("edge_arrays", [](const Snapshot &s) {
+            const size_t n = s.w.size();
+            py::list from_ids(n), to_ids(n);
+            std::vector<py::str> names(s.ids.begin(), s.ids.end());
+            for (size_t e = 0; e < n; ++e) {
+                from_ids[e] = names[s.from[e]];
+                to_ids[e] = names[s.to[e]];
+            }
+            return py::make_tuple(from_ids, to_ids, py::array_t<float>(n, s.w.data()));
+        },
+        "Return (from_ids, to_ids, weights); weights is a float32 array")
+        .def("edge_index_arrays", [](const Snapshot &s) {
+            return py::make_tuple(py::array_t<int>(s.from.size(), s.from.data()),
+                                  py::array_t<int>(s.to.size(), s.to.data()),
+                                  py::array_t<float>(s.w.size(), s.w.data()));
+        },
+        "Return (from_idx, to_idx, weights) arrays; indices point into the\n"
+        "neuron_arrays() ids, which follow Network.neuron_ids order");
     
     // Evolution Result
     py::class_<EvolutionEngine::Result>(m, "EvolutionResult",
@@ -5,10 +5,59 @@
 
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
+#include <pybind11/numpy.h>
+#include <algorithm>
+#include <exception>
+#include <stdexcept>
+#include <thread>
 #include "../../src/arch/input_sequence.h"
 
 namespace py = pybind11;
 
+namespace {
+// Parse every file into a preallocated slot. Workers take a strided share of
+// the paths; the first exception (by path order) is rethrown after joining.
+std::vector<InputSequence> load_sequences_batch(const std::vector<std::string> &paths,
+                                                unsigned num_threads) {
+    const size_t n = paths.size();
+    std::vector<InputSequence> seqs(n);
+    std::vector<std::exception_ptr> errors(n);
+    if (num_threads == 0) {
+        num_threads = std::max(1u, std::thread::hardware_concurrency());
+    }
+    num_threads = static_cast<unsigned>(std::min<size_t>(num_threads, std::max<size_t>(n, 1)));
+    auto work = [&](size_t first) {
+        for (size_t i = first; i < n; i += num_threads) {
+            try {
+                // loadFromFile reports an unopenable file by returning false
+                if (!seqs[i].loadFromFile(paths[i])) {
+                    throw std::runtime_error("Could not open sequence file: " + paths[i]);
+                }
+            } catch (...) {
+                errors[i] = std::current_exception();
+            }
+        }
+    };
+    {
+        py::gil_scoped_release release;
+        std::vector<std::thread> workers;
+        for (unsigned t = 1; t < num_threads; ++t) {
+            workers.emplace_back(work, t);
+        }
+        work(0);
+        for (auto &w : workers) {
+            w.join();
+        }
+    }
+    for (auto &e : errors) {
+        if (e) {
+            std::rethrow_exception(e);
+        }
+    }
+    return seqs;
+}
+}  // namespace
+
 void bind_input_sequence(py::module &m) {
     // InputSequence class
     py::class_<InputSequence>(m, "InputSequence",
@@ -27,6 +76,20 @@ void bind_input_sequence(py::module &m) {
         .def("get_current_inputs", &InputSequence::getCurrentInputs,
              "Get current timestep inputs as dict")
         
+        .def("get_max_tick", &InputSequence::getMaxTick,
+             "Last tick that carries an event (0 when empty)")
+        
+        .def("is_looping", &InputSequence::isLooping,
+             "Whether advance() wraps back to tick 0 after the last event")
+        
+        .def("set_loop", &InputSequence::setLoop,
+             py::arg("loop"),
+             "Enable or disable looping")
+        
+        .def("add_event", &InputSequence::addEvent,
+             py::arg("tick"), py::arg("neuron_id"), py::arg("value"),
+             "Set neuron_id's input at an explicit tick")
+        
         .def("load_from_file", &InputSequence::loadFromFile,
              py::arg("filepath"),
              "Load sequence from .seq file")
@@ -43,7 +106,48 @@ void bind_input_sequence(py::module &m) {
         py::arg("inputs"),
         "Add a timestep with input values")
         
+        .def("add_constant_timesteps", [](InputSequence &self, int count,
+                                          const std::map<std::string, float> &inputs) {
+            // Same as calling add_timestep(inputs) count times, but the dict is
+            // converted once and the loop stays in C++
+            if (inputs.empty()) {
+                return;
+            }
+            int tick = self.isEmpty() ? 0 : (self.getMaxTick() + 1);
+            for (int k = 0; k < count; ++k, ++tick) {
+                for (const auto &pair : inputs) {
+                    self.addEvent(tick, pair.first, pair.second);
+                }
+            }
+        },
+        py::arg("count"), py::arg("inputs"),
+        "Add count consecutive timesteps that all carry the same input values")
+        
+        .def("add_timesteps_from_array", [](InputSequence &self,
+                                            py::array_t<float, py::array::c_style | py::array::forcecast> values,
+                                            const std::vector<std::string> &neuron_ids) {
+            // Row t of values becomes one add_timestep({neuron_ids[j]: values[t, j]})
+            if (values.ndim() != 2) {
+                throw std::invalid_argument("values must be a 2D array (timesteps x inputs)");
+            }
+            if (static_cast<size_t>(values.shape(1)) != neuron_ids.size()) {
+                throw std::invalid_argument("neuron_ids must have one entry per column of values");
+            }
+            const float *data = values.data();
+            const size_t count = static_cast<size_t>(values.shape(0));
+            py::gil_scoped_release release;
+            self.appendTimesteps(neuron_ids, data, count);
+        },
+        py::arg("values"), py::arg("neuron_ids"),
+        "Add one timestep per row of a (T, N) array; column j feeds neuron_ids[j]")
+        
         .def("__repr__", [](const InputSequence &self) {
             return "<InputSequence>";
         });
+    
+    // Bulk loading: one call for a whole directory of .seq files
+    m.def("load_sequences_batch", &load_sequences_batch,
+          py::arg("paths"), py::arg("num_threads") = 0,
+          "Load many .seq files in one call, parsing on num_threads worker\n"
+          "threads (0 = one per core) with the GIL released");
 }
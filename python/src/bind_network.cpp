@@ -6,11 +6,26 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 #include <pybind11/numpy.h>
+#include <stdexcept>
 #include "../../src/arch/glia.h"
 #include "../../src/arch/neuron.h"  // Need full definition for shared_ptr in method signatures
 
 namespace py = pybind11;
 
+namespace {
+
+// Hand a vector's buffer to NumPy without copying; the capsule owns it
+template <typename T>
+py::array_t<T> vector_to_array(std::vector<T> &&v) {
+    auto *owned = new std::vector<T>(std::move(v));
+    py::capsule free_when_done(owned, [](void *p) {
+        delete reinterpret_cast<std::vector<T> *>(p);
+    });
+    return py::array_t<T>(owned->size(), owned->data(), free_when_done);
+}
+
+}  // namespace
+
 void bind_network(py::module &m) {
     // Main Network class
     py::class_<Glia, std::shared_ptr<Glia>>(m, "Network",
@@ -32,16 +47,46 @@ void bind_network(py::module &m) {
              py::arg("filepath"), py::arg("verbose") = true,
              "Load network from .net file")
         .def("save", &Glia::saveNetworkToFile,
-             py::arg("filepath"),
+             py::arg("filepath"), py::arg("verbose") = true,
              "Save network to .net file")
         
         // Simulation
-        .def("step", &Glia::step,
+        .def("step", [](Glia &self, int n_steps) {
+            for (int t = 0; t < n_steps; ++t) {
+                self.step();
+            }
+        },
+             py::arg("n_steps") = 1,
              py::call_guard<py::gil_scoped_release>(),
-             "Run one simulation timestep (GIL released)")
+             "Run n_steps simulation timesteps (default 1) in one call (GIL released)")
         .def("inject", &Glia::injectSensory,
              py::arg("neuron_id"), py::arg("amount"),
              "Inject current into sensory neuron")
+        .def("inject_batch", [](Glia &self,
+                                const std::vector<std::string> &ids,
+                                py::array_t<float, py::array::c_style | py::array::forcecast> amounts) {
+            if (amounts.ndim() != 1 || static_cast<size_t>(amounts.shape(0)) != ids.size()) {
+                throw std::invalid_argument("inject_batch: amounts must be 1-D with one entry per id");
+            }
+            const float *a = amounts.data();
+            py::gil_scoped_release release;
+            for (size_t i = 0; i < ids.size(); ++i) {
+                self.injectSensory(ids[i], a[i]);
+            }
+        },
+             py::arg("ids"), py::arg("amounts"),
+             "Inject amounts[i] into sensory neuron ids[i] for every i in one call")
+        .def("inject_ordered", [](Glia &self,
+                                  py::array_t<float, py::array::c_style | py::array::forcecast> amounts) {
+            if (amounts.ndim() != 1 || amounts.shape(0) != self.getSensoryCount()) {
+                throw std::invalid_argument("inject_ordered: amounts must be 1-D with one entry per sensory neuron");
+            }
+            const float *a = amounts.data();
+            py::gil_scoped_release release;
+            self.injectSensoryOrdered(a);
+        },
+             py::arg("amounts"),
+             "Inject amounts[i] into the i-th sensory neuron (get_sensory_ids() order) in one call")
         
         // Neuron access
         .def("get_neuron", &Glia::getNeuronById,
@@ -74,6 +119,36 @@ void bind_network(py::module &m) {
         "Returns:\n"
         "    tuple: (ids, values, thresholds, leaks) where values/thresholds/leaks are NumPy arrays")
         
+        .def("get_values", [](const Glia &self, py::object out) {
+            using FloatArray = py::array_t<float, py::array::c_style>;
+            const auto n = static_cast<py::ssize_t>(self.getNeuronCount());
+            FloatArray arr;
+            if (out.is_none()) {
+                arr = FloatArray(n);
+            } else if (py::isinstance<FloatArray>(out)) {
+                // Write in place: no conversion, which would fill a temporary copy
+                arr = py::reinterpret_borrow<FloatArray>(out);
+            } else {
+                throw std::invalid_argument("get_values: out must be a C-contiguous float32 array");
+            }
+            if (arr.ndim() != 1 || arr.shape(0) != n) {
+                throw std::invalid_argument("get_values: out must be 1-D with length get_neuron_count()");
+            }
+            self.getValues(arr.mutable_data());
+            return arr;
+        },
+        py::arg("out") = py::none(),
+        "Get neuron values only, optionally written into a preallocated\n"
+        "contiguous float32 array (no ids list, no per-call allocation)")
+        
+        .def("get_firing_mask", [](const Glia &self) {
+            py::array_t<bool> mask(static_cast<py::ssize_t>(self.getNeuronCount()));
+            self.getFiringMask(mask.mutable_data());
+            return mask;
+        },
+        "Get a bool array of which neurons fired in the last step\n"
+        "(same order as get_all_neuron_ids())")
+        
         .def("set_state", [](Glia &self, 
                              const std::vector<std::string> &ids,
                              py::array_t<float> thresholds,
@@ -108,6 +183,23 @@ void bind_network(py::module &m) {
         "Returns:\n"
         "    tuple: (from_ids, to_ids, weights) where weights is a NumPy array")
         
+        .def("get_weights_by_index", [](const Glia &self) {
+            std::vector<int> from_idx, to_idx;
+            std::vector<float> weights;
+            {
+                py::gil_scoped_release release;
+                self.getWeightsByIndex(from_idx, to_idx, weights);
+            }
+            return py::make_tuple(
+                vector_to_array(std::move(from_idx)),
+                vector_to_array(std::move(to_idx)),
+                vector_to_array(std::move(weights))
+            );
+        },
+        "Get all synaptic weights as index arrays (COO sparse format)\n\n"
+        "Returns:\n"
+        "    tuple: (from_idx, to_idx, weights) NumPy arrays; indices follow get_all_neuron_ids()")
+        
         .def("set_weights", [](Glia &self,
                                const std::vector<std::string> &from_ids,
                                const std::vector<std::string> &to_ids,
@@ -122,6 +214,34 @@ void bind_network(py::module &m) {
         py::arg("from_ids"), py::arg("to_ids"), py::arg("weights"),
         "Set synaptic weights from edge list (creates connections if needed)")
         
+        .def("set_weights_by_index", [](Glia &self,
+                                        py::array_t<int, py::array::c_style | py::array::forcecast> from_idx,
+                                        py::array_t<int, py::array::c_style | py::array::forcecast> to_idx,
+                                        py::array_t<float, py::array::c_style | py::array::forcecast> weights) {
+            const auto n = static_cast<size_t>(weights.size());
+            if (static_cast<size_t>(from_idx.size()) != n || static_cast<size_t>(to_idx.size()) != n) {
+                throw std::invalid_argument("set_weights_by_index: from_idx, to_idx and weights must have the same length");
+            }
+            const int *f = from_idx.data();
+            const int *t = to_idx.data();
+            const float *w = weights.data();
+            // Glia::setWeightsByIndex skips bad indices; from Python that is an error
+            const int n_total = self.getNeuronCount();
+            for (size_t i = 0; i < n; ++i) {
+                if (f[i] < 0 || f[i] >= n_total || t[i] < 0 || t[i] >= n_total) {
+                    throw std::invalid_argument("set_weights_by_index: edge " + std::to_string(i) +
+                                                " (" + std::to_string(f[i]) + " -> " + std::to_string(t[i]) +
+                                                ") is outside [0, " + std::to_string(n_total) + ")");
+                }
+            }
+            py::gil_scoped_release release;
+            self.setWeightsByIndex(f, t, w, n);
+        },
+        py::arg("from_idx"), py::arg("to_idx"), py::arg("weights"),
+        "Set synaptic weights from neuron index arrays (order of get_all_neuron_ids();\n"
+        "creates connections if needed, GIL released). Raises ValueError if any\n"
+        "index is outside [0, get_neuron_count()); nothing is written in that case")
+        
         .def("__repr__", [](const Glia &self) {
             return "<Network neurons=" + std::to_string(self.getNeuronCount()) +
                    " connections=" + std::to_string(self.getConnectionCount()) + ">";
@@ -6,6 +6,8 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 #include <pybind11/functional.h>
+#include <pybind11/numpy.h>
+#include <stdexcept>
 #include "../../src/train/trainer.h"
 #include "../../src/train/training_config.h"
 #include "../../src/train/gradient/rate_gd_trainer.h"
@@ -13,6 +15,88 @@
 
 namespace py = pybind11;
 
+namespace {
+// Evaluate many sequences in one call: references are collected under the
+// GIL, then every episode runs with it released.
+template <typename TrainerT>
+std::vector<EpisodeMetrics> evaluate_batch(TrainerT &self, py::iterable sequences,
+                                           const TrainingConfig &config) {
+    std::vector<py::object> keep_alive;  // sequences may come from a generator
+    std::vector<InputSequence*> seqs;
+    for (auto item : sequences) {
+        seqs.push_back(&item.cast<InputSequence&>());
+        keep_alive.push_back(py::reinterpret_borrow<py::object>(item));
+    }
+    std::vector<EpisodeMetrics> out;
+    out.reserve(seqs.size());
+    py::gil_scoped_release release;
+    for (InputSequence *seq : seqs) {
+        out.push_back(self.evaluate(*seq, config));
+    }
+    return out;
+}
+
+// Evaluate labelled episodes in one call and score them in C++: returns the
+// per-episode metrics plus NumPy arrays of correctness and margins.
+template <typename TrainerT>
+py::tuple evaluate_dataset(TrainerT &self, py::iterable episodes,
+                           const TrainingConfig &config) {
+    std::vector<py::object> keep_alive;  // episodes may come from a generator
+    std::vector<Trainer::EpisodeData*> eps;
+    for (auto item : episodes) {
+        eps.push_back(&item.cast<Trainer::EpisodeData&>());
+        keep_alive.push_back(py::reinterpret_borrow<py::object>(item));
+    }
+    const auto n = static_cast<py::ssize_t>(eps.size());
+    std::vector<EpisodeMetrics> metrics;
+    metrics.reserve(eps.size());
+    py::array_t<bool> correct(n);
+    py::array_t<float> margins(n);
+    bool *c = correct.mutable_data();
+    float *mg = margins.mutable_data();
+    {
+        py::gil_scoped_release release;
+        for (Trainer::EpisodeData *ep : eps) {
+            metrics.push_back(self.evaluate(ep->seq, config));
+            *c++ = metrics.back().winner_id == ep->target_id;
+            *mg++ = metrics.back().margin;
+        }
+    }
+    return py::make_tuple(metrics, correct, margins);
+}
+
+// Run `epochs` single-epoch trainEpoch() calls (same semantics as calling
+// train_epoch(dataset, 1, config) per epoch) from one binding call: the dataset
+// is converted once and the GIL is only taken around the callbacks.
+// on_epoch_begin(epoch) may modify `config` (e.g. the learning rate);
+// on_epoch_end(epoch, acc, margin) runs once the epoch has recorded metrics.
+template <typename TrainerT>
+void train_epochs(TrainerT &self, const std::vector<Trainer::EpisodeData> &dataset,
+                  int epochs, TrainingConfig &config,
+                  py::object on_epoch_begin, py::object on_epoch_end) {
+    py::gil_scoped_release release;
+    for (int e = 0; e < epochs; ++e) {
+        if (!on_epoch_begin.is_none()) {
+            py::gil_scoped_acquire acquire;
+            on_epoch_begin(e);
+        }
+        self.trainEpoch(dataset, 1, config);
+        double acc = 0.0, margin = 0.0;
+        if (!on_epoch_end.is_none() && self.getLastEpochMetrics(acc, margin)) {
+            py::gil_scoped_acquire acquire;
+            on_epoch_end(e, acc, margin);
+        }
+    }
+}
+
+template <typename TrainerT>
+py::object last_epoch_metrics(const TrainerT &self) {
+    double acc = 0.0, margin = 0.0;
+    if (!self.getLastEpochMetrics(acc, margin)) return py::none();
+    return py::make_tuple(acc, margin);
+}
+}  // namespace
+
 void bind_training(py::module &m) {
     // GradConfig - gradient descent optimizer configuration
     py::class_<GradConfig>(m, "GradConfig",
@@ -160,6 +244,59 @@ void bind_training(py::module &m) {
         .def_readwrite("seq", &Trainer::EpisodeData::seq)
         .def_readwrite("target_id", &Trainer::EpisodeData::target_id);
     
+    // Bulk episode construction: one single-timestep episode per input row
+    m.def("episodes_from_arrays", [](py::array_t<float, py::array::c_style | py::array::forcecast> inputs,
+                                     const std::vector<std::string> &targets,
+                                     const std::vector<std::string> &input_ids) {
+        if (inputs.ndim() != 2) {
+            throw std::invalid_argument("inputs must be a 2D array (episodes x inputs)");
+        }
+        const size_t n = static_cast<size_t>(inputs.shape(0));
+        const size_t f = static_cast<size_t>(inputs.shape(1));
+        if (targets.size() != n) {
+            throw std::invalid_argument("targets must have one entry per input row");
+        }
+        if (input_ids.size() != f) {
+            throw std::invalid_argument("input_ids must have one entry per input column");
+        }
+        auto x = inputs.unchecked<2>();
+        std::vector<Trainer::EpisodeData> episodes(n);
+        {
+            py::gil_scoped_release release;
+            for (size_t i = 0; i < n; ++i) {
+                for (size_t j = 0; j < f; ++j) {
+                    episodes[i].seq.addEvent(0, input_ids[j], x(i, j));
+                }
+                episodes[i].target_id = targets[i];
+            }
+        }
+        return episodes;
+    },
+    py::arg("inputs"), py::arg("targets"), py::arg("input_ids"),
+    "Build single-timestep episodes from an (N, F) input array (GIL released)");
+    
+    // Bulk episode construction from existing sequences (each one is copied,
+    // as assigning EpisodeData.seq does)
+    m.def("make_episodes", [](py::iterable sequences, const std::vector<std::string> &targets) {
+        // Copy each sequence while its item is alive (it may come from a generator)
+        std::vector<Trainer::EpisodeData> episodes;
+        episodes.reserve(targets.size());
+        for (auto item : sequences) {
+            if (episodes.size() == targets.size()) {
+                throw std::invalid_argument("sequences and targets must have the same length");
+            }
+            episodes.emplace_back();
+            episodes.back().seq = item.cast<InputSequence&>();
+            episodes.back().target_id = targets[episodes.size() - 1];
+        }
+        if (episodes.size() != targets.size()) {
+            throw std::invalid_argument("sequences and targets must have the same length");
+        }
+        return episodes;
+    },
+    py::arg("sequences"), py::arg("targets"),
+    "Build one episode per (sequence, target) pair in a single call");
+    
     // Trainer class
     py::class_<Trainer, std::shared_ptr<Trainer>>(m, "Trainer",
         "Neural network trainer with gradient-based methods\n\n"
@@ -180,6 +317,16 @@ void bind_training(py::module &m) {
              py::call_guard<py::gil_scoped_release>(),
              "Evaluate network on single episode (GIL released)")
         
+        .def("evaluate_batch", &evaluate_batch<Trainer>,
+             py::arg("sequences"), py::arg("config"),
+             "Evaluate a list of sequences in one call (GIL released)")
+        
+        .def("evaluate_dataset", &evaluate_dataset<Trainer>,
+             py::arg("episodes"), py::arg("config"),
+             "Evaluate labelled episodes in one call (GIL released)\n\n"
+             "Returns:\n"
+             "    tuple: (metrics, correct, margins) with bool/float32 NumPy arrays")
+        
         .def("train_batch", [](Trainer &self, 
                                 const std::vector<Trainer::EpisodeData> &batch,
                                 const TrainingConfig &config) {
@@ -196,12 +343,24 @@ void bind_training(py::module &m) {
              "Note: This releases the GIL for the duration of training.\n"
              "For Python callbacks, use the Python wrapper in glia.trainer")
         
+        .def("train_epochs", &train_epochs<Trainer>,
+             py::arg("dataset"), py::arg("epochs"), py::arg("config"),
+             py::arg("on_epoch_begin") = py::none(), py::arg("on_epoch_end") = py::none(),
+             "Train epoch by epoch in one call, invoking Python callbacks at epoch\n"
+             "boundaries (GIL released while training)")
+        
         .def("get_epoch_acc_history", &Trainer::getEpochAccHistory,
              "Get accuracy history over epochs")
         
         .def("get_epoch_margin_history", &Trainer::getEpochMarginHistory,
              "Get margin history over epochs")
         
+        .def("get_epoch_count", &Trainer::getEpochCount,
+             "Get number of epochs recorded in the history")
+        
+        .def("get_last_epoch_metrics", &last_epoch_metrics<Trainer>,
+             "Get (accuracy, margin) of the latest epoch, or None before the first")
+        
         .def("revert_checkpoint", &Trainer::revertCheckpoint,
              "Revert to last checkpoint (if checkpointing enabled)")
         
@@ -235,6 +394,16 @@ void bind_training(py::module &m) {
              py::call_guard<py::gil_scoped_release>(),
              "Evaluate network on single episode (GIL released)")
         
+        .def("evaluate_batch", &evaluate_batch<RateGDTrainer>,
+             py::arg("sequences"), py::arg("config"),
+             "Evaluate a list of sequences in one call (GIL released)")
+        
+        .def("evaluate_dataset", &evaluate_dataset<RateGDTrainer>,
+             py::arg("episodes"), py::arg("config"),
+             "Evaluate labelled episodes in one call (GIL released)\n\n"
+             "Returns:\n"
+             "    tuple: (metrics, correct, margins) with bool/float32 NumPy arrays")
+        
         .def("train_batch", [](RateGDTrainer &self, 
                                 const std::vector<Trainer::EpisodeData> &batch,
                                 const TrainingConfig &config) {
@@ -249,12 +418,24 @@ void bind_training(py::module &m) {
              py::call_guard<py::gil_scoped_release>(),
              "Train for multiple epochs (GIL released)")
         
+        .def("train_epochs", &train_epochs<RateGDTrainer>,
+             py::arg("dataset"), py::arg("epochs"), py::arg("config"),
+             py::arg("on_epoch_begin") = py::none(), py::arg("on_epoch_end") = py::none(),
+             "Train epoch by epoch in one call, invoking Python callbacks at epoch\n"
+             "boundaries (GIL released while training)")
+        
         .def("get_epoch_acc_history", &RateGDTrainer::getEpochAccHistory,
              "Get accuracy history over epochs")
         
         .def("get_epoch_margin_history", &RateGDTrainer::getEpochMarginHistory,
              "Get margin history over epochs")
         
+        .def("get_epoch_count", &RateGDTrainer::getEpochCount,
+             "Get number of epochs recorded in the history")
+        
+        .def("get_last_epoch_metrics", &last_epoch_metrics<RateGDTrainer>,
+             "Get (accuracy, margin) of the latest epoch, or None before the first")
+        
         .def("__repr__", [](const RateGDTrainer &t) {
             return "<RateGDTrainer (gradient-based)>";
         });
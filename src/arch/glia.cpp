@@ -6,6 +6,7 @@
 #include <sstream>
 #include <random>
 #include <cmath>
+#include <unordered_map>
 
 
 Glia::Glia()
@@ -239,7 +240,7 @@ void Glia::configureNetworkFromFile(std::string filepath, bool verbose)
     }
 }
 
-void Glia::saveNetworkToFile(std::string filepath)
+void Glia::saveNetworkToFile(std::string filepath, bool verbose)
 {
 	std::ofstream file(filepath);
 	if (!file.is_open())
@@ -290,7 +291,10 @@ void Glia::saveNetworkToFile(std::string filepath)
 	}
 
 	file.close();
-	std::cout << "Network saved to " << filepath << std::endl;
+	if (verbose)
+	{
+		std::cout << "Network saved to " << filepath << std::endl;
+	}
 }
 
 void Glia::printNetwork()
@@ -359,6 +363,15 @@ void Glia::injectSensory(const std::string &id, float amt)
 	}
 }
 
+void Glia::injectSensoryOrdered(const float *amts)
+{
+	// sensory_mapping iterates in the same (sorted) order as getSensoryNeuronIDs()
+	for (const auto &kv : sensory_mapping)
+	{
+		kv.second->receive(*amts++);
+	}
+}
+
 // access neuron by ID (for configuration)
 std::shared_ptr<Neuron> Glia::getNeuronById(const std::string &id)
 {
@@ -406,6 +419,26 @@ std::vector<std::string> Glia::getAllNeuronIDs() const
 	return ids;
 }
 
+void Glia::getValues(float *out) const
+{
+	for (const auto &n : sensory_neurons) {
+		*out++ = n->getValue();
+	}
+	for (const auto &n : neurons) {
+		*out++ = n->getValue();
+	}
+}
+
+void Glia::getFiringMask(bool *out) const
+{
+	for (const auto &n : sensory_neurons) {
+		*out++ = n->didFire();
+	}
+	for (const auto &n : neurons) {
+		*out++ = n->didFire();
+	}
+}
+
 void Glia::getState(std::vector<std::string> &ids,
                     std::vector<float> &values,
                     std::vector<float> &thresholds,
@@ -487,6 +520,42 @@ void Glia::getWeights(std::vector<std::string> &from_ids,
 	}
 }
 
+void Glia::getWeightsByIndex(std::vector<int> &from_idx,
+                             std::vector<int> &to_idx,
+                             std::vector<float> &weights) const
+{
+	from_idx.clear();
+	to_idx.clear();
+	weights.clear();
+	
+	int total_conns = getConnectionCount();
+	from_idx.reserve(total_conns);
+	to_idx.reserve(total_conns);
+	weights.reserve(total_conns);
+	
+	// Neuron -> position in getAllNeuronIDs() order (sensory first)
+	std::unordered_map<const Neuron *, int> index;
+	index.reserve(sensory_neurons.size() + neurons.size());
+	int i = 0;
+	for (const auto &n : sensory_neurons) index[n.get()] = i++;
+	for (const auto &n : neurons) index[n.get()] = i++;
+	
+	i = 0;
+	auto collect = [&](const std::shared_ptr<Neuron> &src) {
+		for (const auto &kv : src->getConnections()) {
+			auto it = index.find(kv.second.second.get());
+			if (it != index.end()) {
+				from_idx.push_back(i);
+				to_idx.push_back(it->second);
+				weights.push_back(kv.second.first);
+			}
+		}
+		++i;
+	};
+	for (const auto &src : sensory_neurons) collect(src);
+	for (const auto &src : neurons) collect(src);
+}
+
 void Glia::setWeights(const std::vector<std::string> &from_ids,
                       const std::vector<std::string> &to_ids,
                       const std::vector<float> &weights)
@@ -513,6 +582,36 @@ void Glia::setWeights(const std::vector<std::string> &from_ids,
 	}
 }
 
+void Glia::setWeightsByIndex(const int *from_idx,
+                             const int *to_idx,
+                             const float *weights,
+                             size_t n)
+{
+	const int n_sensory = static_cast<int>(sensory_neurons.size());
+	const int n_total = getNeuronCount();
+	auto at = [&](int i) -> const std::shared_ptr<Neuron> & {
+		return i < n_sensory ? sensory_neurons[i] : neurons[i - n_sensory];
+	};
+	
+	for (size_t i = 0; i < n; ++i) {
+		const int f = from_idx[i];
+		const int t = to_idx[i];
+		if (f < 0 || f >= n_total || t < 0 || t >= n_total) {
+			continue;
+		}
+		const auto &from = at(f);
+		const auto &to = at(t);
+		const auto &conns = from->getConnections();
+		if (conns.find(to->getId()) != conns.end()) {
+			// Connection exists, update weight
+			from->setTransmitter(to->getId(), weights[i]);
+		} else {
+			// Create new connection
+			from->addConnection(weights[i], to);
+		}
+	}
+}
+
 int Glia::getConnectionCount() const
 {
 	int count = 0;
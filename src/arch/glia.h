@@ -25,7 +25,7 @@ public:
     // file handling to load/save networks
     // verbose: if true (default), prints creation/loading info
     void configureNetworkFromFile(std::string filepath, bool verbose = true);
-	void saveNetworkToFile(std::string filepath);
+	void saveNetworkToFile(std::string filepath, bool verbose = true);
 
 	// debug printing
 	void printNetwork();
@@ -43,6 +43,12 @@ public:
 	// apply "stimuli" to sensory neurons
 	void injectSensory(const std::string &id, float amt);
 
+	/**
+	 * @brief Inject one amount per sensory neuron, in getSensoryNeuronIDs() order
+	 * @param amts Buffer of getSensoryNeuronIDs().size() floats
+	 */
+	void injectSensoryOrdered(const float *amts);
+
 	// access neuron by ID (for configuration)
 	std::shared_ptr<Neuron> getNeuronById(const std::string &id);
 	
@@ -69,6 +75,18 @@ public:
 	              std::vector<float> &thresholds,
 	              std::vector<float> &leaks) const;
 	
+	/**
+	 * @brief Copy current voltage values into a caller-provided buffer
+	 * @param out Output buffer of getNeuronCount() floats (same order as getAllNeuronIDs())
+	 */
+	void getValues(float *out) const;
+	
+	/**
+	 * @brief Copy last-step fire flags into a caller-provided buffer
+	 * @param out Output buffer of getNeuronCount() bools (same order as getAllNeuronIDs())
+	 */
+	void getFiringMask(bool *out) const;
+	
 	/**
 	 * @brief Set neuron parameters from flat arrays
 	 * @param ids Neuron IDs to update
@@ -89,6 +107,16 @@ public:
 	                std::vector<std::string> &to_ids,
 	                std::vector<float> &weights) const;
 	
+	/**
+	 * @brief Get all synaptic weights as an index edge list (COO sparse format)
+	 * @param from_idx Output: source indices into getAllNeuronIDs() order
+	 * @param to_idx Output: target indices into getAllNeuronIDs() order
+	 * @param weights Output: synaptic weights
+	 */
+	void getWeightsByIndex(std::vector<int> &from_idx,
+	                       std::vector<int> &to_idx,
+	                       std::vector<float> &weights) const;
+	
 	/**
 	 * @brief Set synaptic weights from edge list
 	 * @param from_ids Source neuron IDs
@@ -100,12 +128,31 @@ public:
 	                const std::vector<std::string> &to_ids,
 	                const std::vector<float> &weights);
 	
+	/**
+	 * @brief Set synaptic weights from an edge list of neuron indices
+	 * @param from_idx Source indices into getAllNeuronIDs() order
+	 * @param to_idx Target indices into getAllNeuronIDs() order
+	 * @param weights New weight values
+	 * @param n Number of edges
+	 * @note Creates connections if they don't exist; out-of-range indices are skipped
+	 */
+	void setWeightsByIndex(const int *from_idx,
+	                       const int *to_idx,
+	                       const float *weights,
+	                       size_t n);
+	
 	/**
 	 * @brief Get total neuron count
 	 * @return Total number of neurons (sensory + internal)
 	 */
 	int getNeuronCount() const { return static_cast<int>(sensory_neurons.size() + neurons.size()); }
 	
+	/**
+	 * @brief Get sensory neuron count
+	 * @return Number of sensory neurons (length expected by injectSensoryOrdered())
+	 */
+	int getSensoryCount() const { return static_cast<int>(sensory_mapping.size()); }
+	
 	/**
 	 * @brief Get total connection count
 	 * @return Total number of synaptic connections
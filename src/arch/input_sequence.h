@@ -41,6 +41,24 @@ public:
         event->inputs[neuron_id] = value;
     }
     
+    // Append `count` ticks after the current last one; tick k sets
+    // neuron_ids[j] = values[k * neuron_ids.size() + j]. The ticks are new,
+    // so events are pushed directly instead of searched for as in addEvent.
+    void appendTimesteps(const std::vector<std::string>& neuron_ids,
+                         const float* values, size_t count) {
+        const size_t n = neuron_ids.size();
+        if (n == 0) return;  // like an empty add_timestep: no tick is created
+        int tick = isEmpty() ? 0 : (getMaxTick() + 1);
+        events.reserve(events.size() + count);
+        for (size_t k = 0; k < count; ++k, ++tick) {
+            events.push_back(InputEvent(tick));
+            std::map<std::string, float>& inputs = events.back().inputs;
+            for (size_t j = 0; j < n; ++j) {
+                inputs[neuron_ids[j]] = values[k * n + j];
+            }
+        }
+    }
+    
     // Get inputs for the current tick
     std::map<std::string, float> getCurrentInputs() const {
         for (const auto& event : events) {
@@ -2,7 +2,41 @@
 
 #include <algorithm>
 #include <cmath>
+#include <cstdint>
+#include <exception>
 #include <iostream>
+#include <thread>
+#include <unordered_map>
+
+namespace {
+// FNV-1a over a genome's ids and values (order-sensitive, which only costs
+// cache misses when two equal genomes list their records differently)
+uint64_t fnv1a(uint64_t h, const void *data, size_t n) {
+    const unsigned char *p = static_cast<const unsigned char*>(data);
+    for (size_t i = 0; i < n; ++i) { h ^= p[i]; h *= 1099511628211ull; }
+    return h;
+}
+
+template <typename T>
+uint64_t fnv1a(uint64_t h, const std::vector<T> &v) {
+    return fnv1a(h, v.data(), v.size() * sizeof(T));
+}
+
+uint64_t hashGenome(const EvolutionEngine::NetSnapshot &s) {
+    uint64_t h = 14695981039346656037ull;
+    for (const auto &id : s.ids) h = fnv1a(h, id.c_str(), id.size() + 1);
+    h = fnv1a(h, s.thr);
+    h = fnv1a(h, s.leak);
+    h = fnv1a(h, s.from);
+    h = fnv1a(h, s.to);
+    return fnv1a(h, s.w);
+}
+
+bool sameGenome(const EvolutionEngine::NetSnapshot &a, const EvolutionEngine::NetSnapshot &b) {
+    return a.thr == b.thr && a.leak == b.leak && a.w == b.w
+        && a.from == b.from && a.to == b.to && a.ids == b.ids;
+}
+}  // namespace
 
 EvolutionEngine::EvolutionEngine(const std::string &net_path,
                                  const std::vector<Trainer::EpisodeData> &train_set,
@@ -23,36 +57,27 @@ int EvolutionEngine::countEdges(Glia &net) const {
     return cnt;
 }
 
-void EvolutionEngine::applyMutation(Glia &net) {
+void EvolutionEngine::mutateGenome(NetSnapshot &g) {
+    // Gaussian jitter applied column-wise; draw order (edges, then thresholds,
+    // then leaks, each in capture order) matches mutating a live net
     if (evo_cfg.sigma_w > 0.0f) {
         std::normal_distribution<float> nd(0.0f, evo_cfg.sigma_w);
-        net.forEachNeuron([&](Neuron &from){
-            const auto &conns = from.getConnections();
-            for (const auto &kv : conns) {
-                float w = kv.second.first + nd(rng);
-                from.setTransmitter(kv.first, w);
-            }
-        });
+        for (float &w : g.w) w += nd(rng);
     }
     if (evo_cfg.sigma_thr > 0.0f) {
         std::normal_distribution<float> nd(0.0f, evo_cfg.sigma_thr);
-        net.forEachNeuron([&](Neuron &n){ n.setThreshold(n.getThreshold() + nd(rng)); });
+        for (float &t : g.thr) t += nd(rng);
     }
     if (evo_cfg.sigma_leak > 0.0f) {
         std::normal_distribution<float> nd(0.0f, evo_cfg.sigma_leak);
-        net.forEachNeuron([&](Neuron &n){
-            float v = n.getLeak() + nd(rng);
-            if (v < 0.0f) v = 0.0f;
-            if (v > 1.0f) v = 1.0f;
-            n.setLeak(v);
-        });
+        for (float &l : g.leak) l = std::min(1.0f, std::max(0.0f, l + nd(rng)));
     }
 }
 
-EvoMetrics EvolutionEngine::evaluate(Trainer &tr, Glia &net) {
+EvoMetrics EvolutionEngine::evaluate(Trainer &tr, Glia &net, const std::vector<Trainer::EpisodeData> &val) {
     // Accuracy + avg margin on validation set
     size_t total = 0, correct = 0; double sum_margin = 0.0;
-    for (const auto &ex : val_set) {
+    for (const auto &ex : val) {
         EpisodeMetrics m = tr.evaluate(const_cast<InputSequence&>(ex.seq), train_cfg);
         total += 1;
         if (m.winner_id == ex.target_id) correct += 1;
@@ -66,6 +91,16 @@ EvoMetrics EvolutionEngine::evaluate(Trainer &tr, Glia &net) {
     return em;
 }
 
+void EvolutionEngine::evaluateIndividual(Individual &ind, int gen, int i, const std::vector<Trainer::EpisodeData> &val) {
+    // Fresh net + trainer seeded by (gen, i): the result does not depend on evaluation order
+    Glia net; net.configureNetworkFromFile(net_path, /*verbose=*/false);
+    Trainer tr(net); tr.reseed(evo_cfg.seed + gen * 1000 + i);
+    restoreNet(net, ind.genome);
+    if (!train_set.empty() && evo_cfg.train_epochs > 0) tr.trainEpoch(train_set, evo_cfg.train_epochs, train_cfg);
+    ind.m = evaluate(tr, net, val);
+    if (evo_cfg.lamarckian) ind.genome = captureNet(net);
+}
+
 double EvolutionEngine::mapFitness(const EvoMetrics &m) const {
     if (cbs.fitness_fn) return cbs.fitness_fn(m, base_edges);
     double edge_norm = static_cast<double>(m.edges) / static_cast<double>(base_edges);
@@ -79,6 +114,8 @@ EvolutionEngine::Result EvolutionEngine::run() {
     std::vector<Individual> pop;
     const int P = std::max(1, evo_cfg.population);
     pop.resize(P);
+    int W = evo_cfg.workers > 0 ? evo_cfg.workers : static_cast<int>(std::thread::hardware_concurrency());
+    W = std::min(std::max(1, W), P);
 
     // Preamble: configuration summary
     std::cout << "Evolution start\n"
@@ -91,11 +128,12 @@ EvolutionEngine::Result EvolutionEngine::run() {
               << "  seed=" << evo_cfg.seed
               << "\n  fitness_weights(acc,margin,sparsity)=(" << evo_cfg.w_acc << "," << evo_cfg.w_margin << "," << evo_cfg.w_sparsity << ")"
               << "  lamarckian=" << (evo_cfg.lamarckian ? "1" : "0")
+              << "  workers=" << W
               << "\n";
     for (int i = 0; i < P; ++i) {
         Glia net; net.configureNetworkFromFile(net_path, /*verbose=*/false);
-        if (i != 0) applyMutation(net);
         pop[i].genome = captureNet(net);
+        if (i != 0) mutateGenome(pop[i].genome);
         pop[i].m.edges = countEdges(net);
         // lineage seed node
         LineageNode node; node.id = next_node_id++; node.parent_id = -1; node.gen = 0; // metrics filled after eval
@@ -106,15 +144,55 @@ EvolutionEngine::Result EvolutionEngine::run() {
     Result res;
     double prev_best = -1e9;
 
+    // Worker state lives for the whole run: every extra worker gets its own
+    // validation copy once (evaluation advances the sequences' read cursors),
+    // instead of re-copying the set each generation. Worker 0 uses val_set.
+    std::vector<std::vector<Trainer::EpisodeData>> worker_val(W - 1, val_set);
+
+    // Fitness cache: without inner training an individual's metrics depend
+    // only on its genome, so genomes scored last generation (elites, or clones
+    // when all sigmas are 0) are not re-evaluated. Only the previous
+    // generation is kept; hash hits are confirmed by comparing genomes.
+    const bool cache_fitness = train_set.empty() || evo_cfg.train_epochs <= 0;
+    std::vector<Individual> prev_pop;
+    std::unordered_multimap<uint64_t, int> prev_index; // genome hash -> prev_pop index
+
     for (int gen = 0; gen < std::max(1, evo_cfg.generations); ++gen) {
-        // Evaluate (with inner training)
+        // Evaluate (with inner training). Individuals are independent, so
+        // workers take a strided share of the cache misses.
+        std::vector<int> todo;
+        todo.reserve(P);
+        for (int i = 0; i < P; ++i) {
+            bool hit = false;
+            if (cache_fitness) {
+                auto range = prev_index.equal_range(hashGenome(pop[i].genome));
+                for (auto it = range.first; it != range.second && !hit; ++it) {
+                    const Individual &prev = prev_pop[it->second];
+                    if (sameGenome(prev.genome, pop[i].genome)) { pop[i].m = prev.m; hit = true; }
+                }
+            }
+            if (!hit) todo.push_back(i);
+        }
+        const int T = static_cast<int>(todo.size());
+        if (W <= 1) {
+            for (int k = 0; k < T; ++k) evaluateIndividual(pop[todo[k]], gen, todo[k], val_set);
+        } else {
+            std::vector<std::exception_ptr> errors(W);
+            auto work = [&](int first) {
+                try {
+                    const auto &val = (first == 0) ? val_set : worker_val[first - 1];
+                    for (int k = first; k < T; k += W) evaluateIndividual(pop[todo[k]], gen, todo[k], val);
+                } catch (...) {
+                    errors[first] = std::current_exception();
+                }
+            };
+            std::vector<std::thread> threads;
+            for (int t = 1; t < W; ++t) threads.emplace_back(work, t);
+            work(0);
+            for (auto &t : threads) t.join();
+            for (auto &e : errors) if (e) std::rethrow_exception(e);
+        }
         for (int i = 0; i < P; ++i) {
-            Glia net; net.configureNetworkFromFile(net_path, /*verbose=*/false);
-            Trainer tr(net); tr.reseed(evo_cfg.seed + gen * 1000 + i);
-            restoreNet(net, pop[i].genome);
-            if (!train_set.empty() && evo_cfg.train_epochs > 0) tr.trainEpoch(train_set, evo_cfg.train_epochs, train_cfg);
-            pop[i].m = evaluate(tr, net);
-            if (evo_cfg.lamarckian) pop[i].genome = captureNet(net);
             // update lineage metrics
             auto it = id_to_index.find(pop[i].node_id);
             if (it != id_to_index.end()) lineage[it->second].m = pop[i].m, lineage[it->second].gen = gen;
@@ -174,13 +252,16 @@ EvolutionEngine::Result EvolutionEngine::run() {
         std::uniform_int_distribution<int> dist_parent(0, R - 1);
         while ((int)next.size() < P) {
             const Individual &parent = pop[dist_parent(rng)];
-            Glia net; net.configureNetworkFromFile(net_path, /*verbose=*/false);
-            Trainer tr(net); (void)tr; restoreNet(net, parent.genome);
-            applyMutation(net);
-            Individual child; child.genome = captureNet(net); child.m = {}; child.node_id = next_node_id++;
+            // Mutate the parent's columns directly: no net load/restore/capture per child
+            Individual child; child.genome = parent.genome; mutateGenome(child.genome); child.m = {}; child.node_id = next_node_id++;
             LineageNode node; node.id = child.node_id; node.parent_id = parent.node_id; node.gen = gen + 1; lineage.push_back(node); id_to_index[node.id] = (int)lineage.size() - 1;
             next.push_back(std::move(child));
         }
+        if (cache_fitness) {
+            prev_index.clear();
+            for (int i = 0; i < P; ++i) prev_index.emplace(hashGenome(pop[i].genome), i);
+            prev_pop.swap(pop);
+        }
         pop.swap(next);
     }
 
@@ -191,46 +272,69 @@ EvolutionEngine::Result EvolutionEngine::run() {
 
 EvolutionEngine::NetSnapshot EvolutionEngine::captureNet(Glia &net) const {
     NetSnapshot s;
+    std::unordered_map<std::string, int> index;
     net.forEachNeuron([&](Neuron &n){
-        NeuronRec r{n.getId(), n.getThreshold(), n.getLeak()};
-        s.neurons.push_back(r);
+        index.emplace(n.getId(), static_cast<int>(s.ids.size()));
+        s.ids.push_back(n.getId());
+        s.thr.push_back(n.getThreshold());
+        s.leak.push_back(n.getLeak());
     });
+    int fi = 0;
     net.forEachNeuron([&](Neuron &from){
-        const auto &conns = from.getConnections();
-        for (const auto &kv : conns) s.edges.push_back(EdgeRec{from.getId(), kv.first, kv.second.first});
+        for (const auto &kv : from.getConnections()) {
+            auto it = index.find(kv.first);
+            if (it == index.end()) continue;
+            s.from.push_back(fi);
+            s.to.push_back(it->second);
+            s.w.push_back(kv.second.first);
+        }
+        ++fi;
     });
     return s;
 }
 
 void EvolutionEngine::restoreNet(Glia &net, const NetSnapshot &s) const {
-    // Build edge set for quick lookup
-    std::unordered_map<std::string, std::unordered_map<std::string,float>> edge_set;
-    for (const auto &e : s.edges) edge_set[e.from][e.to] = e.w;
-    // Remove edges not present
+    const int N = static_cast<int>(s.ids.size());
+    std::unordered_map<std::string, int> index;
+    std::vector<std::shared_ptr<Neuron>> nodes(N);
+    for (int i = 0; i < N; ++i) {
+        index.emplace(s.ids[i], i);
+        nodes[i] = net.getNeuronById(s.ids[i]);
+    }
+    // Group edges by source (captured grouped already; keep snapshot order)
+    std::vector<std::vector<int>> out_edges(N);
+    for (size_t e = 0; e < s.w.size(); ++e) out_edges[s.from[e]].push_back(static_cast<int>(e));
+    // Remove edges not present: stamp[t] == source marks kept targets
+    std::vector<int> stamp(N, -1);
     net.forEachNeuron([&](Neuron &from){
+        auto src = index.find(from.getId());
+        const int i = (src == index.end()) ? -1 : src->second;
+        if (i >= 0) for (int e : out_edges[i]) stamp[s.to[e]] = i;
         std::vector<std::string> to_remove;
-        const auto &conns = from.getConnections();
-        for (const auto &kv : conns) {
-            auto itf = edge_set.find(from.getId());
-            if (itf == edge_set.end() || itf->second.find(kv.first) == itf->second.end()) to_remove.push_back(kv.first);
+        for (const auto &kv : from.getConnections()) {
+            auto dst = index.find(kv.first);
+            if (i < 0 || dst == index.end() || stamp[dst->second] != i) to_remove.push_back(kv.first);
         }
         for (const auto &tid : to_remove) from.removeConnection(tid);
     });
     // Restore/add edges
-    for (const auto &e : s.edges) {
-        auto from = net.getNeuronById(e.from);
-        auto to = net.getNeuronById(e.to);
-        if (!from || !to) continue;
-        const auto &conns = from->getConnections();
-        if (conns.find(e.to) == conns.end()) from->addConnection(e.w, to);
-        else from->setTransmitter(e.to, e.w);
+    for (int i = 0; i < N; ++i) {
+        const auto &from = nodes[i];
+        if (!from) continue;
+        for (int e : out_edges[i]) {
+            const auto &to = nodes[s.to[e]];
+            if (!to) continue;
+            const std::string &tid = s.ids[s.to[e]];
+            const auto &conns = from->getConnections();
+            if (conns.find(tid) == conns.end()) from->addConnection(s.w[e], to);
+            else from->setTransmitter(tid, s.w[e]);
+        }
     }
     // Restore neuron params
-    for (const auto &r : s.neurons) {
-        auto n = net.getNeuronById(r.id);
-        if (!n) continue;
-        n->setThreshold(r.thr);
-        n->setLeak(r.leak);
+    for (int i = 0; i < N; ++i) {
+        if (!nodes[i]) continue;
+        nodes[i]->setThreshold(s.thr[i]);
+        nodes[i]->setLeak(s.leak[i]);
     }
 }
 
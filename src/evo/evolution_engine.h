@@ -26,9 +26,20 @@ struct EvoMetrics {
 
 class EvolutionEngine {
 public:
+    // Per-record views of a genome (Python NeuronRecord/EdgeRecord)
     struct EdgeRec { std::string from; std::string to; float w; };
     struct NeuronRec { std::string id; float thr; float leak; };
-    struct NetSnapshot { std::vector<NeuronRec> neurons; std::vector<EdgeRec> edges; };
+    // Genome as struct-of-arrays: neuron columns in forEachNeuron order
+    // (= getAllNeuronIDs()), edges as index pairs into ids
+    struct NetSnapshot {
+        std::vector<std::string> ids;
+        std::vector<float> thr, leak;
+        std::vector<int> from, to;
+        std::vector<float> w;
+        // Edges assigned from Python whose endpoints are not in ids yet;
+        // they join the columns once a neurons assignment provides them
+        std::vector<EdgeRec> pending;
+    };
     struct Config {
         int population = 8;
         int generations = 10;
@@ -54,6 +65,9 @@ public:
 
         // Optional: path to write lineage JSON (evolutionary tree)
         std::string lineage_json;   // if empty, skip writing
+
+        // Threads evaluating individuals in parallel (1 = serial, 0 = all cores)
+        int workers = 1;
     };
 
     struct Callbacks {
@@ -101,8 +115,9 @@ private:
     };
 
     int countEdges(Glia &net) const;
-    void applyMutation(Glia &net);
-    EvoMetrics evaluate(Trainer &tr, Glia &net);
+    void mutateGenome(NetSnapshot &g);
+    EvoMetrics evaluate(Trainer &tr, Glia &net, const std::vector<Trainer::EpisodeData> &val);
+    void evaluateIndividual(Individual &ind, int gen, int i, const std::vector<Trainer::EpisodeData> &val);
     double mapFitness(const EvoMetrics &m) const;
     NetSnapshot captureNet(Glia &net) const;
     void restoreNet(Glia &net, const NetSnapshot &s) const;
@@ -19,6 +19,14 @@ public:
     void reseed(unsigned int s) { rng.seed(s); }
     std::vector<double> getEpochAccHistory() const { return epoch_acc_hist; }
     std::vector<double> getEpochMarginHistory() const { return epoch_margin_hist; }
+    size_t getEpochCount() const { return epoch_acc_hist.size(); }
+    // Latest epoch's (accuracy, margin) without copying the histories; false before any epoch
+    bool getLastEpochMetrics(double &acc, double &margin) const {
+        if (epoch_acc_hist.empty()) return false;
+        acc = epoch_acc_hist.back();
+        margin = epoch_margin_hist.empty() ? 0.0 : epoch_margin_hist.back();
+        return true;
+    }
 
     EpisodeMetrics evaluate(InputSequence &seq, const TrainingConfig &cfg) {
         std::vector<std::string> output_ids = collectOutputIDs();
@@ -29,6 +29,14 @@ public:
     // Training history getters (copies)
     std::vector<double> getEpochAccHistory() const { return epoch_acc_hist; }
     std::vector<double> getEpochMarginHistory() const { return epoch_margin_hist; }
+    size_t getEpochCount() const { return epoch_acc_hist.size(); }
+    // Latest epoch's (accuracy, margin) without copying the histories; false before any epoch
+    bool getLastEpochMetrics(double &acc, double &margin) const {
+        if (epoch_acc_hist.empty()) return false;
+        acc = epoch_acc_hist.back();
+        margin = epoch_margin_hist.empty() ? 0.0 : epoch_margin_hist.back();
+        return true;
+    }
 
     // Evaluate a single episode using the provided input sequence and config.
     EpisodeMetrics evaluate(InputSequence &seq, const TrainingConfig &cfg) {
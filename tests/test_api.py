@@ -26,6 +26,10 @@ def test_network_wrapper():
     assert net.num_neurons == 5
     assert len(net.sensory_ids) == 2
     assert len(net.neuron_ids) == 5
+    # ID lists are copies of the cache, so callers can't corrupt it
+    net.neuron_ids.append('X')
+    net.sensory_ids.clear()
+    assert len(net.neuron_ids) == 5 and len(net.sensory_ids) == 2
     print(f"[OK] Properties work")
     
     # State access
@@ -35,6 +39,13 @@ def test_network_wrapper():
     assert isinstance(state['values'], np.ndarray)
     print(f"[OK] State property works")
     
+    # Values only, optionally into a preallocated row
+    history = np.zeros((2, net.num_neurons), dtype=np.float32)
+    net.get_values(out=history[1])
+    assert np.array_equal(history[1], net.get_state()[1])
+    assert np.array_equal(net.get_values(), history[1])
+    print(f"[OK] get_values(out=...) works")
+    
     # Inject dict
     net.inject_dict({"S0": 100.0, "S1": 50.0})
     print(f"[OK] inject_dict() works")
@@ -43,14 +54,67 @@ def test_network_wrapper():
     net.inject_array(np.array([120.0, 80.0]))
     print(f"[OK] inject_array() works")
     
+    # inject_array follows sensory_ids order, like per-id inject()
+    ordered = glia.Network(num_sensory=2, num_neurons=3)
+    by_id = glia.Network(num_sensory=2, num_neurons=3)
+    ordered.inject_array(np.array([30.0, 70.0]))
+    for nid, amount in zip(by_id.sensory_ids, [30.0, 70.0]):
+        by_id.inject(nid, amount)
+    assert np.array_equal(ordered.get_values(), by_id.get_values())
+    try:
+        ordered.inject_array(np.zeros(3))
+        assert False, "length mismatch should raise"
+    except ValueError:
+        pass
+    print(f"[OK] inject_array() matches per-id inject order")
+    
     # Multiple steps
     net.step(n_steps=10)
     print(f"[OK] step(n_steps) works")
     
+    # Batched step/inject match the per-call path
+    batched = glia.Network(num_sensory=2, num_neurons=3)
+    other = glia.Network(num_sensory=2, num_neurons=3)
+    batched.inject_dict({"S0": 90.0, "S1": 40.0})
+    batched.step(3)
+    other.inject("S0", 90.0)
+    other.inject("S1", 40.0)
+    for _ in range(3):
+        other.step()
+    assert np.array_equal(batched.get_values(), other.get_values())
+    print(f"[OK] Batched step/inject_dict match per-call path")
+    
     # Firing neurons
     firing = net.get_firing_neurons()
+    mask = net.get_firing_mask()
+    assert mask.dtype == np.bool_ and len(mask) == net.num_neurons
+    assert firing == [nid for nid, fired in zip(net.neuron_ids, mask) if fired]
+    assert firing == [nid for nid in net.neuron_ids if net.get_neuron(nid).did_fire()]
     print(f"[OK] get_firing_neurons(): {len(firing)} neurons fired")
     
+    # Index-based weights (indices follow neuron_ids order)
+    net.set_weights_by_index(np.array([0, 1]), np.array([2, 3]), np.array([1.5, 2.0]))
+    from_ids, to_ids, weights = net.get_weights()
+    edges = dict(zip(zip(from_ids, to_ids), weights.tolist()))
+    assert edges[("S0", "N0")] == 1.5 and edges[("S1", "N1")] == 2.0
+    net.set_weights_by_index([0], [2], [0.5])
+    assert net.num_connections == 2
+    # A bad index rejects the whole call
+    for bad in ([0, -1], [0, net.num_neurons]):
+        try:
+            net.set_weights_by_index(bad, [2, 3], [9.0, 9.0])
+            assert False, "out-of-range index accepted"
+        except ValueError:
+            pass
+    assert net.num_connections == 2 and 9.0 not in net.get_weights()[2].tolist()
+    print(f"[OK] set_weights_by_index() works")
+    
+    rows, cols, w = net.get_weights_by_index()
+    assert sorted(zip(rows.tolist(), cols.tolist(), w.tolist())) == [(0, 2, 0.5), (1, 3, 2.0)]
+    adj = net.to_adjacency_matrix(dense=True)
+    assert adj.shape == (5, 5) and adj[0, 2] == 0.5 and adj[1, 3] == 2.0 and adj.sum() == 2.5
+    print(f"[OK] get_weights_by_index() / to_adjacency_matrix() work")
+    
     return True
 
 
@@ -77,12 +141,120 @@ def test_trainer_wrapper():
     assert isinstance(history, dict)
     print(f"[OK] History property works")
     
+    # train() appends the latest epoch's metrics; they match the C++ history
+    assert trainer._cpp.get_last_epoch_metrics() is None
+    episodes = []
+    for i in range(4):
+        ep = glia.EpisodeData()
+        ep.seq = glia.InputSequence()
+        ep.seq.add_timestep({'S0': 50.0 * (i % 2), 'S1': 50.0})
+        ep.target_id = "N2"
+        episodes.append(ep)
+    history = trainer.train(episodes, epochs=2, verbose=False)
+    assert history['accuracy'] == list(trainer._cpp.get_epoch_acc_history())
+    assert history['margin'] == list(trainer._cpp.get_epoch_margin_history())
+    print(f"[OK] train() history matches get_last_epoch_metrics() per epoch")
+    
+    # history re-syncs only when the C++ epoch count moved
+    trainer._cpp.train_epoch(episodes, 1, trainer.config)
+    assert trainer._cpp.get_epoch_count() == 3
+    assert trainer.history['accuracy'] == list(trainer._cpp.get_epoch_acc_history())
+    assert trainer.history is trainer.history
+    print(f"[OK] history property syncs on new epochs")
+    
+    return True
+
+
+def test_trainer_evaluate_batch():
+    """Test batched evaluation matches per-episode evaluation"""
+    import glia
+    import numpy as np
+    
+    print("\n[Trainer evaluate_batch]")
+    
+    net = glia.Network(num_sensory=2, num_neurons=3)
+    trainer = glia.Trainer(net)
+    
+    seqs = []
+    for i in range(4):
+        seq = glia.InputSequence()
+        seq.add_timestep({'S0': 50.0 * (i % 2), 'S1': 50.0 * ((i + 1) % 2)})
+        seqs.append(seq)
+    
+    batch = trainer.evaluate_batch(seqs)
+    assert len(batch) == len(seqs)
+    single = [trainer.evaluate(seq) for seq in seqs]
+    for b, s in zip(batch, single):
+        assert b.winner_id == s.winner_id
+        assert abs(b.margin - s.margin) < 1e-6
+    print(f"[OK] evaluate_batch() matches evaluate() on {len(seqs)} episodes")
+    
+    # Generator input: each sequence must outlive the GIL-released loop
+    def fresh_seqs(n):
+        for i in range(n):
+            seq = glia.InputSequence()
+            seq.add_timestep({'S0': 50.0 * (i % 2), 'S1': 50.0 * ((i + 1) % 2)})
+            yield seq
+    from_gen = trainer.evaluate_batch(fresh_seqs(2000))
+    assert len(from_gen) == 2000
+    print(f"[OK] evaluate_batch() accepts a generator")
+    
+    # evaluate_dataset() scores in C++; compare against the per-episode path
+    episodes = []
+    for i, seq in enumerate(seqs):
+        ep = glia.EpisodeData()
+        ep.seq = seq
+        ep.target_id = f"N{i % 3}"
+        episodes.append(ep)
+    result = glia.Trainer(glia.Network(num_sensory=2, num_neurons=3)).evaluate_dataset(episodes)
+    ref = glia.Trainer(glia.Network(num_sensory=2, num_neurons=3)).evaluate_batch(seqs)
+    assert result['correct'] == sum(m.winner_id == ep.target_id for m, ep in zip(ref, episodes))
+    assert abs(result['margin'] - sum(m.margin for m in ref) / len(ref)) < 1e-6
+    assert [m.winner_id for m in result['episodes']] == [m.winner_id for m in ref]
+    print(f"[OK] evaluate_dataset() matches evaluate_batch() scoring")
+    
+    # Constant timesteps match repeated add_timestep()
+    a = glia.InputSequence()
+    a.add_constant_timesteps(3, {'S0': 60.0, 'S1': 20.0})
+    b = glia.InputSequence()
+    for _ in range(3):
+        b.add_timestep({'S0': 60.0, 'S1': 20.0})
+    ra, rb = trainer.evaluate(a), trainer.evaluate(b)
+    assert ra.winner_id == rb.winner_id and abs(ra.margin - rb.margin) < 1e-6
+    print(f"[OK] add_constant_timesteps() matches add_timestep()")
+    
+    # Array timesteps match one add_timestep() per row
+    values = np.array([[10.0, 0.0], [0.0, 50.0], [70.0, 30.0]], dtype=np.float32)
+    a = glia.create_sequence_from_array(values, ['S0', 'S1'])
+    b = glia.InputSequence()
+    for row in values:
+        b.add_timestep({'S0': float(row[0]), 'S1': float(row[1])})
+    for _ in range(4):
+        assert a.get_current_inputs() == b.get_current_inputs()
+        a.advance()
+        b.advance()
+    print(f"[OK] create_sequence_from_array() matches add_timestep()")
+    
+    # Explicit-tick events leave the ticks in between empty
+    seq = glia.InputSequence()
+    seq.add_event(0, 'S0', 10.0)
+    seq.add_event(3, 'S1', 20.0)
+    seq.set_loop(True)
+    assert seq.get_max_tick() == 3 and seq.is_looping()
+    seen = []
+    for _ in range(5):
+        seen.append(seq.get_current_inputs())
+        seq.advance()
+    assert seen == [{'S0': 10.0}, {}, {}, {'S1': 20.0}, {'S0': 10.0}]
+    print(f"[OK] add_event()/get_max_tick()/set_loop() work")
+    
     return True
 
 
 def test_dataset():
     """Test Dataset class"""
     import glia
+    import numpy as np
     
     print("\n[Dataset]")
     
@@ -124,6 +296,42 @@ def test_dataset():
     assert len(shuffled) == len(dataset)
     print(f"[OK] Shuffle works")
     
+    # Bulk construction from arrays
+    inputs = np.array([[1.0, 0.0], [0.0, 2.5], [3.0, 4.0]], dtype=np.float32)
+    arr_ds = glia.Dataset.from_arrays(inputs, ["O0", "O1", "O0"])
+    assert len(arr_ds) == 3
+    assert arr_ds[1].target_id == "O1"
+    assert arr_ds[2].seq.get_current_inputs() == {"S0": 3.0, "S1": 4.0}
+    print(f"[OK] from_arrays works")
+    
+    # Bulk construction from sequences copies each one into its episode
+    seqs = []
+    for i in range(3):
+        seq = glia.InputSequence()
+        seq.add_timestep({"S0": float(i)})
+        seqs.append(seq)
+    seq_ds = glia.Dataset.from_sequences(seqs, ["O0", "O1", "O2"])
+    assert [ep.target_id for ep in seq_ds] == ["O0", "O1", "O2"]
+    assert seq_ds[2].seq.get_current_inputs() == {"S0": 2.0}
+    seqs[0].add_timestep({"S1": 1.0})
+    seqs[0].advance()
+    assert seq_ds[0].seq.get_current_inputs() == {"S0": 0.0}
+    
+    # The bulk builder copies generator items before they are released
+    def fresh_seqs(n):
+        for i in range(n):
+            seq = glia.InputSequence()
+            seq.add_timestep({"S0": float(i)})
+            yield seq
+    gen_eps = glia._core.make_episodes(fresh_seqs(200), ["O0"] * 200)
+    assert len(gen_eps) == 200 and gen_eps[199].seq.get_current_inputs() == {"S0": 199.0}
+    try:
+        glia._core.make_episodes(fresh_seqs(3), ["O0"] * 2)
+        assert False, "length mismatch accepted"
+    except ValueError:
+        pass
+    print(f"[OK] from_sequences works")
+    
     return True
 
 
@@ -188,6 +396,32 @@ def test_file_io():
         if os.path.exists(temp_path):
             os.remove(temp_path)
     
+    # Batch .seq loading matches one load_from_file per file
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        seq_paths = []
+        for i in range(5):
+            seq_path = os.path.join(tmp_dir, f"ep{i}.seq")
+            with open(seq_path, 'w') as f:
+                f.write(f"DURATION 3\n0 S0 {i}.5\nEVENT 2 S1 {10 + i}\n")
+            seq_paths.append(seq_path)
+        batch = glia.load_sequence_files(seq_paths, num_threads=2)
+        assert len(batch) == len(seq_paths)
+        for seq_path, seq in zip(seq_paths, batch):
+            ref = glia.load_sequence_file(seq_path)
+            for _ in range(3):
+                assert seq.get_current_inputs() == ref.get_current_inputs()
+                seq.advance()
+                ref.advance()
+        print(f"[OK] load_sequence_files() matches load_sequence_file()")
+        
+        # A file that can't be opened is an error, not an empty sequence
+        try:
+            glia.load_sequence_files(seq_paths + [os.path.join(tmp_dir, "missing.seq")])
+            assert False, "missing .seq file loaded"
+        except RuntimeError:
+            pass
+        print(f"[OK] load_sequence_files() raises on a missing file")
+    
     return True
 
 
@@ -215,6 +449,54 @@ def test_evolution_wrapper():
     print(f"[OK] Evolution wrapper API exists")
     print(f"     (Actual run requires valid network file)")
     
+    # Threaded evaluation reproduces the serial run
+    import os
+    import tempfile
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "evo_base.net")
+        glia.Network(num_sensory=2, num_neurons=3).save(path, verbose=False)
+        runs = []
+        for workers in (1, 2):
+            cfg = glia.create_evo_config(population=3, generations=2, train_epochs=1, workers=workers)
+            assert cfg.workers == workers
+            result = glia.Evolution(path, episodes, episodes, train_cfg, cfg).run(verbose=False)
+            runs.append(list(result.best_fitness_hist))
+        assert runs[0] == runs[1]
+    print(f"[OK] EvolutionConfig.workers matches serial evaluation")
+    
+    # Snapshot column accessors match the per-record attributes
+    snap = glia.NetworkSnapshot()
+    neurons, edges = [], []
+    for i in range(3):
+        rec = glia.NeuronRecord()
+        rec.id, rec.thr, rec.leak = f"N{i}", 50.0 + i, 0.9
+        neurons.append(rec)
+        edge = glia.EdgeRecord()
+        setattr(edge, 'from', f"N{i}")
+        edge.to, edge.w = f"N{(i + 1) % 3}", 0.5 * i
+        edges.append(edge)
+    snap.neurons, snap.edges = neurons, edges
+    ids, thr, leak = snap.neuron_arrays()
+    assert ids == ["N0", "N1", "N2"] and thr.tolist() == [50.0, 51.0, 52.0]
+    from_ids, to_ids, w = snap.edge_arrays()
+    assert from_ids == ["N0", "N1", "N2"] and to_ids == ["N1", "N2", "N0"] and w.tolist() == [0.0, 0.5, 1.0]
+    from_idx, to_idx, w_idx = snap.edge_index_arrays()
+    assert from_idx.tolist() == [0, 1, 2] and to_idx.tolist() == [1, 2, 0] and w_idx.tolist() == w.tolist()
+    assert [(e.to, e.w) for e in snap.edges] == [("N1", 0.0), ("N2", 0.5), ("N0", 1.0)]
+    print(f"[OK] NetworkSnapshot neuron_arrays()/edge_arrays()/edge_index_arrays() work")
+    
+    # Assignment order doesn't matter: edges wait for their neurons
+    rev = glia.NetworkSnapshot()
+    rev.edges = edges
+    assert len(rev.edges) == 3 and len(rev.edge_arrays()[2]) == 0
+    rev.neurons = neurons[:2]
+    assert [(getattr(e, 'from'), e.to) for e in rev.edges] == [("N0", "N1"), ("N1", "N2"), ("N2", "N0")]
+    assert rev.edge_index_arrays()[0].tolist() == [0]
+    rev.neurons = neurons
+    assert [(e.to, e.w) for e in rev.edges] == [(e.to, e.w) for e in snap.edges]
+    assert rev.edge_index_arrays()[1].tolist() == to_idx.tolist()
+    print(f"[OK] NetworkSnapshot edges may be assigned before neurons")
+    
     return True
 
 
@@ -226,6 +508,7 @@ def main():
     tests = [
         ("Network Wrapper", test_network_wrapper),
         ("Trainer Wrapper", test_trainer_wrapper),
+        ("Trainer evaluate_batch", test_trainer_evaluate_batch),
         ("Dataset", test_dataset),
         ("Config Helpers", test_config_helpers),
         ("File I/O", test_file_io),
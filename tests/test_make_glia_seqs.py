@@ -0,0 +1,41 @@
+#!/usr/bin/env python
+"""
+Check that examples/make_glia_seqs.py's --jit poisson encoder matches the
+NumPy one statistically (skipped when numba is not installed)
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+pytest.importorskip("numba")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "examples"))
+import make_glia_seqs  # noqa: E402
+
+
+def _spike_counts(vals, T, max_rate, jit, seed=0):
+    ts, idxs, _ = make_glia_seqs.poisson_encode(vals, T, max_rate, 1.0,
+                                                np.random.default_rng(seed), jit=jit)
+    counts = np.zeros((T, vals.size))
+    np.add.at(counts, (ts, idxs), 1)
+    return counts
+
+
+@pytest.mark.parametrize("max_rate", [0.5, 2.0])
+def test_poisson_jit_matches_numpy(max_rate):
+    """Per-feature spike mean and variance agree for Bernoulli and Poisson rates"""
+    T = 20000
+    vals = np.linspace(0.0, 1.0, 16)
+    ref = _spike_counts(vals, T, max_rate, jit=False)
+    got = _spike_counts(vals, T, max_rate, jit=True)
+
+    lam = vals * max_rate
+    # Both paths draw Poisson (var lam) for every feature once a rate reaches 1,
+    # Bernoulli (var p(1-p)) otherwise
+    var = lam if lam.max() >= 1.0 else lam * (1.0 - lam)
+    tol = 6.0 * np.sqrt(2.0 * var / T) + 1e-12
+    assert np.all(np.abs(ref.mean(0) - got.mean(0)) <= tol)
+    assert np.allclose(ref.var(0), got.var(0), rtol=0.1, atol=1e-3)
+    print(f"[OK] jit and NumPy poisson encoders agree (max_rate={max_rate})")